@@ -23,7 +23,8 @@ Regression metrics:
 
 Classification metrics:
 - accuracy
-- per-class precision/recall/F1 (from sklearn's classification_report)
+- per-class precision/recall/F1 (classification_report layout, derived from
+  the confusion matrix)
 - confusion matrix
 
 Outputs:
@@ -31,7 +32,10 @@ Outputs:
 - Markdown report
 
 Implementation notes:
-- Uses scikit-learn for metrics (commonly available in DS environments).
+- Metrics are computed with numpy using scikit-learn's definitions, so the
+  script does not import scikit-learn at all.
+- Classification labels are integer-encoded once; the confusion matrix and all
+  per-class metrics are computed with numpy on those codes.
 - Inputs are simple CSVs to keep the tool beginner-friendly.
 
 CodeSentinel is SEAM Protected Software.
@@ -43,80 +47,214 @@ from __future__ import annotations
 
 import argparse
 import csv
+import io
+import itertools
 import json
 import math
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Sequence, Union
+
+import numpy as np
 
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def read_single_column_csv(path: Path, *, encoding: str = "utf-8", delimiter: str = ",") -> list[str]:
-    with path.open("r", encoding=encoding, newline="") as fh:
-        reader = csv.reader(fh, delimiter=delimiter)
-        rows = list(reader)
+def _looks_numeric(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_header_row(first: list[str], has_more: bool) -> bool:
+    # A single non-numeric cell followed by more rows is treated as a header.
+    return len(first) == 1 and has_more and not _looks_numeric(first[0].strip())
 
-    if not rows:
-        return []
 
-    # If header-like (non-numeric) in first row and more than one row, treat it as header.
-    # We keep it intentionally simple: if it has 1 cell and there are >1 rows, assume header.
-    start = 1 if len(rows[0]) == 1 and len(rows) > 1 else 0
+def read_single_column_csv(
+    path: Path,
+    *,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    dtype: Any = None,
+    max_rows: Optional[int] = None,
+) -> Union[list[str], np.ndarray]:
+    """Read the first column of a CSV.
 
-    out: list[str] = []
-    for r in rows[start:]:
-        if not r:
-            continue
-        out.append(r[0].strip())
-    return out
+    With ``dtype=None`` (the default) values are returned as stripped strings,
+    which is what classification labels need. Passing a numeric dtype (e.g.
+    ``np.float64``) parses the column in one C-level pass with ``np.loadtxt``
+    and returns a contiguous ndarray instead of a list of Python strings.
 
+    Rows are streamed; ``max_rows`` stops reading after that many values.
+    """
 
-def _to_float_list(values: list[str]) -> list[float]:
-    out: list[float] = []
+    if dtype is not None:
+        return _read_single_column_array(path, encoding=encoding, delimiter=delimiter, dtype=dtype, max_rows=max_rows)
+
+    with path.open("r", encoding=encoding, newline="") as fh:
+        reader = csv.reader(fh, delimiter=delimiter)
+        first = next(reader, None)
+        if first is None:
+            return []
+        second = next(reader, None)
+
+        head = [] if _is_header_row(first, second is not None) else [first]
+        if second is not None:
+            head.append(second)
+        values = (r[0].strip() for r in itertools.chain(head, reader) if r)
+        if max_rows is not None:
+            values = itertools.islice(values, max(0, max_rows))
+        return list(values)
+
+
+def _read_single_column_array(
+    path: Path, *, encoding: str, delimiter: str, dtype: Any, max_rows: Optional[int] = None
+) -> np.ndarray:
+    # Peek at the first two rows only, to apply the same header rule as the string path.
+    with path.open("r", encoding=encoding, newline="") as fh:
+        reader = csv.reader(fh, delimiter=delimiter)
+        first = next(reader, None)
+        second = next(reader, None)
+
+    if first is None:
+        return np.empty(0, dtype=dtype)
+    start = 1 if _is_header_row(first, second is not None) else 0
+
+    try:
+        return np.loadtxt(
+            path,
+            dtype=dtype,
+            delimiter=delimiter,
+            quotechar='"',
+            usecols=0,
+            skiprows=start,
+            max_rows=max_rows,
+            comments=None,
+            encoding=encoding,
+            ndmin=1,
+        )
+    except ValueError:
+        # Re-read through csv so a bad value reports its 1-based data row.
+        values = read_single_column_csv(path, encoding=encoding, delimiter=delimiter, max_rows=max_rows)
+        return _as_float_array(values).astype(dtype, copy=False)
+
+
+def _as_float_array(values: Union[Sequence[str], np.ndarray]) -> np.ndarray:
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except ValueError:
+        pass
     for i, s in enumerate(values, start=1):
         try:
-            out.append(float(s))
+            float(s)
         except Exception as e:
             raise ValueError(f"Could not parse float on row {i}: {s!r}") from e
-    return out
+    raise ValueError("Could not parse values as floats")
+
 
+def _r2_score(y_true: np.ndarray, err: np.ndarray) -> float:
+    if y_true.size < 2:
+        return float("nan")
+    ss_res = float(np.dot(err, err))
+    centered = y_true - y_true.mean()
+    ss_tot = float(np.dot(centered, centered))
+    if ss_tot == 0.0:
+        # sklearn's force_finite convention for constant targets.
+        return 1.0 if ss_res == 0.0 else 0.0
+    return 1.0 - ss_res / ss_tot
 
-def evaluate_regression(y_true: list[str], y_pred: list[str]) -> dict[str, Any]:
+
+def evaluate_regression(
+    y_true: Union[Sequence[str], np.ndarray],
+    y_pred: Union[Sequence[str], np.ndarray],
+) -> dict[str, Any]:
     if len(y_true) != len(y_pred):
         raise ValueError(f"Length mismatch: y_true={len(y_true)} y_pred={len(y_pred)}")
 
-    yt = _to_float_list(y_true)
-    yp = _to_float_list(y_pred)
-
-    # Import lazily to keep import-time side effects minimal.
-    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+    yt = _as_float_array(y_true)
+    yp = _as_float_array(y_pred)
 
-    mae = float(mean_absolute_error(yt, yp))
-    mse = float(mean_squared_error(yt, yp))
+    # Plain numpy reductions (same definitions as sklearn.metrics) so the CLI
+    # does not pay scikit-learn's import cost for four scalars.
+    err = yt - yp
+    mae = float(np.mean(np.abs(err))) if err.size else float("nan")
+    mse = float(np.mean(err * err)) if err.size else float("nan")
     rmse = float(math.sqrt(mse))
-    r2 = float(r2_score(yt, yp))
-
-    return {"n": len(yt), "mae": mae, "mse": mse, "rmse": rmse, "r2": r2}
+    r2 = _r2_score(yt, err)
+
+    return {"n": int(yt.size), "mae": mae, "mse": mse, "rmse": rmse, "r2": r2}
+
+
+def _report_from_confusion_matrix(cm: np.ndarray, labels: list[str]) -> dict[str, Any]:
+    """Build a ``classification_report(output_dict=True)``-shaped dict from ``cm``.
+
+    Rows of ``cm`` are true labels and columns predictions (sklearn layout).
+    Undefined ratios are reported as 0, matching ``zero_division=0``.
+    """
+
+    tp = np.diag(cm).astype(np.float64)
+    support = cm.sum(axis=1)
+    predicted = cm.sum(axis=0)
+    fp = predicted - tp
+    fn = support - tp
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(predicted > 0, tp / predicted, 0.0)
+        recall = np.where(support > 0, tp / support, 0.0)
+        f1_den = 2 * tp + fp + fn
+        f1 = np.where(f1_den > 0, 2 * tp / f1_den, 0.0)
+
+    report: dict[str, Any] = {}
+    for i, label in enumerate(labels):
+        report[str(label)] = {
+            "precision": float(precision[i]),
+            "recall": float(recall[i]),
+            "f1-score": float(f1[i]),
+            "support": int(support[i]),
+        }
+
+    total = int(support.sum())
+    report["accuracy"] = float(tp.sum() / total) if total else 0.0
+    report["macro avg"] = {
+        "precision": float(precision.mean()),
+        "recall": float(recall.mean()),
+        "f1-score": float(f1.mean()),
+        "support": total,
+    }
+    weights = support / total if total else np.zeros_like(tp)
+    report["weighted avg"] = {
+        "precision": float(precision @ weights),
+        "recall": float(recall @ weights),
+        "f1-score": float(f1 @ weights),
+        "support": total,
+    }
+    return report
 
 
 def evaluate_classification(y_true: list[str], y_pred: list[str]) -> dict[str, Any]:
     if len(y_true) != len(y_pred):
         raise ValueError(f"Length mismatch: y_true={len(y_true)} y_pred={len(y_pred)}")
 
-    from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
-
-    acc = float(accuracy_score(y_true, y_pred))
-    cm = confusion_matrix(y_true, y_pred)
-    labels = sorted(set(y_true) | set(y_pred))
+    n = len(y_true)
+    # Factorize both columns once; everything after this works on int32 codes.
+    uniq, codes = np.unique(np.asarray(list(y_true) + list(y_pred), dtype=str), return_inverse=True)
+    codes = codes.astype(np.int32)
+    k = len(uniq)
+    yt_i, yp_i = codes[:n], codes[n:]
 
-    report_dict = classification_report(y_true, y_pred, output_dict=True, zero_division=0)
+    # One contingency table; every other metric is derived from it.
+    cm = np.bincount(yt_i.astype(np.int64) * k + yp_i, minlength=k * k).reshape(k, k)
+    labels = uniq.tolist()
+    report_dict = _report_from_confusion_matrix(cm, labels)
 
     return {
-        "n": len(y_true),
-        "accuracy": acc,
+        "n": n,
+        "accuracy": report_dict["accuracy"],
         "labels": labels,
         "confusion_matrix": cm.tolist(),
         "classification_report": report_dict,
@@ -125,53 +263,46 @@ def evaluate_classification(y_true: list[str], y_pred: list[str]) -> dict[str, A
 
 def _render_markdown(report: dict) -> str:
     task = report.get("task")
-    lines: list[str] = []
-    lines.append("# Model Evaluation Report")
-    lines.append("")
-    lines.append(f"Generated: `{report.get('generated_at_utc', '')}`")
-    lines.append(f"Task: `{task}`")
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w("# Model Evaluation Report\n\n")
+    w(f"Generated: `{report.get('generated_at_utc', '')}`\n")
+    w(f"Task: `{task}`\n\n")
 
     metrics = report.get("metrics", {})
 
-    lines.append("## Metrics")
-    lines.append("")
+    w("## Metrics\n\n")
 
     if task == "regression":
         for k in ("n", "mae", "mse", "rmse", "r2"):
-            lines.append(f"- **{k}**: {metrics.get(k)}")
+            w(f"- **{k}**: {metrics.get(k)}\n")
 
     elif task == "classification":
-        lines.append(f"- **n**: {metrics.get('n')}")
-        lines.append(f"- **accuracy**: {metrics.get('accuracy')}")
-        lines.append("")
+        w(f"- **n**: {metrics.get('n')}\n")
+        w(f"- **accuracy**: {metrics.get('accuracy')}\n\n")
 
-        lines.append("## Confusion matrix")
-        lines.append("")
+        w("## Confusion matrix\n\n")
         labels = metrics.get("labels", [])
         cm = metrics.get("confusion_matrix", [])
 
         if labels and cm:
-            lines.append("| true\\pred | " + " | ".join(str(x) for x in labels) + " |")
-            lines.append("|---|" + "|".join(["---"] * len(labels)) + "|")
-            for i, row in enumerate(cm):
-                lines.append("| " + str(labels[i]) + " | " + " | ".join(str(x) for x in row) + " |")
+            str_labels = list(map(str, labels))
+            w("| true\\pred | " + " | ".join(str_labels) + " |\n")
+            w("|---|" + "|".join(["---"] * len(str_labels)) + "|\n")
+            for label, row in zip(str_labels, cm):
+                w("| " + label + " | " + " | ".join(map(str, row)) + " |\n")
 
-        lines.append("")
-        lines.append("## Classification report")
-        lines.append("")
-        lines.append("(From scikit-learn's `classification_report`)")
-        lines.append("")
+        w("\n## Classification report\n\n")
+        w("(Same layout as scikit-learn's `classification_report`)\n\n")
 
         cr = metrics.get("classification_report", {})
         # Render top-level scalar entries.
         for k, v in cr.items():
             if isinstance(v, dict):
                 continue
-            lines.append(f"- **{k}**: {v}")
+            w(f"- **{k}**: {v}\n")
 
-    lines.append("")
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def write_reports(report: dict, out_dir: Path, *, stem: str = "model_eval") -> dict[str, Path]:
@@ -195,6 +326,7 @@ def main(argv: Optional[list[str]] = None) -> int:
     parser.add_argument("--encoding", default="utf-8", help="Text encoding")
     parser.add_argument("--delimiter", default=",", help="CSV delimiter")
     parser.add_argument("--stem", default="model_eval", help="Output filename stem")
+    parser.add_argument("--max-rows", type=int, default=None, help="Only read the first N values of each input")
 
     args = parser.parse_args(argv)
 
@@ -202,8 +334,10 @@ def main(argv: Optional[list[str]] = None) -> int:
     y_pred_path = Path(args.y_pred).resolve()
     out_dir = Path(args.out).resolve()
 
-    y_true = read_single_column_csv(y_true_path, encoding=args.encoding, delimiter=args.delimiter)
-    y_pred = read_single_column_csv(y_pred_path, encoding=args.encoding, delimiter=args.delimiter)
+    # Regression values are parsed straight into float arrays; labels stay strings.
+    dtype = np.float64 if args.task == "regression" else None
+    y_true = read_single_column_csv(y_true_path, encoding=args.encoding, delimiter=args.delimiter, dtype=dtype, max_rows=args.max_rows)
+    y_pred = read_single_column_csv(y_pred_path, encoding=args.encoding, delimiter=args.delimiter, dtype=dtype, max_rows=args.max_rows)
 
     if args.task == "regression":
         metrics = evaluate_regression(y_true, y_pred)
@@ -5,53 +5,103 @@ Steps:
 2) Build dataset
 3) Train model
 4) Score records
+
+By default each stage is imported and its ``main(argv)`` is called in-process,
+so numpy/sklearn are loaded once for the whole demo. Pass ``--isolated`` to run
+every stage in a fresh interpreter instead.
 """
 
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import json
-import random
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional
+from types import ModuleType
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _dumps(obj: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+_FLUSH_BYTES = 1 << 16
 
 
 def _generate_jsonl(path: Path, n_normal: int, n_anomaly: int, seed: int) -> None:
-    rng = random.Random(seed)
+    rng = np.random.default_rng(seed)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        for i in range(n_normal):
+
+    # Draw every random column up front (one vectorized call each) and zip
+    # through them; .tolist() yields plain Python ints/floats for the encoder.
+    normal = zip(
+        rng.integers(20, 61, size=n_normal).tolist(),
+        (rng.random(n_normal) < 0.1).tolist(),
+        rng.integers(0, 3, size=n_normal).tolist(),
+        rng.integers(0, 3, size=n_normal).tolist(),
+        (rng.random(n_normal) * 0.3).tolist(),
+        (rng.random(n_normal) * 0.2).tolist(),
+    )
+    anomaly = zip(
+        rng.integers(120, 301, size=n_anomaly).tolist(),
+        rng.integers(3, 9, size=n_anomaly).tolist(),
+        rng.integers(3, 13, size=n_anomaly).tolist(),
+        (0.7 + rng.random(n_anomaly) * 0.3).tolist(),
+        (0.6 + rng.random(n_anomaly) * 0.4).tolist(),
+    )
+
+    buf = bytearray()
+    with path.open("wb") as f:
+        for i, (length, has_link, tags, mentions, complexity, density) in enumerate(normal):
             rec = {
                 "record_id": f"normal_{i}",
                 "type": "post",
-                "content_length": rng.randint(20, 60),
+                "content_length": length,
                 "has_code_block": False,
-                "has_link": rng.random() < 0.1,
-                "tags_count": rng.randint(0, 2),
-                "mentions_count": rng.randint(0, 2),
-                "f_complexity": rng.random() * 0.3,
-                "f_code_density": rng.random() * 0.2,
+                "has_link": has_link,
+                "tags_count": tags,
+                "mentions_count": mentions,
+                "f_complexity": complexity,
+                "f_code_density": density,
                 "f_toxicity": 0,
                 "tv_id": "TV-0",
             }
-            f.write(json.dumps(rec) + "\n")
-        for i in range(n_anomaly):
+            buf += _dumps(rec)
+            buf += b"\n"
+            if len(buf) >= _FLUSH_BYTES:
+                f.write(buf)
+                buf.clear()
+        for i, (length, tags, mentions, complexity, density) in enumerate(anomaly):
             rec = {
                 "record_id": f"anomaly_{i}",
                 "type": "post",
-                "content_length": rng.randint(120, 300),
+                "content_length": length,
                 "has_code_block": True,
                 "has_link": True,
-                "tags_count": rng.randint(3, 8),
-                "mentions_count": rng.randint(3, 12),
-                "f_complexity": 0.7 + rng.random() * 0.3,
-                "f_code_density": 0.6 + rng.random() * 0.4,
+                "tags_count": tags,
+                "mentions_count": mentions,
+                "f_complexity": complexity,
+                "f_code_density": density,
                 "f_toxicity": 1,
                 "tv_id": "TV-3",
             }
-            f.write(json.dumps(rec) + "\n")
+            buf += _dumps(rec)
+            buf += b"\n"
+            if len(buf) >= _FLUSH_BYTES:
+                f.write(buf)
+                buf.clear()
+        f.write(buf)
 
 
 def _run(cmd: list[str], cwd: Path) -> int:
@@ -62,12 +112,46 @@ def _run(cmd: list[str], cwd: Path) -> int:
     return int(p.returncode)
 
 
+def _load_script(path: Path) -> ModuleType:
+    """Import a standalone script by file path (scripts are not packaged)."""
+
+    name = f"_pipeline_demo_{path.stem}"
+    cached = sys.modules.get(name)
+    if cached is not None:
+        return cached
+    spec = importlib.util.spec_from_file_location(name, str(path))
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load module spec for {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(name, None)
+        raise
+    return module
+
+
+def _run_stage(script: Path, stage_args: list[str], cwd: Path, isolated: bool) -> int:
+    if isolated:
+        return _run([sys.executable, str(script), *stage_args], cwd=cwd)
+    try:
+        return int(_load_script(script).main(stage_args) or 0)
+    except SystemExit as e:
+        # Stage scripts exit at import time when optional deps are missing.
+        # Map the code the way the interpreter does, so isolated runs agree.
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Run synthetic ML pipeline demo.")
     ap.add_argument("--out-dir", required=True, type=Path)
     ap.add_argument("--seed", type=int, default=42)
     ap.add_argument("--normal", type=int, default=50)
     ap.add_argument("--anomaly", type=int, default=10)
+    ap.add_argument("--isolated", action="store_true", help="Run each stage in a separate Python process")
     args = ap.parse_args(argv)
 
     root = args.out_dir.resolve()
@@ -81,18 +165,18 @@ def main(argv: Optional[list[str]] = None) -> int:
     _generate_jsonl(inp, int(args.normal), int(args.anomaly), int(args.seed))
 
     scripts_dir = Path(__file__).resolve().parents[1]
-    py = sys.executable
+    isolated = bool(args.isolated)
 
-    c1 = [py, str(scripts_dir / "data" / "build_feature_dataset.py"), "--input", str(inp), "--out-dir", str(ds), "--seed", str(args.seed)]
-    if _run(c1, cwd=root) != 0:
+    a1 = ["--input", str(inp), "--out-dir", str(ds), "--seed", str(args.seed)]
+    if _run_stage(scripts_dir / "data" / "build_feature_dataset.py", a1, cwd=root, isolated=isolated) != 0:
         return 2
 
-    c2 = [py, str(scripts_dir / "ml" / "train_sklearn_model.py"), "--dataset", str(ds / "dataset_manifest.json"), "--out-dir", str(model), "--model-type", "unsupervised", "--seed", str(args.seed)]
-    if _run(c2, cwd=root) != 0:
+    a2 = ["--dataset", str(ds / "dataset_manifest.json"), "--out-dir", str(model), "--model-type", "unsupervised", "--seed", str(args.seed)]
+    if _run_stage(scripts_dir / "ml" / "train_sklearn_model.py", a2, cwd=root, isolated=isolated) != 0:
         return 2
 
-    c3 = [py, str(scripts_dir / "ml" / "score_unsupervised_model.py"), "--dataset", str(ds / "dataset_manifest.json"), "--model", str(model / "train_manifest.json"), "--out-file", str(scores)]
-    if _run(c3, cwd=root) != 0:
+    a3 = ["--dataset", str(ds / "dataset_manifest.json"), "--model", str(model / "train_manifest.json"), "--out-file", str(scores)]
+    if _run_stage(scripts_dir / "ml" / "score_unsupervised_model.py", a3, cwd=root, isolated=isolated) != 0:
         return 2
 
     print(f"Pipeline demo complete under: {root}")
@@ -15,10 +15,14 @@ from typing import Any, Dict, List, Optional
 
 try:
     import joblib
+    import numpy as np
 except Exception:
-    print("Error: joblib is required.")
+    print("Error: joblib and numpy are required.")
     sys.exit(1)
 
+# Rows per decision_function call; small enough to keep tree nodes cache-hot.
+DEFAULT_CHUNK_SIZE = 8192
+
 
 def _read_csv(path: Path) -> List[Dict[str, str]]:
     with path.open("r", encoding="utf-8", newline="") as f:
@@ -35,11 +39,65 @@ def _load_model_path(model_arg: Path) -> Path:
     return model_arg
 
 
+def _is_uncompressed_pickle(path: Path) -> bool:
+    # Raw pickles (protocol >= 2) start with the PROTO opcode; joblib's
+    # compressed containers (zlib/lz4/...) never do.
+    with path.open("rb") as f:
+        return f.read(1) == b"\x80"
+
+
+def _load_model(path: Path) -> Any:
+    # mmap only applies to uncompressed dumps; joblib ignores (and warns about)
+    # mmap_mode for compressed files, which train_sklearn_model now writes.
+    if _is_uncompressed_pickle(path):
+        return joblib.load(path, mmap_mode="r")
+    return joblib.load(path)
+
+
+def _feature_matrix(rows: List[Dict[str, str]], cols: List[str]) -> "np.ndarray":
+    # sklearn trees evaluate on float32 internally, so build that dtype directly.
+    x = np.zeros((len(rows), len(cols)), dtype=np.float32)
+    for i, r in enumerate(rows):
+        for j, c in enumerate(cols):
+            try:
+                x[i, j] = float(r.get(c, 0.0))
+            except Exception:
+                pass
+    return x
+
+
+def score_in_chunks(model: Any, x: "np.ndarray", chunk_size: int = DEFAULT_CHUNK_SIZE, n_jobs: int = 1) -> "np.ndarray":
+    """Call ``model.decision_function`` over row chunks into a preallocated array.
+
+    With ``n_jobs != 1`` the chunks are scored concurrently on a thread pool;
+    sklearn's tree traversal releases the GIL, so threads scale across cores.
+    """
+
+    out = np.empty(x.shape[0], dtype=np.float64)
+    step = max(1, int(chunk_size))
+    starts = range(0, x.shape[0], step)
+
+    workers = joblib.effective_n_jobs(n_jobs)
+    if workers <= 1 or len(starts) <= 1:
+        for i in starts:
+            out[i : i + step] = model.decision_function(x[i : i + step])
+        return out
+
+    parts = joblib.Parallel(n_jobs=workers, prefer="threads")(
+        joblib.delayed(model.decision_function)(x[i : i + step]) for i in starts
+    )
+    for i, part in zip(starts, parts):
+        out[i : i + step] = part
+    return out
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Score dataset records using an unsupervised model.")
     ap.add_argument("--dataset", required=True, type=Path, help="Path to dataset_manifest.json")
     ap.add_argument("--model", required=True, type=Path, help="Path to model.joblib or train_manifest.json")
     ap.add_argument("--out-file", required=True, type=Path)
+    ap.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows scored per decision_function call")
+    ap.add_argument("--jobs", type=int, default=-1, help="Parallel scoring threads (-1 = all cores, 1 = sequential)")
     args = ap.parse_args(argv)
 
     dataset = json.loads(args.dataset.read_text(encoding="utf-8"))
@@ -50,31 +108,21 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     feature_rows = _read_csv(Path(dataset["features_csv"]))
     model_path = _load_model_path(args.model)
-    model = joblib.load(model_path)
-
-    x: List[List[float]] = []
-    ids: List[str] = []
-    for r in feature_rows:
-        ids.append(str(r.get("record_id") or ""))
-        vec = []
-        for c in feature_cols:
-            try:
-                vec.append(float(r.get(c, 0.0)))
-            except Exception:
-                vec.append(0.0)
-        x.append(vec)
+    model = _load_model(model_path)
+
+    ids = [str(r.get("record_id") or "") for r in feature_rows]
+    x = _feature_matrix(feature_rows, feature_cols)
 
     if not hasattr(model, "decision_function"):
         print("Error: model does not expose decision_function")
         return 2
 
-    scores = model.decision_function(x)
+    scores = score_in_chunks(model, x, args.chunk_size, n_jobs=args.jobs)
     args.out_file.parent.mkdir(parents=True, exist_ok=True)
     with args.out_file.open("w", encoding="utf-8", newline="") as f:
         w = csv.writer(f)
         w.writerow(["record_id", "score_raw"])
-        for rid, s in zip(ids, scores):
-            w.writerow([rid, float(s)])
+        w.writerows(zip(ids, scores.tolist()))
 
     print(f"Wrote: {args.out_file}")
     return 0
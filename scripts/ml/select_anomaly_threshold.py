@@ -12,7 +12,7 @@ import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 
 try:
     import numpy as np
@@ -25,6 +25,29 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def _order_stats(scores_np: "np.ndarray", k: int) -> Dict[str, Any]:
+    """Return threshold/min/max/median/mean from a single multi-kth partition.
+
+    Partitioning once on every order statistic we need places each of them at
+    its sorted position, so the report does not re-scan the array per stat.
+    Only the ``k`` values left of the threshold are scanned for the
+    strictly-below count.
+    """
+
+    n = int(scores_np.size)
+    lo_mid, hi_mid = (n - 1) // 2, n // 2
+    part = np.partition(scores_np, sorted({0, k, lo_mid, hi_mid, n - 1}))
+    threshold = float(part[k])
+    return {
+        "threshold": threshold,
+        "n_below": int(np.count_nonzero(part[:k] < threshold)),
+        "min": float(part[0]),
+        "max": float(part[n - 1]),
+        "median": float((part[lo_mid] + part[hi_mid]) / 2.0),
+        "mean": float(part.mean()),
+    }
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Calculate anomaly threshold for target FPR.")
     parser.add_argument("--scores", required=True, type=Path, help="Path to scores.csv (record_id, score_raw)")
@@ -48,10 +71,12 @@ def main() -> int:
 
     n = len(scores)
     scores_np = np.array(scores)
-    target_percentile = args.target_fpr * 100.0
-    threshold = float(np.percentile(scores_np, target_percentile))
+    # A single quantile only needs a selection (introselect, O(n)), not a full sort.
+    k = max(0, min(n - 1, int(round(args.target_fpr * (n - 1)))))
+    stats = _order_stats(scores_np, k)
+    threshold = stats["threshold"]
 
-    n_fp = int(np.sum(scores_np < threshold))
+    n_fp = stats["n_below"]
     actual_fpr = float(n_fp / n)
 
     report = f"""# Threshold Selection Report
@@ -66,10 +91,10 @@ def main() -> int:
 - **Observed FPR**: {actual_fpr * 100:.4f}% ({n_fp}/{n} records)
 
 ## Distribution Stats
-- Min: {np.min(scores_np):.6f}
-- Max: {np.max(scores_np):.6f}
-- Mean: {np.mean(scores_np):.6f}
-- Median: {np.median(scores_np):.6f}
+- Min: {stats["min"]:.6f}
+- Max: {stats["max"]:.6f}
+- Mean: {stats["mean"]:.6f}
+- Median: {stats["median"]:.6f}
 
 ## Usage
 Scores **lower** than `{threshold:.6f}` are flagged as anomalies.
@@ -1,8 +1,11 @@
 """Train sklearn models from dataset artifacts.
 
 Supported model types:
-- supervised: RandomForestClassifier (requires labels)
+- supervised: RandomForestClassifier (default) or HistGradientBoostingClassifier
+  via `--classifier hgb` (requires labels)
 - unsupervised: IsolationForest
+
+Forest fits run on all cores by default (`--n-jobs -1`).
 """
 
 from __future__ import annotations
@@ -17,12 +20,21 @@ from typing import Any, Dict, List, Optional, Tuple
 
 try:
     import joblib
-    from sklearn.ensemble import IsolationForest, RandomForestClassifier
+    import numpy as np
+    from sklearn.ensemble import HistGradientBoostingClassifier, IsolationForest, RandomForestClassifier
     from sklearn.metrics import accuracy_score, f1_score
 except Exception:
     print("Error: scikit-learn and joblib are required.")
     sys.exit(1)
 
+try:
+    import lz4  # enables joblib's lz4 compressor
+except ImportError:
+    lz4 = None
+
+# lz4 decompresses far faster than zlib; fall back to zlib when it is missing.
+MODEL_COMPRESS: Tuple[str, int] = ("lz4", 3) if lz4 is not None else ("zlib", 3)
+
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -33,15 +45,50 @@ def _read_csv(path: Path) -> List[Dict[str, str]]:
         return list(csv.DictReader(f))
 
 
-def _load_dataset(manifest_path: Path) -> Tuple[List[Dict[str, str]], Dict[str, str], Dict[str, str], List[str]]:
+def _load_dataset(manifest_path: Path) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray", List[str]]:
+    """Join features, splits and labels in a single pass over the features CSV.
+
+    Returns ``(x, split, label, has_label, feature_cols)`` where ``x`` is a
+    float32 matrix and the other arrays are aligned with its rows, so each
+    split can be selected with a boolean mask instead of per-row list building.
+    """
+
     m = json.loads(manifest_path.read_text(encoding="utf-8"))
-    features = _read_csv(Path(m["features_csv"]))
     splits = {r["record_id"]: r["split"] for r in _read_csv(Path(m["splits_csv"]))}
     labels: Dict[str, str] = {}
     if m.get("labels_csv"):
         labels = {r["record_id"]: (r.get("label") or "") for r in _read_csv(Path(m["labels_csv"]))}
     feature_cols = [c for c in list(m.get("feature_columns") or []) if c != "record_id"]
-    return features, splits, labels, feature_cols
+
+    with Path(m["features_csv"]).open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        rows = list(reader)
+
+    pos = {name: i for i, name in enumerate(header)}
+    rid_pos = pos.get("record_id")
+    col_pos = [pos.get(c) for c in feature_cols]
+
+    n = len(rows)
+    x = np.zeros((n, len(feature_cols)), dtype=np.float32)
+    split = np.empty(n, dtype=object)
+    label = np.empty(n, dtype=object)
+    has_label = np.zeros(n, dtype=bool)
+    for i, row in enumerate(rows):
+        rid = row[rid_pos] if rid_pos is not None and rid_pos < len(row) else ""
+        split[i] = splits.get(rid, "train")
+        lab = labels.get(rid)
+        if lab is not None:
+            label[i] = lab
+            has_label[i] = True
+        for j, p in enumerate(col_pos):
+            if p is None or p >= len(row):
+                continue
+            try:
+                x[i, j] = float(row[p])
+            except ValueError:
+                pass
+    return x, split, label, has_label, feature_cols
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -49,37 +96,27 @@ def main(argv: Optional[List[str]] = None) -> int:
     ap.add_argument("--dataset", required=True, type=Path)
     ap.add_argument("--out-dir", required=True, type=Path)
     ap.add_argument("--model-type", choices=["supervised", "unsupervised"], default="supervised")
+    ap.add_argument(
+        "--classifier",
+        choices=["rf", "hgb"],
+        default="rf",
+        help="Supervised estimator: rf = RandomForest, hgb = HistGradientBoosting (faster on large tabular data)",
+    )
+    ap.add_argument("--n-jobs", type=int, default=-1, help="Parallel jobs for forest fitting (-1 = all cores)")
     ap.add_argument("--seed", type=int, default=42)
     args = ap.parse_args(argv)
 
-    features, splits, labels, cols = _load_dataset(args.dataset)
+    x, split, label, has_label, cols = _load_dataset(args.dataset)
     if not cols:
         print("Error: no feature columns available")
         return 2
 
-    x_train: List[List[float]] = []
-    y_train: List[str] = []
-    x_val: List[List[float]] = []
-    y_val: List[str] = []
-
-    for r in features:
-        rid = str(r.get("record_id") or "")
-        split = splits.get(rid, "train")
-        vec = []
-        for c in cols:
-            try:
-                vec.append(float(r.get(c, 0.0)))
-            except Exception:
-                vec.append(0.0)
-
-        if split == "train":
-            x_train.append(vec)
-            if rid in labels:
-                y_train.append(labels[rid])
-        elif split == "val":
-            x_val.append(vec)
-            if rid in labels:
-                y_val.append(labels[rid])
+    train_mask = split == "train"
+    val_mask = split == "val"
+    x_train = x[train_mask]
+    y_train = label[train_mask & has_label].astype(str)
+    x_val = x[val_mask]
+    y_val = label[val_mask & has_label].astype(str)
 
     args.out_dir.mkdir(parents=True, exist_ok=True)
     model_path = args.out_dir / "model.joblib"
@@ -91,25 +128,30 @@ def main(argv: Optional[List[str]] = None) -> int:
         if len(y_train) != len(x_train):
             print("Error: supervised mode requires labels for all training rows")
             return 2
-        model = RandomForestClassifier(n_estimators=100, random_state=int(args.seed))
+        if args.classifier == "hgb":
+            model = HistGradientBoostingClassifier(random_state=int(args.seed))
+        else:
+            model = RandomForestClassifier(n_estimators=100, random_state=int(args.seed), n_jobs=int(args.n_jobs))
         model.fit(x_train, y_train)
-        if x_val and len(y_val) == len(x_val):
+        if len(x_val) and len(y_val) == len(x_val):
             pred = model.predict(x_val)
             metrics["accuracy"] = float(accuracy_score(y_val, pred))
             metrics["f1_macro"] = float(f1_score(y_val, pred, average="macro"))
     else:
-        model = IsolationForest(n_estimators=100, random_state=int(args.seed), contamination=0.1)
+        model = IsolationForest(n_estimators=100, random_state=int(args.seed), contamination=0.1, n_jobs=int(args.n_jobs))
         model.fit(x_train)
         metrics["trained_rows"] = len(x_train)
 
-    joblib.dump(model, model_path)
+    joblib.dump(model, model_path, compress=MODEL_COMPRESS)
     metrics_path.write_text(json.dumps(metrics, indent=2, sort_keys=True), encoding="utf-8")
 
     train_manifest = {
         "created_at_utc": _utc_now_iso(),
         "dataset_manifest": str(args.dataset),
         "model_type": str(args.model_type),
+        "classifier": str(args.classifier) if args.model_type == "supervised" else None,
         "model_path": str(model_path),
+        "model_compress": str(MODEL_COMPRESS[0]),
         "metrics_path": str(metrics_path),
         "feature_columns": cols,
         "seed": int(args.seed),
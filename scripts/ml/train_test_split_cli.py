@@ -8,7 +8,7 @@ train_test_split_cli — deterministic train/test split for CSV datasets (option
 ## SYNOPSIS
 
 python train_test_split_cli.py <in_csv> --out <out_dir> [--test-size 0.2] [--seed 1337]
-                               [--stratify-col label] [--delimiter ,]
+                               [--stratify-col label] [--delimiter ,] [--engine auto|csv|arrow]
 
 ## DESCRIPTION
 
@@ -21,8 +21,20 @@ Features:
 - optionally writes `split_indices.json` (row indices relative to the input, excluding header)
 
 Notes:
-- This tool is intentionally dependency-free (no pandas required).
+- This tool is intentionally lightweight (numpy only; no pandas required).
 - For stratification, the CSV is read into memory to compute group counts.
+- `--stream` splits out-of-core: two batched Arrow passes (the first parses
+  only the stratify column), so memory does not grow with file size.
+- `--sampling bernoulli` trades exact counts for per-row coin flips (strata
+  are proportional in expectation); with `--stream` and a fractional test size
+  the split takes a single pass.
+- The default engine is the stdlib `csv` module. `--engine arrow` parses and
+  writes with Arrow's C++ CSV reader/writer and selects rows with
+  `Table.take`; `--engine auto` does so when `pyarrow` is installed and the
+  encoding is UTF-8, falling back to `csv` for files Arrow rejects (e.g. rows
+  with a different number of fields, which `csv` pads or truncates). All
+  columns are kept as strings, so values round-trip unchanged; Arrow quotes
+  every field on output.
 
 CodeSentinel is SEAM Protected Software.
 Maintained by CodeSentinel.
@@ -34,10 +46,17 @@ from __future__ import annotations
 import argparse
 import csv
 import json
-import random
+import operator
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
 
 @dataclass(frozen=True)
@@ -81,23 +100,34 @@ def _allocate_counts_proportionally(total_test: int, bucket_sizes: dict[str, int
     if total == 0:
         return {k: 0 for k in bucket_sizes.keys()}
 
-    raw: dict[str, float] = {k: (bucket_sizes[k] / total) * total_test for k in bucket_sizes.keys()}
-    base: dict[str, int] = {k: int(raw[k]) for k in bucket_sizes.keys()}
+    keys = list(bucket_sizes.keys())
+    raw = np.fromiter(bucket_sizes.values(), dtype=np.float64, count=len(keys)) / total * total_test
+    base = raw.astype(np.int64)
 
-    remainder = total_test - sum(base.values())
-    if remainder <= 0:
-        return base
+    remainder = total_test - int(base.sum())
+    if remainder > 0:
+        # Largest fractional remainder first; ties go to the larger key.
+        key_rank = np.empty(len(keys), dtype=np.int64)
+        key_rank[np.argsort(np.asarray(keys, dtype=str), kind="stable")] = np.arange(len(keys))
+        order = np.lexsort((key_rank, raw - base))[::-1]
+        base[np.resize(order, remainder)] += 1
 
-    # Largest fractional remainder first.
-    fracs = sorted(
-        ((k, raw[k] - base[k]) for k in bucket_sizes.keys()),
-        key=lambda kv: (kv[1], kv[0]),
-        reverse=True,
-    )
-    for i in range(remainder):
-        base[fracs[i % len(fracs)][0]] += 1
+    return dict(zip(keys, base.tolist()))
+
+
+def _test_fraction(test_size: float | int, n_rows: int) -> float:
+    if isinstance(test_size, float):
+        return float(test_size)
+    return min(1.0, int(test_size) / n_rows) if n_rows else 0.0
 
-    return base
+
+def _result_from_mask(test_mask: np.ndarray) -> SplitResult:
+    """Partition row indices by a boolean test mask in one vectorized pass."""
+
+    return SplitResult(
+        train_indices=np.flatnonzero(~test_mask).tolist(),
+        test_indices=np.flatnonzero(test_mask).tolist(),
+    )
 
 
 def split_indices(
@@ -106,14 +136,31 @@ def split_indices(
     test_size: float | int,
     seed: int,
     stratify: Optional[list[str]] = None,
+    sampling: str = "exact",
 ) -> SplitResult:
     """Compute train/test indices for n_rows.
 
     If stratify is provided, it must be a list of length n_rows with the
     stratification label per row.
+
+    ``sampling="bernoulli"`` assigns each row to test independently with
+    probability ``test_size`` (as a fraction of n_rows). Every stratum is then
+    sampled at the same rate, so strata are proportional in expectation but
+    counts are approximate, and no per-stratum buckets are built. The row
+    decisions only depend on the seed and row position, which is what lets
+    ``--stream`` make them in a single pass.
     """
 
-    rng = random.Random(seed)
+    rng = np.random.default_rng(seed)
+
+    if sampling == "bernoulli":
+        if n_rows == 0:
+            return SplitResult(train_indices=[], test_indices=[])
+        if stratify is not None and len(stratify) != n_rows:
+            raise ValueError("stratify labels length must equal number of rows")
+        return _result_from_mask(rng.random(n_rows) < _test_fraction(test_size, n_rows))
+    if sampling != "exact":
+        raise ValueError(f"unknown sampling mode: {sampling!r}")
 
     if isinstance(test_size, float):
         total_test = int(round(test_size * n_rows))
@@ -126,71 +173,339 @@ def split_indices(
         return SplitResult(train_indices=[], test_indices=[])
 
     if stratify is None:
-        all_idx = list(range(n_rows))
-        rng.shuffle(all_idx)
-        test_idx = set(all_idx[:total_test])
-        train = [i for i in range(n_rows) if i not in test_idx]
-        test = [i for i in range(n_rows) if i in test_idx]
-        return SplitResult(train_indices=train, test_indices=test)
+        # C-level shuffle + boolean mask instead of a Python shuffle and set scans.
+        perm = rng.permutation(n_rows)
+        test_mask = np.zeros(n_rows, dtype=bool)
+        test_mask[perm[:total_test]] = True
+        return _result_from_mask(test_mask)
 
     if len(stratify) != n_rows:
         raise ValueError("stratify labels length must equal number of rows")
 
-    # Group indices by label.
-    buckets: dict[str, list[int]] = {}
-    for i, label in enumerate(stratify):
-        key = str(label)
-        buckets.setdefault(key, []).append(i)
+    # Group indices by label in C: factorize, stable-sort the codes, and cut the
+    # sorted order at the group boundaries. np.unique returns keys sorted, which
+    # gives the deterministic bucket ordering.
+    keys, codes, counts = np.unique(np.asarray(stratify, dtype=str), return_inverse=True, return_counts=True)
+    order = np.argsort(codes.ravel(), kind="stable")
+    groups = np.split(order, np.cumsum(counts)[:-1])
+    buckets: dict[str, np.ndarray] = dict(zip(keys.tolist(), groups))
 
-    # Deterministic ordering by key.
-    bucket_sizes = {k: len(v) for k, v in sorted(buckets.items(), key=lambda kv: kv[0])}
+    bucket_sizes = dict(zip(keys.tolist(), counts.tolist()))
     per_bucket_test = _allocate_counts_proportionally(total_test, bucket_sizes)
 
-    test_set: set[int] = set()
+    test_mask = np.zeros(n_rows, dtype=bool)
+    n_test = 0
 
     for k in bucket_sizes.keys():
-        idxs = list(buckets[k])
-        rng.shuffle(idxs)
+        idxs = buckets[k]
         take = min(per_bucket_test.get(k, 0), len(idxs))
-        test_set.update(idxs[:take])
+        # Partial Fisher-Yates in C: only `take` draws, not a full bucket shuffle.
+        test_mask[rng.choice(idxs, size=take, replace=False, shuffle=False)] = True
+        n_test += take
 
     # If rounding/edge cases left us short/over, fix by sampling from remaining.
-    # (This should be rare but keeps invariants correct.)
-    if len(test_set) < total_test:
-        remaining = [i for i in range(n_rows) if i not in test_set]
-        rng.shuffle(remaining)
-        need = total_test - len(test_set)
-        test_set.update(remaining[:need])
-    elif len(test_set) > total_test:
-        extra = list(test_set)
-        rng.shuffle(extra)
-        for i in extra[: len(test_set) - total_test]:
-            test_set.remove(i)
-
-    train = [i for i in range(n_rows) if i not in test_set]
-    test = [i for i in range(n_rows) if i in test_set]
-    return SplitResult(train_indices=train, test_indices=test)
-
-
-def _read_csv_rows(path: Path, *, encoding: str, delimiter: str) -> tuple[list[str], list[dict[str, str]]]:
+    # (This should be rare but keeps invariants correct.) Buckets are disjoint,
+    # so the summed takes are the exact test count; no full-mask count needed.
+    if n_test < total_test:
+        remaining = np.flatnonzero(~test_mask)
+        test_mask[rng.choice(remaining, size=total_test - n_test, replace=False)] = True
+    elif n_test > total_test:
+        extra = np.flatnonzero(test_mask)
+        test_mask[rng.choice(extra, size=n_test - total_test, replace=False)] = False
+
+    return _result_from_mask(test_mask)
+
+
+_TRANSPOSE_CHUNK_ROWS = 1 << 16
+
+
+def _read_csv_columns(path: Path, *, encoding: str, delimiter: str) -> tuple[list[str], list[list[str]], int]:
+    """Read a CSV column-wise: returns ``(header, columns, n_rows)``.
+
+    One list per column (SoA) instead of one container per row. Rows are
+    padded/truncated to the header width and blank lines are skipped, matching
+    what `csv.DictReader` would have produced. Rows are transposed in chunks
+    with ``zip(*chunk)`` so the per-cell work stays in C and peak memory is the
+    columns plus one chunk.
+    """
+
     with path.open("r", encoding=encoding, newline="") as fh:
-        reader = csv.DictReader(fh, delimiter=delimiter)
-        if reader.fieldnames is None:
+        reader = csv.reader(fh, delimiter=delimiter)
+        header = next(reader, None)
+        if not header:
             raise ValueError("CSV appears to have no header row")
-        header = list(reader.fieldnames)
-        rows: list[dict[str, str]] = []
+        width = len(header)
+        columns: list[list[str]] = [[] for _ in header]
+        n_rows = 0
+        chunk: list[list[str]] = []
         for row in reader:
-            rows.append({k: (row.get(k) or "") for k in header})
-        return header, rows
+            if not row:
+                continue
+            if len(row) != width:
+                row = (row + [""] * width)[:width]
+            chunk.append(row)
+            if len(chunk) >= _TRANSPOSE_CHUNK_ROWS:
+                n_rows += _extend_columns(columns, chunk)
+        n_rows += _extend_columns(columns, chunk)
+        return header, columns, n_rows
+
+
+def _extend_columns(columns: list[list[str]], chunk: list[list[str]]) -> int:
+    n = len(chunk)
+    for col, values in zip(columns, zip(*chunk)):
+        col.extend(values)
+    chunk.clear()
+    return n
+
 
+def _take(values: list[str], idx: Sequence[int]) -> Sequence[str]:
+    """Gather ``values[i] for i in idx`` with a C-level itemgetter."""
 
-def _write_csv(path: Path, header: list[str], rows: Iterable[dict[str, str]], *, encoding: str, delimiter: str) -> None:
+    if not idx:
+        return ()
+    if len(idx) == 1:
+        return (values[idx[0]],)
+    return operator.itemgetter(*idx)(values)
+
+
+_WRITE_BUFFER_BYTES = 1 << 20
+
+# split_indices.json is pretty-printed only while it stays small; large index
+# lists are written compactly (indentation roughly doubles the file size).
+_PRETTY_INDICES_MAX = 10_000
+
+
+def _dump_indices_json(payload: dict[str, Any], *, pretty: bool) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(payload, option=option)
+    return json.dumps(payload, indent=2 if pretty else None).encode("utf-8")
+
+
+def _write_csv(path: Path, header: list[str], rows: Iterable[Sequence[str]], *, encoding: str, delimiter: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding=encoding, newline="") as fh:
-        w = csv.DictWriter(fh, fieldnames=header, delimiter=delimiter)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+    with path.open("w", encoding=encoding, newline="", buffering=_WRITE_BUFFER_BYTES) as fh:
+        w = csv.writer(fh, delimiter=delimiter)
+        w.writerow(header)
+        # One C-level loop over all rows instead of a Python-level writerow per row.
+        w.writerows(rows)
+
+
+def _import_pyarrow_csv():
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.csv as pacsv  # type: ignore
+
+        return pa, pacsv
+    except Exception as e:
+        raise RuntimeError("Missing dependency: pyarrow. Install pyarrow or use --engine csv.") from e
+
+
+def _use_arrow(engine: str, encoding: str) -> bool:
+    if engine == "csv":
+        return False
+    if engine == "arrow":
+        _import_pyarrow_csv()
+        return True
+    # auto: Arrow writes UTF-8 only, and is optional.
+    if encoding.lower().replace("_", "-") not in ("utf-8", "utf8"):
+        return False
+    try:
+        _import_pyarrow_csv()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _peek_header(path: Path, *, encoding: str, delimiter: str) -> list[str]:
+    with path.open("r", encoding=encoding, newline="") as fh:
+        header = next(csv.reader(fh, delimiter=delimiter), None)
+    if not header:
+        raise ValueError("CSV appears to have no header row")
+    return header
+
+
+def _arrow_csv_options(header: list[str], *, encoding: str, delimiter: str, include_columns: Optional[list[str]] = None) -> dict[str, Any]:
+    pa, pacsv = _import_pyarrow_csv()
+    # Every column is forced to string (no type inference: "007" must stay
+    # "007" in the outputs).
+    return {
+        "read_options": pacsv.ReadOptions(encoding=encoding),
+        "parse_options": pacsv.ParseOptions(delimiter=delimiter),
+        "convert_options": pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            include_columns=include_columns,
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False,
+        ),
+    }
+
+
+def _read_csv_table(path: Path, *, encoding: str, delimiter: str) -> Any:
+    _, pacsv = _import_pyarrow_csv()
+    header = _peek_header(path, encoding=encoding, delimiter=delimiter)
+    return pacsv.read_csv(str(path), **_arrow_csv_options(header, encoding=encoding, delimiter=delimiter))
+
+
+def _stream_split(
+    in_path: Path,
+    train_path: Path,
+    test_path: Path,
+    *,
+    encoding: str,
+    delimiter: str,
+    stratify_col: Optional[str],
+    test_size: float | int,
+    seed: int,
+    sampling: str = "exact",
+) -> SplitResult:
+    """Split a CSV in two streaming passes over Arrow record batches.
+
+    Pass 1 parses only the stratify column (or the first column, just to count
+    rows) and computes the split. Pass 2 re-reads the file batch by batch and
+    routes each batch's rows to the train/test writers with the precomputed
+    mask, so memory stays proportional to the batch size, not the file size.
+    Outputs keep the input row order.
+
+    With ``sampling="bernoulli"`` and a fractional test size, pass 1 is skipped:
+    each batch draws its test mask from the seeded generator as it streams,
+    which yields the same rows as `split_indices(..., sampling="bernoulli")`.
+    """
+
+    pa, pacsv = _import_pyarrow_csv()
+    header = _peek_header(in_path, encoding=encoding, delimiter=delimiter)
+    if stratify_col and stratify_col not in header:
+        raise ValueError(f"stratify-col '{stratify_col}' not in CSV header")
+
+    if sampling == "bernoulli" and isinstance(test_size, float):
+        return _stream_split_bernoulli(
+            in_path, train_path, test_path, header, encoding=encoding, delimiter=delimiter, test_size=test_size, seed=seed
+        )
+
+    key_col = stratify_col or header[0]
+    n_rows = 0
+    labels: list[str] = []
+    key_opts = _arrow_csv_options(header, encoding=encoding, delimiter=delimiter, include_columns=[key_col])
+    for batch in pacsv.open_csv(str(in_path), **key_opts):
+        n_rows += batch.num_rows
+        if stratify_col:
+            labels.extend(batch.column(0).to_pylist())
+
+    result = split_indices(
+        n_rows, test_size=test_size, seed=seed, stratify=labels if stratify_col else None, sampling=sampling
+    )
+    test_mask = np.zeros(n_rows, dtype=bool)
+    test_mask[result.test_indices] = True
+
+    train_path.parent.mkdir(parents=True, exist_ok=True)
+    test_path.parent.mkdir(parents=True, exist_ok=True)
+    reader = pacsv.open_csv(str(in_path), **_arrow_csv_options(header, encoding=encoding, delimiter=delimiter))
+    write_options = pacsv.WriteOptions(delimiter=delimiter)
+    with pacsv.CSVWriter(str(train_path), reader.schema, write_options=write_options) as w_train, pacsv.CSVWriter(
+        str(test_path), reader.schema, write_options=write_options
+    ) as w_test:
+        offset = 0
+        for batch in reader:
+            m = test_mask[offset : offset + batch.num_rows]
+            offset += batch.num_rows
+            w_test.write_batch(batch.filter(pa.array(m)))
+            w_train.write_batch(batch.filter(pa.array(~m)))
+
+    return result
+
+
+def _write_csv_table(path: Path, table: Any, *, delimiter: str) -> None:
+    _, pacsv = _import_pyarrow_csv()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pacsv.write_csv(table, str(path), write_options=pacsv.WriteOptions(delimiter=delimiter))
+
+
+def _stream_split_bernoulli(
+    in_path: Path,
+    train_path: Path,
+    test_path: Path,
+    header: list[str],
+    *,
+    encoding: str,
+    delimiter: str,
+    test_size: float,
+    seed: int,
+) -> SplitResult:
+    pa, pacsv = _import_pyarrow_csv()
+    rng = np.random.default_rng(seed)
+
+    train_path.parent.mkdir(parents=True, exist_ok=True)
+    test_path.parent.mkdir(parents=True, exist_ok=True)
+    reader = pacsv.open_csv(str(in_path), **_arrow_csv_options(header, encoding=encoding, delimiter=delimiter))
+    write_options = pacsv.WriteOptions(delimiter=delimiter)
+    masks: list[np.ndarray] = []
+    with pacsv.CSVWriter(str(train_path), reader.schema, write_options=write_options) as w_train, pacsv.CSVWriter(
+        str(test_path), reader.schema, write_options=write_options
+    ) as w_test:
+        for batch in reader:
+            # Consecutive draws from one generator equal a single draw of the
+            # total length, so batch boundaries do not change the split.
+            m = rng.random(batch.num_rows) < test_size
+            masks.append(m)
+            w_test.write_batch(batch.filter(pa.array(m)))
+            w_train.write_batch(batch.filter(pa.array(~m)))
+
+    return _result_from_mask(np.concatenate(masks) if masks else np.zeros(0, dtype=bool))
+
+
+def _split_in_memory(
+    in_path: Path, train_path: Path, test_path: Path, *, args: argparse.Namespace, test_size: float | int
+) -> tuple[list[int], list[int]]:
+    engine = args.engine or "csv"
+    use_arrow = _use_arrow(engine, args.encoding)
+
+    table: Any = None
+    columns: list[list[str]] = []
+    if use_arrow:
+        pa, _ = _import_pyarrow_csv()
+        try:
+            table = _read_csv_table(in_path, encoding=args.encoding, delimiter=args.delimiter)
+        except pa.ArrowInvalid:
+            if engine != "auto":
+                raise
+            # e.g. ragged rows: the csv path pads/truncates them like before.
+            use_arrow = False
+    if use_arrow:
+        header = list(table.column_names)
+        n_rows = int(table.num_rows)
+    else:
+        header, columns, n_rows = _read_csv_columns(in_path, encoding=args.encoding, delimiter=args.delimiter)
+
+    stratify_labels: Optional[list[str]] = None
+    if args.stratify_col:
+        if args.stratify_col not in header:
+            raise ValueError(f"stratify-col '{args.stratify_col}' not in CSV header")
+        if use_arrow:
+            stratify_labels = table.column(args.stratify_col).to_pylist()
+        else:
+            stratify_labels = columns[header.index(args.stratify_col)]
+
+    result = split_indices(n_rows, test_size=test_size, seed=args.seed, stratify=stratify_labels, sampling=args.sampling)
+
+    train_idx = result.train_indices
+    test_idx = result.test_indices
+
+    if args.preserve_order:
+        train_idx = sorted(train_idx)
+        test_idx = sorted(test_idx)
+
+    if use_arrow:
+        pa, _ = _import_pyarrow_csv()
+        train_tbl = table.take(pa.array(train_idx, type=pa.int64()))
+        test_tbl = table.take(pa.array(test_idx, type=pa.int64()))
+        _write_csv_table(train_path, train_tbl, delimiter=args.delimiter)
+        _write_csv_table(test_path, test_tbl, delimiter=args.delimiter)
+    else:
+        for path, idx in ((train_path, train_idx), (test_path, test_idx)):
+            selected = zip(*(_take(col, idx) for col in columns))
+            _write_csv(path, header, selected, encoding=args.encoding, delimiter=args.delimiter)
+
+    return train_idx, test_idx
 
 
 def main(argv: Optional[list[str]] = None) -> int:
@@ -203,6 +518,25 @@ def main(argv: Optional[list[str]] = None) -> int:
     parser.add_argument("--delimiter", default=",", help="CSV delimiter (default: ,)")
     parser.add_argument("--encoding", default="utf-8", help="Text encoding (default: utf-8)")
     parser.add_argument("--prefix", default="", help="Optional prefix for output files")
+    parser.add_argument(
+        "--engine",
+        choices=["auto", "csv", "arrow"],
+        default=None,
+        help="CSV engine: csv (stdlib; default), arrow (requires pyarrow), or auto (arrow when available, "
+        "csv for files Arrow cannot parse). --stream always uses arrow",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Out-of-core mode: split in two streaming Arrow passes (requires pyarrow; keeps input row order)",
+    )
+    parser.add_argument(
+        "--sampling",
+        choices=["exact", "bernoulli"],
+        default="exact",
+        help="exact: exact test count, proportional per stratum (default); "
+        "bernoulli: per-row coin flips with p=test-size (approximate counts; single pass with --stream)",
+    )
     parser.add_argument(
         "--write-indices",
         action="store_true",
@@ -223,34 +557,30 @@ def main(argv: Optional[list[str]] = None) -> int:
     kind, ts = _parse_test_size(args.test_size)
     test_size: float | int = ts
 
-    header, rows = _read_csv_rows(in_path, encoding=args.encoding, delimiter=args.delimiter)
-
-    stratify_labels: Optional[list[str]] = None
-    if args.stratify_col:
-        if args.stratify_col not in header:
-            raise ValueError(f"stratify-col '{args.stratify_col}' not in CSV header")
-        stratify_labels = [r.get(args.stratify_col, "") for r in rows]
-
-    result = split_indices(len(rows), test_size=test_size, seed=args.seed, stratify=stratify_labels)
-
-    train_idx = result.train_indices
-    test_idx = result.test_indices
-
-    if args.preserve_order:
-        train_idx = sorted(train_idx)
-        test_idx = sorted(test_idx)
-
-    train_rows = [rows[i] for i in train_idx]
-    test_rows = [rows[i] for i in test_idx]
-
     prefix = args.prefix
     out_dir = Path(args.out).resolve()
 
     train_path = out_dir / f"{prefix}train.csv"
     test_path = out_dir / f"{prefix}test.csv"
 
-    _write_csv(train_path, header, train_rows, encoding=args.encoding, delimiter=args.delimiter)
-    _write_csv(test_path, header, test_rows, encoding=args.encoding, delimiter=args.delimiter)
+    if args.stream:
+        if args.engine == "csv":
+            raise ValueError("--stream requires the arrow engine")
+        result = _stream_split(
+            in_path,
+            train_path,
+            test_path,
+            encoding=args.encoding,
+            delimiter=args.delimiter,
+            stratify_col=args.stratify_col,
+            test_size=test_size,
+            seed=args.seed,
+            sampling=args.sampling,
+        )
+        train_idx = result.train_indices
+        test_idx = result.test_indices
+    else:
+        train_idx, test_idx = _split_in_memory(in_path, train_path, test_path, args=args, test_size=test_size)
 
     if args.write_indices:
         idx_path = out_dir / f"{prefix}split_indices.json"
@@ -262,11 +592,12 @@ def main(argv: Optional[list[str]] = None) -> int:
             "train_indices": train_idx,
             "test_indices": test_idx,
         }
-        idx_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        pretty = len(train_idx) + len(test_idx) <= _PRETTY_INDICES_MAX
+        idx_path.write_bytes(_dump_indices_json(payload, pretty=pretty))
         print(f"Wrote: {idx_path}")
 
-    print(f"Wrote: {train_path} ({len(train_rows)} rows)")
-    print(f"Wrote: {test_path} ({len(test_rows)} rows)")
+    print(f"Wrote: {train_path} ({len(train_idx)} rows)")
+    print(f"Wrote: {test_path} ({len(test_idx)} rows)")
     return 0
 
 
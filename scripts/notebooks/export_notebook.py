@@ -7,14 +7,161 @@ Maintained by CodeSentinel.
 """
 
 import argparse
+import functools
+import html
 from pathlib import Path
+import re
 import sys
-from typing import Optional
+from typing import Any, List, Optional, Tuple
+
+# Optional dependencies: imported once at module load (so repeated calls pay
+# nothing); a missing install is reported when an export is attempted.
+try:
+    import nbformat  # type: ignore
+    from traitlets.config import Config  # type: ignore
+    from nbconvert import HTMLExporter, PDFExporter  # type: ignore
+    from nbconvert.exporters import WebPDFExporter  # type: ignore
+    from nbconvert.preprocessors import TagRemovePreprocessor  # type: ignore
+    _IMPORT_ERROR: Optional[Exception] = None
+except Exception as _exc:  # pragma: no cover - depends on the environment
+    nbformat = None
+    _IMPORT_ERROR = _exc
+
+REMOVE_CELL_TAGS = ("remove_cell",)
+REMOVE_INPUT_TAGS = ("remove_input",)
+
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+_FAST_HTML_SHELL = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; max-width: 960px; margin: 2em auto; line-height: 1.5; }}
+pre {{ background: #f7f7f7; padding: 0.5em; overflow-x: auto; }}
+.input pre {{ border-left: 3px solid #9ab; }}
+.error pre {{ background: #fdd; }}
+img {{ max-width: 100%; }}
+</style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def _cell_tags(cell: Any) -> List[str]:
+    tags = (cell.get("metadata") or {}).get("tags") or []
+    return tags if isinstance(tags, list) else []
+
+
+def _join_source(value: Any) -> str:
+    return "".join(value) if isinstance(value, list) else str(value)
+
+
+def _render_output(output: Any) -> str:
+    kind = output.get("output_type")
+    if kind == "stream":
+        return f"<pre>{html.escape(_join_source(output.get('text', '')))}</pre>"
+    if kind == "error":
+        tb = _ANSI_ESCAPE.sub("", "\n".join(output.get("traceback") or []))
+        return f'<div class="error"><pre>{html.escape(tb)}</pre></div>'
+
+    data = output.get("data") or {}
+    if "text/html" in data:
+        return _join_source(data["text/html"])
+    if "image/svg+xml" in data:
+        return _join_source(data["image/svg+xml"])
+    for mime in ("image/png", "image/jpeg"):
+        if mime in data:
+            payload = _join_source(data[mime]).replace("\n", "")
+            return f'<img src="data:{mime};base64,{payload}">'
+    if "text/plain" in data:
+        return f"<pre>{html.escape(_join_source(data['text/plain']))}</pre>"
+    return ""
+
+
+def render_fast_html(nb: Any, *, title: str) -> str:
+    """Render a notebook to a static HTML page without nbconvert templates.
+
+    Markdown goes through nbconvert's ``markdown2html`` filter; code inputs and
+    existing outputs are emitted directly. The ``remove_cell`` and
+    ``remove_input`` tags behave as they do in the template-based export.
+    """
+
+    from nbconvert.filters import markdown2html  # type: ignore
+
+    parts: List[str] = []
+    for cell in nb.get("cells", []):
+        tags = _cell_tags(cell)
+        if any(t in tags for t in REMOVE_CELL_TAGS):
+            continue
+        cell_type = cell.get("cell_type")
+        source = _join_source(cell.get("source", ""))
+        if cell_type == "markdown":
+            parts.append(f'<div class="markdown">{markdown2html(source)}</div>')
+        elif cell_type == "code":
+            if source and not any(t in tags for t in REMOVE_INPUT_TAGS):
+                parts.append(f'<div class="input"><pre>{html.escape(source)}</pre></div>')
+            for output in cell.get("outputs", []):
+                rendered = _render_output(output)
+                if rendered:
+                    parts.append(f'<div class="output">{rendered}</div>')
+        elif cell_type == "raw":
+            parts.append(f"<pre>{html.escape(source)}</pre>")
+
+    return _FAST_HTML_SHELL.format(title=html.escape(title), body="\n".join(parts))
+
+
+@functools.lru_cache(maxsize=4)
+def _get_exporter(
+    output_format: str,
+    remove_cell_tags: Tuple[str, ...] = REMOVE_CELL_TAGS,
+    remove_input_tags: Tuple[str, ...] = REMOVE_INPUT_TAGS,
+) -> Tuple[Any, str]:
+    """Build (once per configuration) the exporter and its file extension.
+
+    Exporter construction sets up the Jinja environment and templates, so
+    callers exporting many notebooks in one process reuse the same instance.
+    """
+
+    if output_format == 'html':
+        exporter = HTMLExporter()
+    elif output_format == 'pdf':
+        # Check for webpdf dependencies (pyppeteer) or latex
+        try:
+            # Prefer WebPDF (Headless Chrome) over LaTeX for ease of setup
+            exporter = WebPDFExporter()
+        except Exception as e:
+            print(f"WebPDF exporter not available: {e}")
+            print("Falling back to standard PDF (Requires LaTeX/Pandoc)...")
+            exporter = PDFExporter()
+    else:
+        raise ValueError(f"Unsupported output format: {output_format!r}")
+
+    # Configure
+    c = Config()
+    c.TagRemovePreprocessor.remove_cell_tags = remove_cell_tags
+    c.TagRemovePreprocessor.remove_input_tags = remove_input_tags
+    c.TagRemovePreprocessor.enabled = True
+    exporter.register_preprocessor(TagRemovePreprocessor(config=c), enabled=True)
+    return exporter, '.' + output_format
+
 
-def export_notebook(notebook_path: str, output_format: str = 'html', output_path: Optional[str] = None) -> int:
+def export_notebook(
+    notebook_path: str,
+    output_format: str = 'html',
+    output_path: Optional[str] = None,
+    *,
+    fast_html: bool = False,
+) -> int:
     """Export a Jupyter notebook to HTML or PDF.
 
-    This script keeps notebook dependencies optional by importing them lazily.
+    Notebook dependencies stay optional: a missing install is reported here.
+    With ``fast_html`` the HTML is written by `render_fast_html` instead of
+    nbconvert's template pipeline.
     """
 
     notebook_path_obj = Path(notebook_path).expanduser().resolve()
@@ -22,17 +169,10 @@ def export_notebook(notebook_path: str, output_format: str = 'html', output_path
         print(f"Error: File not found: {notebook_path_obj}", file=sys.stderr)
         return 2
 
-    # Lazy imports for optional dependencies.
-    try:
-        import nbformat  # type: ignore
-        from traitlets.config import Config  # type: ignore
-        from nbconvert import HTMLExporter, PDFExporter  # type: ignore
-        from nbconvert.exporters import WebPDFExporter  # type: ignore
-        from nbconvert.preprocessors import TagRemovePreprocessor  # type: ignore
-    except Exception as exc:
+    if _IMPORT_ERROR is not None:
         print(
             "Notebook export requires optional dependencies. Install 'nbconvert', 'nbformat', and 'traitlets' and retry. "
-            f"(import error: {exc})",
+            f"(import error: {_IMPORT_ERROR})",
             file=sys.stderr,
         )
         return 2
@@ -44,34 +184,23 @@ def export_notebook(notebook_path: str, output_format: str = 'html', output_path
         print(f"Error: Failed to read notebook: {exc}", file=sys.stderr)
         return 2
 
-    exporter = None
-    output_ext = ''
-
-    if output_format == 'html':
-        exporter = HTMLExporter()
-        output_ext = '.html'
-    elif output_format == 'pdf':
-        # Check for webpdf dependencies (pyppeteer) or latex
+    if output_format == 'html' and fast_html:
+        output_path_obj = Path(output_path).expanduser().resolve() if output_path else notebook_path_obj.with_suffix('.html')
         try:
-            # Prefer WebPDF (Headless Chrome) over LaTeX for ease of setup
-            exporter = WebPDFExporter() 
-            output_ext = '.pdf'
+            text = render_fast_html(nb, title=notebook_path_obj.stem)
         except Exception as e:
-            print(f"WebPDF exporter not available: {e}")
-            print("Falling back to standard PDF (Requires LaTeX/Pandoc)...")
-            exporter = PDFExporter()
-            output_ext = '.pdf'
-    
-    if not exporter:
-        print("Could not initialize exporter.", file=sys.stderr)
-        return 2
+            print(f"Export failed: {e}", file=sys.stderr)
+            return 2
+        print(f"Writing: {output_path_obj}")
+        output_path_obj.write_text(text, encoding='utf-8')
+        print("Success!")
+        return 0
 
-    # Configure
-    c = Config()
-    c.TagRemovePreprocessor.remove_cell_tags = ("remove_cell",)
-    c.TagRemovePreprocessor.remove_input_tags = ("remove_input",)
-    c.TagRemovePreprocessor.enabled = True
-    exporter.register_preprocessor(TagRemovePreprocessor(config=c), enabled=True)
+    try:
+        exporter, output_ext = _get_exporter(output_format)
+    except Exception as exc:
+        print(f"Could not initialize exporter: {exc}", file=sys.stderr)
+        return 2
 
     try:
         print(f"Converting to {output_format.upper()}...")
@@ -103,9 +232,14 @@ def main():
     parser.add_argument("file", help="Path to .ipynb file")
     parser.add_argument("--format", choices=['html', 'pdf'], default='html', help="Output format")
     parser.add_argument("--output", default='', help="Optional output path")
+    parser.add_argument(
+        "--fast-html",
+        action="store_true",
+        help="Write HTML directly from the cells, skipping nbconvert's templates (plain styling)",
+    )
     
     args = parser.parse_args()
-    rc = export_notebook(args.file, args.format, args.output or None)
+    rc = export_notebook(args.file, args.format, args.output or None, fast_html=args.fast_html)
     raise SystemExit(rc)
 
 if __name__ == "__main__":
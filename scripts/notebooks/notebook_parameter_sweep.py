@@ -16,16 +16,25 @@ from __future__ import annotations
 import argparse
 import copy
 import json
+import os
+import queue
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import nbformat
+from jupyter_client import KernelManager
 from nbconvert.preprocessors import ExecutePreprocessor
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 
 @dataclass
 class SweepRunResult:
@@ -47,13 +56,26 @@ def _parse_kv_params(items: Sequence[str]) -> Dict[str, Any]:
         v = v.strip()
         if not k:
             raise ValueError(f"Invalid --params entry (empty key): {item!r}")
-        try:
-            params[k] = json.loads(v)
-        except Exception:
-            params[k] = v
+        params[k] = _maybe_json(v)
     return params
 
 
+# First characters of every JSON document json.loads accepts (including its
+# NaN/Infinity extensions); anything else is kept as a plain string.
+_JSON_START = frozenset('{["tfnNI-0123456789')
+
+
+def _maybe_json(value: str) -> Any:
+    """Parse ``value`` as JSON when it can be JSON, else return it unchanged."""
+
+    if not value or value[0] not in _JSON_START:
+        return value
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
 def _python_literal(value: Any) -> str:
     if value is None:
         return "None"
@@ -70,24 +92,45 @@ def _python_literal(value: Any) -> str:
         return repr(value)
 
 
-def render_parameters_cell(parameters: Dict[str, Any]) -> str:
-    lines = [
-        "# Parameters injected by notebook_parameter_sweep.py",
-    ]
-    for key in sorted(parameters.keys()):
-        if not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", key):
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _validate_parameter_names(names: Iterable[str]) -> None:
+    for key in names:
+        if not _IDENTIFIER.match(key):
             raise ValueError(
                 f"Parameter name is not a valid Python identifier: {key!r}"
             )
+
+
+def render_parameters_cell(parameters: Dict[str, Any], *, key_order: Optional[Sequence[str]] = None) -> str:
+    """Render the injected parameters cell.
+
+    ``key_order`` is a pre-sorted, pre-validated list of every key in the grid
+    (see `sweep_notebook`); passing it skips the per-run sort and identifier
+    checks.
+    """
+
+    if key_order is None:
+        keys: Iterable[str] = sorted(parameters.keys())
+        _validate_parameter_names(keys)
+    else:
+        keys = (k for k in key_order if k in parameters)
+    lines = [
+        "# Parameters injected by notebook_parameter_sweep.py",
+    ]
+    for key in keys:
         lines.append(f"{key} = {_python_literal(parameters[key])}")
     lines.append("")
     return "\n".join(lines)
 
 
-def apply_parameters_to_notebook(nb: Any, parameters: Dict[str, Any]) -> Any:
+def apply_parameters_to_notebook(
+    nb: Any, parameters: Dict[str, Any], *, key_order: Optional[Sequence[str]] = None
+) -> Any:
     """Insert or replace a 'parameters' tagged cell."""
 
-    cell_source = render_parameters_cell(parameters)
+    cell_source = render_parameters_cell(parameters, key_order=key_order)
 
     # Find existing cell with tag "parameters"
     for cell in nb.get("cells", []):
@@ -113,16 +156,126 @@ def execute_notebook(
     timeout_sec: int,
     cwd: Path,
     allow_errors: bool,
+    km: Optional[KernelManager] = None,
 ) -> Any:
+    """Execute ``nb`` in place.
+
+    Without ``km`` a fresh kernel is started and shut down for this notebook.
+    With a running ``km`` the kernel is reused: its namespace is cleared with
+    ``%reset -f`` first and the kernel is left running afterwards.
+    """
+
     ep = ExecutePreprocessor(
         timeout=timeout_sec,
         kernel_name=kernel_name,
         allow_errors=allow_errors,
     )
-    ep.preprocess(nb, {"metadata": {"path": str(cwd)}})
+    if km is None:
+        ep.preprocess(nb, {"metadata": {"path": str(cwd)}})
+        return nb
+
+    _reset_kernel(km, timeout_sec=timeout_sec)
+    try:
+        ep.preprocess(nb, {"metadata": {"path": str(cwd)}}, km=km)
+    finally:
+        # nbclient only tears down clients of kernels it owns.
+        if ep.kc is not None:
+            ep.kc.stop_channels()
+            ep.kc = None
     return nb
 
 
+def _start_kernel(kernel_name: str, cwd: Path) -> KernelManager:
+    km = KernelManager(kernel_name=kernel_name)
+    km.start_kernel(cwd=str(cwd))
+    return km
+
+
+def _reset_kernel(km: KernelManager, *, timeout_sec: int) -> None:
+    """Clear the user namespace of a reused kernel before the next run."""
+
+    kc = km.blocking_client()
+    kc.start_channels()
+    try:
+        kc.wait_for_ready(timeout=timeout_sec)
+        reply = kc.execute_interactive(
+            "%reset -f", store_history=False, timeout=timeout_sec, output_hook=lambda msg: None
+        )
+        if reply["content"].get("status") != "ok":
+            raise RuntimeError("Failed to reset the reused kernel namespace")
+    finally:
+        kc.stop_channels()
+
+
+def _clone_for_run(base_nb: Any, *, deep: bool) -> Any:
+    """Copy the base notebook for one run.
+
+    Parameterizing alone only replaces one cell's ``source`` or inserts a new
+    cell, so a shallow clone (new top-level node, cell list and cell dicts;
+    shared sources/outputs/metadata) is enough and far cheaper than a deep
+    copy. Execution mutates nested cell/notebook metadata in place, so
+    executed runs still get a full deep copy.
+    """
+
+    if deep:
+        return copy.deepcopy(base_nb)
+    nb = nbformat.NotebookNode(base_nb)
+    nb["cells"] = [nbformat.NotebookNode(cell) for cell in base_nb.get("cells", [])]
+    return nb
+
+
+def _run_one(
+    i: int,
+    params: Dict[str, Any],
+    base_nb: Any,
+    *,
+    key_order: Sequence[str],
+    input_stem: str,
+    outdir: Path,
+    execute: bool,
+    kernel_name: str,
+    timeout_sec: int,
+    cwd: Path,
+    allow_errors: bool,
+    km: Optional[KernelManager] = None,
+) -> SweepRunResult:
+    start = time.time()
+    nb = _clone_for_run(base_nb, deep=execute)
+    apply_parameters_to_notebook(nb, params, key_order=key_order)
+
+    ok = True
+    err: Optional[str] = None
+    if execute:
+        try:
+            execute_notebook(
+                nb,
+                kernel_name=kernel_name,
+                timeout_sec=timeout_sec,
+                cwd=cwd,
+                allow_errors=allow_errors,
+                km=km,
+            )
+        except Exception as e:
+            ok = False
+            err = f"{type(e).__name__}: {e}"
+            if not allow_errors:
+                raise
+
+    out_path = outdir / f"{input_stem}__run{i:03d}.ipynb"
+    with out_path.open("w", encoding="utf-8") as wf:
+        nbformat.write(nb, wf)
+
+    elapsed = time.time() - start
+    return SweepRunResult(
+        index=i,
+        parameters=dict(params),
+        output_notebook=str(out_path),
+        ok=ok,
+        error=err,
+        elapsed_sec=elapsed,
+    )
+
+
 def sweep_notebook(
     input_path: Path,
     outdir: Path,
@@ -133,7 +286,21 @@ def sweep_notebook(
     timeout_sec: int,
     cwd: Path,
     allow_errors: bool,
+    jobs: int = 1,
+    reuse_kernel: bool = False,
 ) -> List[SweepRunResult]:
+    """Parameterize (and optionally execute) the notebook once per run.
+
+    With ``jobs > 1`` up to that many runs execute concurrently. Each run
+    already executes in its own kernel process, so worker threads only drive
+    kernel clients; results are returned in run order.
+
+    With ``reuse_kernel`` one kernel per worker is started up front and shared
+    by the runs on that worker (namespace reset between runs), so kernel
+    startup and module imports are paid once per worker instead of per run.
+    Modules imported by one run stay imported for the next.
+    """
+
     input_path = input_path.resolve()
     outdir = outdir.resolve()
     outdir.mkdir(parents=True, exist_ok=True)
@@ -141,47 +308,77 @@ def sweep_notebook(
     with input_path.open("r", encoding="utf-8") as f:
         base_nb = nbformat.read(f, as_version=4)
 
-    results: List[SweepRunResult] = []
-
-    for i, params in enumerate(runs):
-        start = time.time()
-        nb = copy.deepcopy(base_nb)
-        apply_parameters_to_notebook(nb, params)
-
-        ok = True
-        err: Optional[str] = None
-        if execute:
-            try:
-                execute_notebook(
-                    nb,
-                    kernel_name=kernel_name,
-                    timeout_sec=timeout_sec,
-                    cwd=cwd,
-                    allow_errors=allow_errors,
-                )
-            except Exception as e:
-                ok = False
-                err = f"{type(e).__name__}: {e}"
-                if not allow_errors:
-                    raise
-
-        out_path = outdir / f"{input_path.stem}__run{i:03d}.ipynb"
-        with out_path.open("w", encoding="utf-8") as wf:
-            nbformat.write(nb, wf)
-
-        elapsed = time.time() - start
-        results.append(
-            SweepRunResult(
-                index=i,
-                parameters=dict(params),
-                output_notebook=str(out_path),
-                ok=ok,
-                error=err,
-                elapsed_sec=elapsed,
+    # Sort and validate the grid's parameter names once, not once per run.
+    key_order = sorted({k for params in runs for k in params})
+    _validate_parameter_names(key_order)
+
+    workers = max(1, min(int(jobs), len(runs)))
+    kernels: "queue.Queue[KernelManager]" = queue.Queue()
+    started: List[KernelManager] = []
+
+    def run(item: Tuple[int, Dict[str, Any]]) -> SweepRunResult:
+        i, params = item
+        km = kernels.get() if started else None
+        try:
+            return _run_one(
+                i,
+                params,
+                base_nb,
+                key_order=key_order,
+                input_stem=input_path.stem,
+                outdir=outdir,
+                execute=execute,
+                kernel_name=kernel_name,
+                timeout_sec=timeout_sec,
+                cwd=cwd,
+                allow_errors=allow_errors,
+                km=km,
             )
-        )
+        finally:
+            if km is not None:
+                kernels.put(km)
 
-    return results
+    try:
+        if execute and reuse_kernel and runs:
+            for _ in range(workers):
+                km = _start_kernel(kernel_name, cwd)
+                started.append(km)
+                kernels.put(km)
+
+        if not execute or workers == 1:
+            return [run(item) for item in enumerate(runs)]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(run, enumerate(runs)))
+    finally:
+        for km in started:
+            km.shutdown_kernel(now=True)
+
+
+def _dump_record(record: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(record)
+        except TypeError:  # e.g. integers beyond 64 bits
+            pass
+    return json.dumps(record).encode("utf-8")
+
+
+def write_report(results: Iterable[SweepRunResult], report_path: Path) -> None:
+    """Write the JSON summary one run at a time.
+
+    The report goes to a ``.tmp`` sibling first and is moved into place with
+    `os.replace`, so a crash never leaves a truncated report behind.
+    """
+
+    tmp_path = report_path.with_name(report_path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(b"[")
+        for i, r in enumerate(results):
+            f.write(b",\n  " if i else b"\n  ")
+            f.write(_dump_record(r.__dict__))
+        f.write(b"\n]\n")
+    os.replace(tmp_path, report_path)
 
 
 def _load_grid(grid_path: Path) -> List[Dict[str, Any]]:
@@ -229,6 +426,17 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         action="store_true",
         help="Continue even if execution errors occur (errors recorded in report)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Runs to execute concurrently, each on its own kernel (default: min(runs, CPU count))",
+    )
+    parser.add_argument(
+        "--reuse-kernel",
+        action="store_true",
+        help="Keep one warm kernel per job and reset its namespace between runs instead of starting a kernel per run",
+    )
     parser.add_argument(
         "--report",
         default=None,
@@ -264,12 +472,12 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         timeout_sec=int(args.timeout_sec),
         cwd=cwd,
         allow_errors=bool(args.allow_errors),
+        jobs=int(args.jobs) if args.jobs else min(len(runs), os.cpu_count() or 1),
+        reuse_kernel=bool(args.reuse_kernel),
     )
 
     report_path = Path(args.report) if args.report else (outdir / "sweep_report.json")
-    report_path.write_text(
-        json.dumps([r.__dict__ for r in results], indent=2), encoding="utf-8"
-    )
+    write_report(results, report_path)
 
     ok_count = sum(1 for r in results if r.ok)
     print(f"Runs: {len(results)} (ok: {ok_count}, failed: {len(results) - ok_count})")
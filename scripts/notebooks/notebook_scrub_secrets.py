@@ -15,15 +15,30 @@ Maintained by CodeSentinel.
 from __future__ import annotations
 
 import argparse
+import functools
+import glob
 import json
+import os
 import re
 import shutil
 import sys
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
+from multiprocessing import Pool
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import nbformat
+from nbformat.v4.rwbase import rejoin_lines, split_lines, strip_transient
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+try:
+    import re2  # google-re2: linear-time DFA matching
+except ImportError:  # optional speedup; stdlib re is used instead
+    re2 = None
 
 
 @dataclass
@@ -42,24 +57,47 @@ class ScrubReport:
 _REPLACEMENT = "[REDACTED]"
 
 
-def _default_redaction_patterns() -> List[Tuple[str, re.Pattern]]:
-    """Return (name, compiled_regex) patterns to redact.
+@functools.lru_cache(maxsize=1)
+def _default_redaction_prefixes() -> Tuple[str, ...]:
+    """Literal text every default pattern match starts with.
 
-    Patterns are intentionally conservative; the goal is to catch common leaks.
+    Used as a cheap substring prefilter: text containing none of these cannot
+    match a default pattern, so the regex scan is skipped.
     """
 
     # NOTE: Some secret scanners flag common token prefixes even when they appear
     # in tests, docs, or regex definitions. To reduce false positives in a
     # public-facing repo, build those prefixes dynamically.
-    openai_prefix = "s" + "k" + "-"
-    gh_p_prefix = "g" + "h" + "p" + "_"
-    gh_o_prefix = "g" + "h" + "o" + "_"
-    gh_s_prefix = "g" + "h" + "s" + "_"
-    githubpat_prefix = "github" + "_" + "pat" + "_"
-    aws_akia_prefix = "A" + "K" + "I" + "A"
-    slack_prefix = "x" + "o" + "x"
-
-    private_key_begin = "-----BEGIN " + "PRIVATE KEY-----"
+    return (
+        "s" + "k" + "-",
+        "github" + "_" + "pat" + "_",
+        "g" + "h" + "p" + "_",
+        "g" + "h" + "o" + "_",
+        "g" + "h" + "s" + "_",
+        "A" + "K" + "I" + "A",
+        "x" + "o" + "x",
+        "-----BEGIN " + "PRIVATE KEY-----",
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _default_redaction_patterns() -> Tuple[Tuple[str, re.Pattern], ...]:
+    """Return (name, compiled_regex) patterns to redact.
+
+    Patterns are intentionally conservative; the goal is to catch common leaks.
+    Compiled once per process and shared (hence the immutable tuple).
+    """
+
+    (
+        openai_prefix,
+        githubpat_prefix,
+        gh_p_prefix,
+        gh_o_prefix,
+        gh_s_prefix,
+        aws_akia_prefix,
+        slack_prefix,
+        private_key_begin,
+    ) = _default_redaction_prefixes()
     private_key_end = "-----END " + "PRIVATE KEY-----"
 
     raw: List[Tuple[str, str, int]] = [
@@ -85,13 +123,61 @@ def _default_redaction_patterns() -> List[Tuple[str, re.Pattern]]:
         ),
     ]
 
-    compiled: List[Tuple[str, re.Pattern]] = []
-    for name, pattern, flags in raw:
-        compiled.append((name, re.compile(pattern, flags=flags)))
-    return compiled
+    # Every token alphabet here is ASCII; re.ASCII keeps \b and the classes off
+    # the Unicode tables.
+    return tuple((name, re.compile(pattern, flags=flags | re.ASCII)) for name, pattern, flags in raw)
+
+
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+
 
+@functools.lru_cache(maxsize=8)
+def _fuse_patterns(patterns: Tuple[Tuple[str, re.Pattern], ...]) -> Tuple[Tuple[str, re.Pattern], ...]:
+    """Combine redaction patterns into a single alternation scanned in one pass.
 
-def _redact_string(text: str, patterns: Sequence[Tuple[str, re.Pattern]]) -> Tuple[str, int]:
+    Each pattern keeps its own flags via a scoped inline group. Patterns with
+    capture groups (whose backreferences would be renumbered), other flags or
+    a mix of ASCII and Unicode matching are returned unfused. ASCII-only sets
+    are compiled with RE2 when available (linear time, no catastrophic
+    backtracking on huge outputs), else with ``re`` (keeping ``re.ASCII``).
+    """
+
+    parts: List[str] = []
+    ascii_flags = {bool(rx.flags & re.ASCII) for _name, rx in patterns}
+    if len(ascii_flags) > 1:
+        return patterns
+    for _name, rx in patterns:
+        if rx.groups or not isinstance(rx.pattern, str):
+            return patterns
+        letters = ""
+        remaining = rx.flags & ~(re.UNICODE | re.ASCII)
+        for flag, letter in _INLINE_FLAGS:
+            if remaining & flag:
+                letters += letter
+                remaining &= ~flag
+        if remaining:
+            return patterns
+        parts.append(f"(?{letters}:{rx.pattern})" if letters else f"(?:{rx.pattern})")
+    if len(parts) < 2:
+        return patterns
+    combined = "|".join(parts)
+    ascii_only = ascii_flags == {True}
+    # RE2's \b and \w are ASCII-only, so it is only a drop-in for ASCII patterns.
+    if re2 is not None and ascii_only:
+        try:
+            return (("combined", re2.compile(combined)),)
+        except Exception:  # syntax RE2 does not support (e.g. lookarounds)
+            pass
+    return (("combined", re.compile(combined, re.ASCII if ascii_only else 0)),)
+
+
+def _redact_string(
+    text: str,
+    patterns: Sequence[Tuple[str, re.Pattern]],
+    prefixes: Optional[Sequence[str]] = None,
+) -> Tuple[str, int]:
+    if prefixes is not None and not any(p in text for p in prefixes):
+        return text, 0
     total = 0
     new_text = text
     for _name, rx in patterns:
@@ -100,34 +186,55 @@ def _redact_string(text: str, patterns: Sequence[Tuple[str, re.Pattern]]) -> Tup
     return new_text, total
 
 
-def _redact_any(value: Any, patterns: Sequence[Tuple[str, re.Pattern]]) -> Tuple[Any, int]:
-    """Redact secrets inside nested output structures.
+def _redact_in_place(
+    value: Any,
+    patterns: Sequence[Tuple[str, re.Pattern]],
+    prefixes: Optional[Sequence[str]] = None,
+) -> int:
+    """Redact secrets inside nested output structures, mutating them in place.
 
-    Returns (new_value, replacements_count).
+    Walks lists/dicts with an explicit stack; only string leaves that actually
+    change are reassigned. Returns the replacements count.
     """
 
-    if isinstance(value, str):
-        return _redact_string(value, patterns)
-
-    if isinstance(value, list):
-        out_list: List[Any] = []
-        total = 0
-        for item in value:
-            new_item, n = _redact_any(item, patterns)
-            out_list.append(new_item)
-            total += n
-        return out_list, total
-
-    if isinstance(value, dict):
-        out_dict: Dict[Any, Any] = {}
-        total = 0
-        for k, v in value.items():
-            new_v, n = _redact_any(v, patterns)
-            out_dict[k] = new_v
-            total += n
-        return out_dict, total
+    total = 0
+    stack: List[Any] = [value]
+    while stack:
+        container = stack.pop()
+        items: Iterable[Tuple[Any, Any]]
+        if isinstance(container, dict):
+            items = list(container.items())
+        elif isinstance(container, list):
+            items = list(enumerate(container))
+        else:
+            continue
+        for key, item in items:
+            if isinstance(item, str):
+                new_item, n = _redact_string(item, patterns, prefixes)
+                if n:
+                    container[key] = new_item
+                    total += n
+            elif isinstance(item, (dict, list)):
+                stack.append(item)
+    return total
+
+
+def _check_cells(cells: Any) -> None:
+    """Reject structurally broken cells before scrubbing starts.
+
+    Notebooks are read without schema validation (see `_read_notebook`), so
+    this one pass checks what the scrub loop relies on and gives malformed
+    input a clear error instead of a failure part way through.
+    """
 
-    return value, 0
+    if not isinstance(cells, list):
+        raise ValueError("Notebook 'cells' must be a list")
+    for i, cell in enumerate(cells):
+        if not isinstance(cell, dict):
+            raise ValueError(f"Notebook cell {i} must be an object")
+        metadata = cell.get("metadata")
+        if metadata is not None and not isinstance(metadata, dict):
+            raise ValueError(f"Notebook cell {i} 'metadata' must be an object")
 
 
 def scrub_notebook_node(
@@ -140,7 +247,9 @@ def scrub_notebook_node(
     patterns: Optional[Sequence[Tuple[str, re.Pattern]]] = None,
     strip_all_metadata: bool = False,
 ) -> Tuple[Any, ScrubReport]:
-    patterns = _default_redaction_patterns() if patterns is None else list(patterns)
+    # Only the default patterns have known literal prefixes to prefilter on.
+    prefixes = _default_redaction_prefixes() if patterns is None else None
+    patterns = _fuse_patterns(_default_redaction_patterns() if patterns is None else tuple(patterns))
 
     cells_total = 0
     cells_redacted = 0
@@ -149,47 +258,50 @@ def scrub_notebook_node(
     execution_counts_cleared_cells = 0
     attachments_removed_cells = 0
 
-    for cell in nb.get("cells", []):
+    cells = nb.get("cells", [])
+    _check_cells(cells)
+
+    # `_check_cells` has vetted the per-cell field types the loop depends on,
+    # so the loop itself does not re-check them.
+    for cell in cells:
         cells_total += 1
         cell_replacements = 0
 
         # Redact source
-        if redact and isinstance(cell.get("source"), str):
-            new_source, n = _redact_string(cell["source"], patterns)
+        source = cell.get("source")
+        if redact and type(source) is str:
+            new_source, n = _redact_string(source, patterns, prefixes)
             if n:
                 cell["source"] = new_source
                 cell_replacements += n
 
-        # Clear outputs / exec counts
+        # Clear outputs / exec counts (code cells)
         if cell.get("cell_type") == "code":
-            if clear_outputs and "outputs" in cell and cell["outputs"]:
-                cell["outputs"] = []
-                outputs_cleared_cells += 1
+            # Cleared outputs are never inspected; kept outputs are redacted.
+            outputs = cell.get("outputs")
+            if clear_outputs:
+                if outputs:
+                    cell["outputs"] = []
+                    outputs_cleared_cells += 1
+            elif redact and outputs:
+                for output in outputs:
+                    cell_replacements += _redact_in_place(output, patterns, prefixes)
 
             if strip_execution_counts and cell.get("execution_count") is not None:
                 cell["execution_count"] = None
                 execution_counts_cleared_cells += 1
 
-            # If we are not clearing outputs, still redact output payloads.
-            if redact and not clear_outputs and cell.get("outputs"):
-                for output in cell.get("outputs", []):
-                    new_output, n = _redact_any(output, patterns)
-                    # mutate in-place while preserving NotebookNode types
-                    if isinstance(new_output, dict):
-                        output.clear()
-                        output.update(new_output)
-                    cell_replacements += n
-
         # Attachments (common in markdown cells)
         if remove_attachments and cell.get("attachments"):
             cell["attachments"] = {}
             attachments_removed_cells += 1
 
         # Strip transient per-cell metadata (safe defaults)
-        if isinstance(cell.get("metadata"), dict):
-            cell["metadata"].pop("execution", None)
-            cell["metadata"].pop("collapsed", None)
-            cell["metadata"].pop("scrolled", None)
+        metadata = cell.get("metadata")
+        if metadata:
+            metadata.pop("execution", None)
+            metadata.pop("collapsed", None)
+            metadata.pop("scrolled", None)
 
         if cell_replacements:
             cells_redacted += 1
@@ -225,6 +337,39 @@ def scrub_notebook_node(
     return nb, report
 
 
+def _read_notebook(path: Path) -> Any:
+    """Read a v4 notebook without nbformat's schema validation.
+
+    Scrubbing only touches a handful of fields, so the JSON is parsed directly
+    (orjson when available) and multi-line text is rejoined like nbformat does.
+    Other nbformat versions go through `nbformat.reads` for conversion.
+    """
+
+    data = path.read_bytes()
+    raw = None
+    if orjson is not None:
+        try:
+            raw = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            raw = None  # let the stdlib parser decide (e.g. NaN literals)
+    if raw is None:
+        raw = json.loads(data.decode("utf-8"))
+    if not isinstance(raw, dict) or raw.get("nbformat") != 4:
+        return nbformat.reads(data.decode("utf-8"), as_version=4)
+    return rejoin_lines(nbformat.from_dict(raw))
+
+
+def _write_notebook(nb: Any, path: Path) -> None:
+    """Write ``nb`` byte-for-byte as `nbformat.write` would, minus validation."""
+
+    nb = strip_transient(split_lines(nb))
+    text = json.dumps(nb, indent=1, sort_keys=True, separators=(",", ": "), ensure_ascii=False)
+    with path.open("w", encoding="utf-8") as f:
+        f.write(text)
+        if not text.endswith("\n"):
+            f.write("\n")
+
+
 def scrub_notebook_file(
     input_path: Path,
     output_path: Path,
@@ -240,17 +385,19 @@ def scrub_notebook_file(
     input_path = input_path.resolve()
     output_path = output_path.resolve()
 
-    with input_path.open("r", encoding="utf-8") as f:
-        nb = nbformat.read(f, as_version=4)
+    nb = _read_notebook(input_path)
 
-    nb, report = scrub_notebook_node(
-        nb,
-        clear_outputs=clear_outputs,
-        strip_execution_counts=strip_execution_counts,
-        remove_attachments=remove_attachments,
-        redact=redact,
-        strip_all_metadata=strip_all_metadata,
-    )
+    try:
+        nb, report = scrub_notebook_node(
+            nb,
+            clear_outputs=clear_outputs,
+            strip_execution_counts=strip_execution_counts,
+            remove_attachments=remove_attachments,
+            redact=redact,
+            strip_all_metadata=strip_all_metadata,
+        )
+    except ValueError as e:
+        raise ValueError(f"{input_path}: {e}") from e
 
     if inplace:
         output_path = input_path
@@ -260,8 +407,7 @@ def scrub_notebook_file(
         shutil.copy2(str(input_path), str(bak))
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as f:
-        nbformat.write(nb, f)
+    _write_notebook(nb, output_path)
 
     report.input_path = str(input_path)
     report.output_path = str(output_path)
@@ -272,15 +418,74 @@ def _default_output_path(input_path: Path) -> Path:
     return input_path.with_name(input_path.stem + ".scrubbed.ipynb")
 
 
+def _report_json(payload: Any) -> bytes:
+    """Serialize report(s) as indented JSON.
+
+    `ScrubReport` is flat, so its ``__dict__`` is used as-is rather than the
+    recursive copy `dataclasses.asdict` makes.
+    """
+
+    if isinstance(payload, ScrubReport):
+        payload = payload.__dict__
+    elif isinstance(payload, list):
+        payload = [r.__dict__ for r in payload]
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def _default_report_path(output_path: Path) -> Path:
+    return output_path.with_suffix(".scrub_report.json")
+
+
+def _expand_inputs(spec: str) -> List[Path]:
+    """Expand a notebook file, directory (recursive) or glob into input paths.
+
+    Directory scans skip checkpoints and previously scrubbed outputs.
+    """
+
+    path = Path(spec)
+    if path.is_file():
+        return [path]
+    if path.is_dir():
+        candidates: Iterable[Path] = path.rglob("*.ipynb")
+    else:
+        candidates = (Path(p) for p in glob.glob(spec, recursive=True))
+    return sorted(
+        p
+        for p in candidates
+        if p.is_file()
+        and p.suffix == ".ipynb"
+        and not p.name.endswith(".scrubbed.ipynb")
+        and ".ipynb_checkpoints" not in p.parts
+    )
+
+
+def _scrub_one(job: Tuple[Path, Path, Dict[str, Any]]) -> ScrubReport:
+    """Pool worker: scrub one notebook and write its per-notebook report."""
+
+    input_path, output_path, options = job
+    report = scrub_notebook_file(input_path, output_path, **options)
+    report_path = _default_report_path(Path(report.output_path))
+    report_path.write_bytes(_report_json(report))
+    return report
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser(
         description="Scrub a notebook for sharing (redact secrets, clear outputs)."
     )
-    parser.add_argument("notebook", help="Path to .ipynb file")
+    parser.add_argument(
+        "notebook",
+        help="Path to .ipynb file, or a directory / glob pattern to scrub many notebooks",
+    )
     parser.add_argument(
         "--out",
         default=None,
-        help="Output .ipynb path (default: <input>.scrubbed.ipynb). Ignored with --inplace.",
+        help=(
+            "Output .ipynb path (default: <input>.scrubbed.ipynb). With several inputs, an output "
+            "directory instead. Ignored with --inplace."
+        ),
     )
     parser.add_argument("--inplace", action="store_true", help="Modify the input file")
     parser.add_argument(
@@ -315,21 +520,21 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     parser.add_argument(
         "--report",
         default=None,
-        help="Optional JSON report path (default: <output>.scrub_report.json)",
+        help=(
+            "Optional JSON report path (default: <output>.scrub_report.json). With several inputs, "
+            "a combined list report in addition to the per-notebook ones."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes when scrubbing several notebooks (default: CPU count)",
     )
 
     args = parser.parse_args(list(argv) if argv is not None else None)
 
-    input_path = Path(args.notebook)
-    if not input_path.exists():
-        print(f"Error: notebook not found: {input_path}", file=sys.stderr)
-        return 2
-
-    output_path = Path(args.out) if args.out else _default_output_path(input_path)
-
-    report = scrub_notebook_file(
-        input_path,
-        output_path,
+    options: Dict[str, Any] = dict(
         inplace=bool(args.inplace),
         backup=bool(args.backup),
         clear_outputs=not bool(args.keep_outputs),
@@ -339,17 +544,65 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         strip_all_metadata=bool(args.strip_all_metadata),
     )
 
-    report_path = None
-    if args.report is not None:
-        report_path = Path(args.report)
-    else:
-        report_path = Path(report.output_path).with_suffix(".scrub_report.json")
+    input_path = Path(args.notebook)
+    if input_path.is_file():
+        output_path = Path(args.out) if args.out else _default_output_path(input_path)
+
+        try:
+            report = scrub_notebook_file(input_path, output_path, **options)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+
+        report_path = None
+        if args.report is not None:
+            report_path = Path(args.report)
+        else:
+            report_path = _default_report_path(Path(report.output_path))
+
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_bytes(_report_json(report))
+
+        print(f"Wrote: {report.output_path}")
+        print(f"Report: {report_path}")
+        return 0
+
+    inputs = _expand_inputs(args.notebook)
+    if not inputs:
+        print(f"Error: notebook not found: {input_path}", file=sys.stderr)
+        return 2
 
-    report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text(json.dumps(asdict(report), indent=2), encoding="utf-8")
+    # With --out, mirror the inputs' layout below their common folder.
+    outdir = Path(args.out) if args.out else None
+    base = Path(os.path.commonpath([str(p.resolve().parent) for p in inputs]))
+    jobs_list = [
+        (p, (outdir / p.resolve().relative_to(base)) if outdir is not None else _default_output_path(p), options)
+        for p in inputs
+    ]
 
-    print(f"Wrote: {report.output_path}")
-    print(f"Report: {report_path}")
+    # Each notebook is independent: fan out over processes so regex compilation
+    # and imports are paid once per worker rather than once per notebook.
+    workers = max(1, min(int(args.jobs or os.cpu_count() or 1), len(jobs_list)))
+    reports: List[ScrubReport] = []
+    try:
+        if workers == 1:
+            reports = [_scrub_one(job) for job in jobs_list]
+        else:
+            with Pool(workers) as pool:
+                reports = list(pool.imap_unordered(_scrub_one, jobs_list, chunksize=4))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    reports.sort(key=lambda r: r.input_path)
+
+    for report in reports:
+        print(f"Wrote: {report.output_path}")
+    if args.report is not None:
+        report_path = Path(args.report)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_bytes(_report_json(reports))
+        print(f"Report: {report_path}")
+    print(f"Scrubbed: {len(reports)} notebooks")
     return 0
 
 
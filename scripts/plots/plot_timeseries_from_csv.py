@@ -28,10 +28,18 @@ from __future__ import annotations
 
 import argparse
 import csv
+import itertools
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import pandas as pd
+except ImportError:  # optional speedup; falls back to per-value parsing
+    pd = None
+
+_DETECT_SAMPLE_ROWS = 50
+
 
 def _try_float(s: str) -> Optional[float]:
     try:
@@ -49,11 +57,24 @@ _DT_FORMATS = [
 ]
 
 
+# Last strptime format that matched; CSV columns are usually homogeneous, so
+# it is tried first on the next value.
+_last_dt_format: Optional[str] = None
+
+
 def _try_datetime(s: str) -> Optional[datetime]:
+    global _last_dt_format
+
     ss = s.strip()
     if not ss:
         return None
 
+    if _last_dt_format is not None:
+        try:
+            return datetime.strptime(ss, _last_dt_format)
+        except ValueError:
+            pass
+
     # ISO-ish (including trailing Z)
     try:
         iso = ss.replace("Z", "+00:00")
@@ -62,15 +83,21 @@ def _try_datetime(s: str) -> Optional[datetime]:
         pass
 
     for fmt in _DT_FORMATS:
+        if fmt == _last_dt_format:
+            continue
         try:
-            return datetime.strptime(ss, fmt)
+            parsed = datetime.strptime(ss, fmt)
         except Exception:
             continue
+        _last_dt_format = fmt
+        return parsed
 
     return None
 
 
-def _detect_numeric_columns(rows: list[dict[str, str]], *, exclude: set[str], sample: int = 50) -> list[str]:
+def _detect_numeric_columns(
+    rows: list[dict[str, str]], *, exclude: set[str], sample: int = _DETECT_SAMPLE_ROWS
+) -> list[str]:
     if not rows:
         return []
 
@@ -95,18 +122,9 @@ def _detect_numeric_columns(rows: list[dict[str, str]], *, exclude: set[str], sa
     return numeric
 
 
-def plot_timeseries_from_csv(
-    in_csv: Path,
-    out_path: Path,
-    *,
-    x_col: str,
-    y_cols: list[str],
-    encoding: str = "utf-8",
-    delimiter: str = ",",
-    title: str = "",
-    xlabel: str = "",
-    ylabel: str = "",
-) -> None:
+def _read_series_csv(
+    in_csv: Path, *, x_col: str, y_cols: list[str], encoding: str, delimiter: str
+) -> tuple[Any, str, dict[str, Any]]:
     with in_csv.open("r", encoding=encoding, newline="") as fh:
         reader = csv.DictReader(fh, delimiter=delimiter)
         if reader.fieldnames is None:
@@ -147,6 +165,98 @@ def plot_timeseries_from_csv(
             s = (r.get(k) or "").strip()
             series[k].append(_try_float(s) if s != "" else None)
 
+    return x_vals, x_kind, series
+
+
+def _parse_x_pandas(raw: "pd.Series") -> tuple[Any, str]:
+    """Vectorized x parsing with the same rules as the per-value path.
+
+    Datetime wins only if every value parses (one C pass per ``_DT_FORMATS``
+    entry, with a per-value `_try_datetime` fallback for ISO and mixed values),
+    then numbers, then row index.
+    """
+
+    stripped = raw.str.strip()
+    if len(stripped) and (stripped != "").all():
+        for fmt in _DT_FORMATS:
+            try:
+                dt = pd.to_datetime(stripped, format=fmt, errors="coerce")
+            except (TypeError, ValueError):
+                continue
+            if dt.notna().all():
+                return dt, "datetime"
+        parsed = [_try_datetime(v) for v in stripped]
+        if all(v is not None for v in parsed):
+            return pd.Series(parsed, index=raw.index, dtype=object), "datetime"
+
+    x_num = pd.to_numeric(stripped.where(stripped != ""), errors="coerce")
+    if x_num.notna().any():
+        return x_num, "number"
+    return pd.Series(range(len(raw)), index=raw.index), "index"
+
+
+def _load_frame(in_csv: Path, *, encoding: str, delimiter: str) -> "pd.DataFrame":
+    """Read the CSV as all-string columns (empty cells stay "", like DictReader)."""
+
+    try:
+        return pd.read_csv(in_csv, encoding=encoding, sep=delimiter, dtype=str, keep_default_na=False)
+    except pd.errors.EmptyDataError:
+        raise ValueError("CSV appears to have no header row") from None
+
+
+def _read_series_pandas(
+    in_csv: Path,
+    *,
+    x_col: str,
+    y_cols: list[str],
+    encoding: str,
+    delimiter: str,
+    frame: Optional["pd.DataFrame"] = None,
+) -> tuple[Any, str, dict[str, Any]]:
+    df = frame if frame is not None else _load_frame(in_csv, encoding=encoding, delimiter=delimiter)
+    header = list(df.columns)
+    if x_col not in header:
+        raise ValueError(f"x column '{x_col}' not found in CSV header")
+    for y in y_cols:
+        if y not in header:
+            raise ValueError(f"y column '{y}' not found in CSV header")
+
+    x_vals, x_kind = _parse_x_pandas(df[x_col])
+    series = {}
+    for k in y_cols:
+        values = df[k].str.strip()
+        series[k] = pd.to_numeric(values.where(values != ""), errors="coerce")
+    return x_vals, x_kind, series
+
+
+def plot_timeseries_from_csv(
+    in_csv: Path,
+    out_path: Path,
+    *,
+    x_col: str,
+    y_cols: list[str],
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    title: str = "",
+    xlabel: str = "",
+    ylabel: str = "",
+    frame: Optional["pd.DataFrame"] = None,
+) -> None:
+    """Plot ``y_cols`` against ``x_col`` and write the image to ``out_path``.
+
+    ``frame`` is an already-loaded all-string DataFrame of ``in_csv`` (as
+    `main` passes) so the file is not parsed twice; it requires pandas.
+    """
+
+    if pd is not None:
+        x_vals, x_kind, series = _read_series_pandas(
+            in_csv, x_col=x_col, y_cols=y_cols, encoding=encoding, delimiter=delimiter, frame=frame
+        )
+    else:
+        x_vals, x_kind, series = _read_series_csv(
+            in_csv, x_col=x_col, y_cols=y_cols, encoding=encoding, delimiter=delimiter
+        )
+
     # Import matplotlib only when needed; use Agg backend for headless environments.
     import matplotlib
 
@@ -156,6 +266,11 @@ def plot_timeseries_from_csv(
     plt.figure(figsize=(10, 5))
 
     for name, ys in series.items():
+        if pd is not None:
+            keep = x_vals.notna() & ys.notna()
+            if keep.any():
+                plt.plot(x_vals[keep].to_numpy(), ys[keep].to_numpy(), label=name)
+            continue
         xs_plot: list[Any] = []
         ys_plot: list[float] = []
         for x, y in zip(x_vals, ys):
@@ -210,13 +325,20 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     out_path = Path(args.out).resolve()
 
-    # Peek header + rows for y-col inference.
-    with in_path.open("r", encoding=args.encoding, newline="") as fh:
-        reader = csv.DictReader(fh, delimiter=args.delimiter)
-        if reader.fieldnames is None:
-            raise ValueError("CSV appears to have no header row")
-        header = list(reader.fieldnames)
-        rows = [row for row in reader]
+    # With pandas, parse the file once here and hand the frame to the plotter;
+    # otherwise peek only the header + the rows y-col inference samples.
+    frame = None
+    if pd is not None:
+        frame = _load_frame(in_path, encoding=args.encoding, delimiter=args.delimiter)
+        header = list(frame.columns)
+        rows = frame.head(_DETECT_SAMPLE_ROWS).to_dict("records")
+    else:
+        with in_path.open("r", encoding=args.encoding, newline="") as fh:
+            reader = csv.DictReader(fh, delimiter=args.delimiter)
+            if reader.fieldnames is None:
+                raise ValueError("CSV appears to have no header row")
+            header = list(reader.fieldnames)
+            rows = list(itertools.islice(reader, _DETECT_SAMPLE_ROWS))
 
     x_col = args.x_col or header[0]
 
@@ -238,6 +360,7 @@ def main(argv: Optional[list[str]] = None) -> int:
         title=args.title,
         xlabel=args.xlabel,
         ylabel=args.ylabel,
+        frame=frame,
     )
 
     print(f"Wrote: {out_path}")
@@ -7,7 +7,7 @@ find_duplicate_functions — detect exact duplicate function bodies across Pytho
 
 ## SYNOPSIS
 
-python find_duplicate_functions.py --root <dir> --out <dir>
+python find_duplicate_functions.py --root <dir> --out <dir> [--jobs N] [--no-cache]
 
 ## DESCRIPTION
 
@@ -16,6 +16,9 @@ function definitions, and hashes a normalized AST dump of each function body.
 
 It reports groups of identical hashes found in 2+ locations.
 
+Per-file results are cached in `<out>/.cache.sqlite` keyed by path, mtime and
+size, so repeat runs only re-parse files that changed.
+
 Outputs:
 - JSON report
 - Markdown report
@@ -31,28 +34,49 @@ import argparse
 import ast
 import hashlib
 import json
+import os
+import sqlite3
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+_SKIP_DIRS = {".git", "__pycache__", ".venv", "venv", "site-packages"}
+
+
 def iter_py_files(root: Path) -> Iterable[Path]:
     if root.is_file() and root.suffix.lower() == ".py":
         yield root
         return
-    for p in root.rglob("*.py"):
-        if not p.is_file():
-            continue
-        # skip common bulky dirs
-        parts = {x.lower() for x in p.parts}
-        if any(x in parts for x in (".git", "__pycache__", ".venv", "venv", "site-packages")):
+    # os.scandir reuses the d_type from readdir, so most entries need no stat;
+    # bulky dirs are pruned before descending. Symlinked dirs are not followed.
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
             continue
-        yield p
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name.lower() not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        yield Path(entry.path)
+                except OSError:
+                    continue
 
 
 def normalized_ast_dump(node: ast.AST) -> str:
@@ -68,18 +92,21 @@ def normalized_ast_dump(node: ast.AST) -> str:
 
 
 def hash_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    # Equality fingerprint only (not a checksum): 128-bit BLAKE2b is ample and faster than SHA-256.
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def extract_functions(path: Path) -> list[dict]:
     try:
-        src = path.read_text(encoding="utf-8")
+        src = path.read_bytes()
     except Exception:
         return []
 
+    # Parse the raw bytes: the compiler decodes them itself (PEP 263 cookie or
+    # UTF-8/BOM), so there is no separate decode + re-encode of the source.
     try:
-        mod = ast.parse(src)
-    except SyntaxError:
+        mod = compile(src, str(path), "exec", flags=ast.PyCF_ONLY_AST)
+    except (SyntaxError, ValueError):
         return []
 
     funcs: list[dict] = []
@@ -96,31 +123,123 @@ def extract_functions(path: Path) -> list[dict]:
     return funcs
 
 
-def write_markdown(dupes: list[dict], out_path: Path) -> None:
-    lines: list[str] = []
-    lines.append("# Duplicate functions report")
-    lines.append("")
-    lines.append(f"> Generated at (UTC): `{utc_now_iso()}`")
-    lines.append("")
-    lines.append(f"Duplicate groups: **{len(dupes)}**")
-    lines.append("")
-
-    for g in dupes:
-        lines.append(f"## {g['function_hash']}")
-        lines.append("")
-        for occ in g["occurrences"]:
-            lines.append(f"- `{occ['path']}`:{occ.get('lineno') or '-'} — `{occ['name']}`")
-        lines.append("")
-
-    lines.append("---")
-    lines.append("")
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+class ExtractionCache:
+    """Per-file extraction results in SQLite, reused while a file's (mtime_ns, size) is unchanged."""
+
+    def __init__(self, db_path: Path, table: str) -> None:
+        self.table = table
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, payload TEXT)"
+        )
+
+    def get(self, path: Path, st: os.stat_result) -> list[dict] | None:
+        row = self.conn.execute(
+            f"SELECT mtime_ns, size, payload FROM {self.table} WHERE path = ?", (str(path),)
+        ).fetchone()
+        if row is None or row[0] != st.st_mtime_ns or row[1] != st.st_size:
+            return None
+        return json.loads(row[2])
+
+    def put(self, path: Path, st: os.stat_result, funcs: list[dict]) -> None:
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?)",
+            (str(path), st.st_mtime_ns, st.st_size, json.dumps(funcs)),
+        )
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+
+def _extract_with_rel(item: tuple[Path, str]) -> tuple[str, list[dict]]:
+    """Process-pool worker: extract one file's functions, tagged with its relative path."""
+
+    path, rel = item
+    return rel, extract_functions(path)
+
+
+def extract_all(
+    items: list[tuple[Path, str]], *, jobs: int, cache: ExtractionCache | None = None
+) -> Iterable[tuple[str, list[dict]]]:
+    """Extract functions from every ``(abs_path, rel_path)`` in input order.
+
+    Parsing, normalizing and hashing are CPU-bound, so with ``jobs > 1`` files
+    are spread over worker processes (outside the GIL). With a ``cache``, only
+    files whose mtime/size changed since the last run are parsed.
+    """
+
+    results: list[tuple[str, list[dict]] | None] = [None] * len(items)
+    stats: dict[int, os.stat_result] = {}
+    todo: list[int] = []
+    for i, (path, rel) in enumerate(items):
+        if cache is not None:
+            try:
+                stats[i] = path.stat()
+            except OSError:
+                pass
+            else:
+                hit = cache.get(path, stats[i])
+                if hit is not None:
+                    results[i] = (rel, hit)
+                    continue
+        todo.append(i)
+
+    workers = max(1, min(jobs, len(todo)))
+    if workers == 1:
+        extracted = [_extract_with_rel(items[i]) for i in todo]
+    else:
+        chunksize = max(8, len(todo) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            extracted = list(executor.map(_extract_with_rel, [items[i] for i in todo], chunksize=chunksize))
+
+    for i, res in zip(todo, extracted):
+        results[i] = res
+        if cache is not None and i in stats:
+            cache.put(items[i][0], stats[i], res[1])
+    return results
+
+
+def report_json(payload: dict) -> bytes:
+    """Indented JSON report (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def write_markdown(dupes: list[dict], out_path: Path, generated_at: str | None = None) -> None:
+    # Stream straight to the file: the group list is unbounded on big repos.
+    with out_path.open("w", encoding="utf-8") as fh:
+        w = fh.write
+        w("# Duplicate functions report\n\n")
+        w(f"> Generated at (UTC): `{generated_at or utc_now_iso()}`\n\n")
+        w(f"Duplicate groups: **{len(dupes)}**\n\n")
+
+        for g in dupes:
+            w(f"## {g['function_hash']}\n\n")
+            for occ in g["occurrences"]:
+                w(f"- `{occ['path']}`:{occ.get('lineno') or '-'} — `{occ['name']}`\n")
+            w("\n")
+
+        w("---\n")
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Find exact duplicate Python functions across a directory")
     parser.add_argument("--root", required=True, help="Root directory to scan")
     parser.add_argument("--out", required=True, help="Output directory")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for parsing files (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every file instead of reusing <out>/.cache.sqlite from earlier runs",
+    )
 
     args = parser.parse_args()
 
@@ -134,9 +253,15 @@ def main() -> int:
 
     func_index: dict[str, list[dict]] = defaultdict(list)
 
-    for fp in sorted(iter_py_files(root)):
-        rel = str(fp.relative_to(root)).replace("\\", "/")
-        for f in extract_functions(fp):
+    items = [(fp, str(fp.relative_to(root)).replace("\\", "/")) for fp in sorted(iter_py_files(root))]
+    cache = None if args.no_cache else ExtractionCache(out_dir / ".cache.sqlite", "duplicate_functions_v3")
+    try:
+        extracted = extract_all(items, jobs=args.jobs, cache=cache)
+    finally:
+        if cache is not None:
+            cache.close()
+    for rel, funcs in extracted:
+        for f in funcs:
             func_index[f["hash"]].append({"path": rel, "name": f["name"], "lineno": f.get("lineno")})
 
     dupes: list[dict] = []
@@ -146,8 +271,9 @@ def main() -> int:
 
     dupes.sort(key=lambda d: len(d["occurrences"]), reverse=True)
 
+    generated_at = utc_now_iso()  # shared by the JSON and markdown reports
     payload = {
-        "generated_at_utc": utc_now_iso(),
+        "generated_at_utc": generated_at,
         "root": str(root),
         "duplicate_groups": len(dupes),
         "groups": dupes,
@@ -156,8 +282,8 @@ def main() -> int:
     json_out = out_dir / "duplicate_functions_report.json"
     md_out = out_dir / "duplicate_functions_report.md"
 
-    json_out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    write_markdown(dupes, md_out)
+    json_out.write_bytes(report_json(payload))
+    write_markdown(dupes, md_out, generated_at)
 
     print(f"Wrote: {json_out}")
     print(f"Wrote: {md_out}")
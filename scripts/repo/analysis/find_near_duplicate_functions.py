@@ -7,12 +7,26 @@ find_near_duplicate_functions — detect near-duplicate Python functions (AST-no
 
 ## SYNOPSIS
 
-python find_near_duplicate_functions.py --root <dir> --out <dir> [--threshold 0.75]
+python find_near_duplicate_functions.py --root <dir> --out <dir> [--threshold 0.75] [--method difflib|tokens|minhash] [--simhash-distance K] [--no-cache]
 
 ## DESCRIPTION
 
 Parses Python files under a root directory, extracts top-level functions, and
-compares normalized AST dumps using difflib similarity.
+compares normalized AST dumps using difflib similarity (or rapidfuzz's Indel
+similarity when rapidfuzz is installed, which is much faster).
+`--simhash-distance K` prefilters those comparisons to pairs whose 64-bit
+SimHashes are within Hamming distance K.
+
+`--method tokens` runs the same comparison over a compact token stream (one
+code point per AST node type, placeholder or constant), which is several times
+shorter than the dump text and therefore much cheaper to compare.
+
+`--method minhash` instead estimates the Jaccard similarity of token shingles
+with MinHash signatures and only compares pairs that share an LSH band, which
+scales to repos with thousands of functions (requires numpy).
+
+Per-file normalized dumps are cached in `<out>/.cache.sqlite` keyed by path,
+mtime and size, so repeat runs only re-parse files that changed.
 
 This is intended to highlight refactoring candidates (same logic with small edits).
 
@@ -29,7 +43,12 @@ from __future__ import annotations
 
 import argparse
 import ast
+import hashlib
 import json
+import os
+import re
+import sqlite3
+import zlib
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -37,35 +56,71 @@ from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Iterable
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional speedup
+    np = None
+
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:  # optional speedup
+    Indel = None
+
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+_SKIP_DIRS = {".git", "__pycache__", ".venv", "venv", "site-packages"}
+
+
 def iter_py_files(root: Path) -> Iterable[Path]:
     if root.is_file() and root.suffix.lower() == ".py":
         yield root
         return
-    for p in root.rglob("*.py"):
-        if not p.is_file():
-            continue
-        parts = {x.lower() for x in p.parts}
-        if any(x in parts for x in (".git", "__pycache__", ".venv", "venv", "site-packages")):
+    # os.scandir reuses the d_type from readdir, so most entries need no stat;
+    # bulky dirs are pruned before descending. Symlinked dirs are not followed.
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
             continue
-        yield p
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name.lower() not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        yield Path(entry.path)
+                except OSError:
+                    continue
 
 
-def normalized_function_body_dump(node: ast.AST) -> str | None:
-    """Name-agnostic normalized AST dump for a function node."""
+def normalized_function_body_dump(node: ast.AST, *, inplace: bool = False) -> str | None:
+    """Name-agnostic normalized AST dump for a function node.
+
+    With ``inplace=True`` the node itself is renamed instead of a deep copy
+    (for throwaway trees, like a freshly parsed module).
+    """
     import copy
 
     if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
         return None
 
-    try:
-        n = copy.deepcopy(node)
-    except Exception:
-        return None
+    if inplace:
+        n = node
+    else:
+        try:
+            n = copy.deepcopy(node)
+        except Exception:
+            return None
 
     # normalize function name
     n.name = "FUNC"
@@ -89,6 +144,8 @@ def normalized_function_body_dump(node: ast.AST) -> str | None:
     name_map: dict[str, str] = {}
     counter = 0
 
+    # One walk renames names and args. Line/column attributes need no
+    # stripping: ast.dump(include_attributes=False) never emits them.
     for t in ast.walk(n):
         if isinstance(t, ast.Name):
             ident = t.id
@@ -102,94 +159,151 @@ def normalized_function_body_dump(node: ast.AST) -> str | None:
                 counter += 1
             t.id = name_map[ident]
 
-        if isinstance(t, ast.arg):
+        elif isinstance(t, ast.arg):
             if t.arg in arg_map:
                 t.arg = arg_map[t.arg]
 
-    # strip line numbers
-    for t in ast.walk(n):
-        for attr in ("lineno", "col_offset", "end_lineno", "end_col_offset"):
-            if hasattr(t, attr):
-                try:
-                    setattr(t, attr, None)
-                except Exception:
-                    pass
-
     try:
         return ast.dump(n, include_attributes=False)
     except Exception:
         return None
 
 
-def collect_functions(root: Path) -> list[dict]:
+class ExtractionCache:
+    """Per-file extraction results in SQLite, reused while a file's (mtime_ns, size) is unchanged."""
+
+    def __init__(self, db_path: Path, table: str) -> None:
+        self.table = table
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, payload TEXT)"
+        )
+
+    def get(self, path: Path, st: os.stat_result) -> list[dict] | None:
+        row = self.conn.execute(
+            f"SELECT mtime_ns, size, payload FROM {self.table} WHERE path = ?", (str(path),)
+        ).fetchone()
+        if row is None or row[0] != st.st_mtime_ns or row[1] != st.st_size:
+            return None
+        return json.loads(row[2])
+
+    def put(self, path: Path, st: os.stat_result, funcs: list[dict]) -> None:
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?)",
+            (str(path), st.st_mtime_ns, st.st_size, json.dumps(funcs)),
+        )
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+
+def _extract_file(fp: Path) -> list[dict]:
+    try:
+        # compile() decodes the bytes itself (PEP 263 cookie or UTF-8/BOM).
+        mod = compile(fp.read_bytes(), str(fp), "exec", flags=ast.PyCF_ONLY_AST)
+    except Exception:
+        return []
+
+    out: list[dict] = []
+    for node in mod.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            # The module is discarded after this loop, so normalize in place
+            # (read name/lineno first; normalization renames the node).
+            name, lineno = node.name, getattr(node, "lineno", None)
+            nd = normalized_function_body_dump(node, inplace=True)
+            if not nd:
+                continue
+            out.append({"name": name, "lineno": lineno, "normalized_dump": nd})
+    return out
+
+
+def collect_functions(root: Path, *, cache: ExtractionCache | None = None) -> list[dict]:
     out: list[dict] = []
     for fp in sorted(iter_py_files(root)):
         rel = str(fp.relative_to(root)).replace("\\", "/")
-        try:
-            src = fp.read_text(encoding="utf-8")
-            mod = ast.parse(src)
-        except Exception:
-            continue
-
-        for node in mod.body:
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                nd = normalized_function_body_dump(node)
-                if not nd:
-                    continue
-                out.append({"path": rel, "name": node.name, "lineno": getattr(node, "lineno", None), "normalized_dump": nd})
+        funcs = None
+        st = None
+        if cache is not None:
+            try:
+                st = fp.stat()
+            except OSError:
+                pass
+            else:
+                funcs = cache.get(fp, st)
+        if funcs is None:
+            funcs = _extract_file(fp)
+            if st is not None:
+                cache.put(fp, st, funcs)
+        out.extend({"path": rel, **f} for f in funcs)
 
     return out
 
 
-def bucket_key(s: str) -> int:
-    return len(s) // 120
+def bucket_key(s: str, width: int = 120) -> int:
+    return len(s) // width
 
 
-def write_markdown(pairs: list[dict], threshold: float, out_path: Path) -> None:
-    lines: list[str] = []
-    lines.append("# Near-duplicate functions report")
-    lines.append("")
-    lines.append(f"> Generated at (UTC): `{utc_now_iso()}`")
-    lines.append("")
-    lines.append(f"> Similarity threshold: **{threshold}**")
-    lines.append("")
-    lines.append(f"Pairs found: **{len(pairs)}**")
-    lines.append("")
+def similarity(a: str, b: str, threshold: float) -> float:
+    """Return the similarity of two dumps (0.0 when below threshold with rapidfuzz).
 
-    for p in pairs[:200]:
-        a = p["a"]; b = p["b"]; r = p["ratio"]
-        lines.append(f"- {r:.2f}: `{a['path']}`:{a.get('lineno') or '-'} `{a['name']}`  <=>  `{b['path']}`:{b.get('lineno') or '-'} `{b['name']}`")
+    With rapidfuzz installed this is the Indel normalized similarity, computed
+    in C++ with an early exit once `threshold` is out of reach; otherwise it is
+    difflib's SequenceMatcher ratio.
+    """
 
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+    if Indel is not None:
+        return Indel.normalized_similarity(a, b, score_cutoff=threshold)
+    return SequenceMatcher(None, a, b).ratio()
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Find near-duplicate Python functions (AST-normalized fuzzy matching)")
-    parser.add_argument("--root", required=True, help="Root directory to scan")
-    parser.add_argument("--out", required=True, help="Output directory")
-    parser.add_argument("--threshold", type=float, default=0.75, help="Similarity threshold")
+def _within_length_window(
+    a: dict, b: dict, key: str = "normalized_dump", width: int = 120, threshold: float = 0.0
+) -> bool:
+    la = len(a[key])
+    lb = len(b[key])
+    if abs(la - lb) > max(width, min(la, lb) * 0.35):
+        return False
+    # Any ratio is at most 2*min/(la+lb), so long/short pairs can be rejected on length alone.
+    return la + lb == 0 or 2.0 * min(la, lb) / (la + lb) >= threshold
 
-    args = parser.parse_args()
 
-    root = Path(args.root).resolve()
-    out_dir = Path(args.out).resolve()
-
-    if not root.exists():
-        raise SystemExit(f"Root not found: {root}")
+def find_pairs_difflib(
+    funcs: list[dict],
+    threshold: float,
+    *,
+    simhash_distance: int | None = None,
+    key: str = "normalized_dump",
+    width: int = 120,
+) -> list[dict]:
+    """Compare length-bucketed candidates with `similarity`.
 
-    out_dir.mkdir(parents=True, exist_ok=True)
+    ``key`` names the sequence that is compared (the normalized dump by
+    default) and ``width`` is its length-bucket size. With ``simhash_distance`` set, candidates instead come from a
+    SimHash index and only pairs within that Hamming distance are scored.
+    """
 
-    funcs = collect_functions(root)
+    if simhash_distance is not None:
+        hashes = simhash_signatures([f["normalized_dump"] for f in funcs])
+        pairs: list[dict] = []
+        for i, j in sorted(_simhash_candidates(hashes, simhash_distance)):
+            a, b = funcs[i], funcs[j]
+            if a["path"] == b["path"] and a.get("lineno") == b.get("lineno"):
+                continue
+            if not _within_length_window(a, b, key, width, threshold):
+                continue
+            r = similarity(a[key], b[key], threshold)
+            if r >= threshold:
+                pairs.append({"a": a, "b": b, "ratio": r})
+        return pairs
 
     # bucket by dump length
     buckets: dict[int, list[dict]] = defaultdict(list)
     for f in funcs:
-        buckets[bucket_key(f["normalized_dump"])].append(f)
+        buckets[bucket_key(f[key], width)].append(f)
 
-    pairs: list[dict] = []
+    pairs = []
     keys = sorted(buckets.keys())
     for k in keys:
         candidates = buckets[k] + buckets.get(k - 1, []) + buckets.get(k + 1, [])
@@ -201,21 +315,313 @@ def main() -> int:
                 if a["path"] == b["path"] and a.get("lineno") == b.get("lineno"):
                     continue
 
-                la = len(a["normalized_dump"])
-                lb = len(b["normalized_dump"])
-                if abs(la - lb) > max(120, min(la, lb) * 0.35):
+                if not _within_length_window(a, b, key, width, threshold):
                     continue
 
-                r = SequenceMatcher(None, a["normalized_dump"], b["normalized_dump"]).ratio()
-                if r >= args.threshold:
+                r = similarity(a[key], b[key], threshold)
+                if r >= threshold:
                     pairs.append({"a": a, "b": b, "ratio": r})
+    return pairs
+
+
+# Significant parts of an ast.dump: quoted constants, then bare words (node
+# types, placeholders, numbers). Field names ("id=") and punctuation are skipped.
+_DUMP_TOKEN = re.compile(r"""\w+=|'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|[\w.+-]+""")
+
+
+# Token streams run ~15x shorter than dump text; scale the 120-char buckets to match.
+_TOKEN_BUCKET_WIDTH = 8
+
+
+def token_stream(dump: str, vocab: dict[str, int]) -> str:
+    """Re-encode a normalized dump as one code point per significant token.
+
+    Tokens get ids from ``vocab`` (shared across all functions being
+    compared), so the similarity scorers see sequences several times shorter
+    than the dump text, without repr/field-name noise.
+    """
+
+    out: list[str] = []
+    for tok in _DUMP_TOKEN.findall(dump):
+        if tok.endswith("="):
+            continue
+        tid = vocab.setdefault(tok, len(vocab))
+        out.append(chr(tid if tid < 0xD800 else tid + 0x800))  # skip surrogates
+    return "".join(out)
+
+
+def find_pairs_tokens(funcs: list[dict], threshold: float, *, simhash_distance: int | None = None) -> list[dict]:
+    """`find_pairs_difflib` over `token_stream` sequences instead of dump text."""
+
+    vocab: dict[str, int] = {}
+    keyed = [dict(f, tokens=token_stream(f["normalized_dump"], vocab)) for f in funcs]
+    orig = {id(k): f for k, f in zip(keyed, funcs)}
+    pairs = find_pairs_difflib(
+        keyed, threshold, simhash_distance=simhash_distance, key="tokens", width=_TOKEN_BUCKET_WIDTH
+    )
+    return [{"a": orig[id(p["a"])], "b": orig[id(p["b"])], "ratio": p["ratio"]} for p in pairs]
+
+
+_TOKEN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|\d+|\S")
+_SHINGLE_SIZE = 5
+_MERSENNE_61 = (1 << 61) - 1
+
+
+def _shingles(dump: str) -> set[str]:
+    """Distinct token 5-grams of a normalized dump."""
+
+    tokens = _TOKEN.findall(dump)
+    k = min(_SHINGLE_SIZE, len(tokens)) or 1
+    n = max(1, len(tokens) - k + 1)
+    return {" ".join(tokens[i : i + k]) for i in range(n)}
+
+
+def _shingle_hashes(dump: str) -> list[int]:
+    """32-bit hashes of the distinct token 5-grams of a normalized dump."""
+
+    return sorted({zlib.crc32(sh.encode("utf-8")) for sh in _shingles(dump)})
+
+
+def simhash64(dump: str) -> int:
+    """64-bit SimHash of a normalized dump's token 5-grams."""
+
+    weights = [0] * 64
+    for sh in _shingles(dump):
+        h = int.from_bytes(hashlib.blake2b(sh.encode("utf-8"), digest_size=8).digest(), "little")
+        for bit in range(64):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+    return sum(1 << bit for bit, w in enumerate(weights) if w > 0)
+
+
+def simhash_signatures(dumps: list[str]) -> list[int]:
+    """`simhash64` for many dumps; the bit tally is vectorized when numpy is available."""
+
+    if np is None:
+        return [simhash64(d) for d in dumps]
+    out: list[int] = []
+    for dump in dumps:
+        digests = b"".join(hashlib.blake2b(sh.encode("utf-8"), digest_size=8).digest() for sh in _shingles(dump))
+        bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+        keep = 2 * bits.sum(axis=0, dtype=np.int64) > len(bits)  # more 1s than 0s in that position
+        out.append(int.from_bytes(np.packbits(keep, bitorder="little").tobytes(), "little"))
+    return out
+
+
+def _popcount(x: int) -> int:
+    return x.bit_count() if hasattr(x, "bit_count") else bin(x).count("1")
+
+
+_POPCOUNT8 = None
+
+
+def _popcount_u64(x):
+    """Per-element popcount of a uint64 array (np.bitwise_count on numpy >= 2)."""
+
+    global _POPCOUNT8
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(x)
+    if _POPCOUNT8 is None:
+        _POPCOUNT8 = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+    return _POPCOUNT8[x.view(np.uint8).reshape(-1, 8)].sum(axis=1)
+
+
+def _simhash_candidates(hashes: list[int], max_distance: int) -> set[tuple[int, int]]:
+    """Index pairs whose SimHashes differ in at most ``max_distance`` bits.
+
+    The 64 bits are split into ``max_distance + 1`` blocks; by pigeonhole, any
+    two hashes within the distance agree exactly on at least one block, so
+    only functions sharing a block value are ever popcounted.
+    """
+
+    blocks = min(64, max_distance + 1)
+    bounds = [64 * b // blocks for b in range(blocks + 1)]
+    if np is not None:
+        return _simhash_candidates_np(hashes, max_distance, bounds)
+    out: set[tuple[int, int]] = set()
+    for lo, hi in zip(bounds, bounds[1:]):
+        mask = (1 << (hi - lo)) - 1
+        index: dict[int, list[int]] = defaultdict(list)
+        for i, h in enumerate(hashes):
+            index[(h >> lo) & mask].append(i)
+        for members in index.values():
+            for x in range(len(members)):
+                for y in range(x + 1, len(members)):
+                    i, j = members[x], members[y]
+                    if (i, j) not in out and _popcount(hashes[i] ^ hashes[j]) <= max_distance:
+                        out.add((i, j))
+    return out
+
+
+def _simhash_candidates_np(hashes: list[int], max_distance: int, bounds: list[int]) -> set[tuple[int, int]]:
+    """numpy form of `_simhash_candidates`: block collisions are grouped with a
+    stable sort and all colliding pairs are popcounted in one vectorized pass."""
+
+    h = np.array(hashes, dtype=np.uint64)
+    ii: list = []
+    jj: list = []
+    for lo, hi in zip(bounds, bounds[1:]):
+        key = (h >> np.uint64(lo)) & np.uint64((1 << (hi - lo)) - 1)
+        order = np.argsort(key, kind="stable")
+        sk = key[order]
+        starts = np.flatnonzero(np.r_[True, sk[1:] != sk[:-1]])
+        ends = np.r_[starts[1:], len(sk)]
+        for a, b in zip(starts[ends - starts > 1], ends[ends - starts > 1]):
+            x, y = np.triu_indices(b - a, 1)
+            ii.append(order[a:b][x])  # stable sort keeps members ascending, so i < j
+            jj.append(order[a:b][y])
+    if not ii:
+        return set()
+    i = np.concatenate(ii)
+    j = np.concatenate(jj)
+    close = _popcount_u64(h[i] ^ h[j]) <= max_distance
+    codes = np.unique(i[close].astype(np.int64) * len(h) + j[close])
+    return {(int(c // len(h)), int(c % len(h))) for c in codes}
+
+
+def minhash_signatures(dumps: list[str], *, num_perm: int = 128, seed: int = 1):
+    """MinHash signature matrix of shape ``(len(dumps), num_perm)``.
+
+    Uses the universal hash family ``(a*x + b) mod (2**61 - 1)``; products of
+    32-bit values stay within uint64.
+    """
+
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+    sigs = np.empty((len(dumps), num_perm), dtype=np.uint64)
+    for i, dump in enumerate(dumps):
+        h = np.asarray(_shingle_hashes(dump), dtype=np.uint64)
+        sigs[i] = ((h[:, None] * a + b) % np.uint64(_MERSENNE_61)).min(axis=0)
+    return sigs
+
+
+def _lsh_rows_per_band(threshold: float, num_perm: int) -> int:
+    """Widest band whose LSH threshold ``(1/bands)**(1/rows)`` is still <= ``threshold``."""
+
+    best = 1
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows == 0 and (1.0 / (num_perm // rows)) ** (1.0 / rows) <= threshold:
+            best = rows
+    return best
+
+
+def find_pairs_minhash(funcs: list[dict], threshold: float, *, num_perm: int = 128) -> list[dict]:
+    """Report pairs whose estimated shingle Jaccard similarity meets ``threshold``.
+
+    Signatures are banded into an LSH index, so only functions that collide
+    in at least one band are ever compared.
+    """
+
+    if len(funcs) < 2:
+        return []
+    sigs = minhash_signatures([f["normalized_dump"] for f in funcs], num_perm=num_perm)
+    rows = _lsh_rows_per_band(threshold, num_perm)
+
+    candidates: set[tuple[int, int]] = set()
+    for start in range(0, num_perm, rows):
+        index: dict[bytes, list[int]] = defaultdict(list)
+        for i, band in enumerate(sigs[:, start : start + rows]):
+            index[band.tobytes()].append(i)
+        for members in index.values():
+            for x in range(len(members)):
+                for y in range(x + 1, len(members)):
+                    candidates.add((members[x], members[y]))
+
+    pairs: list[dict] = []
+    for i, j in sorted(candidates):
+        a, b = funcs[i], funcs[j]
+        if a["path"] == b["path"] and a.get("lineno") == b.get("lineno"):
+            continue
+        r = float((sigs[i] == sigs[j]).mean())
+        if r >= threshold:
+            pairs.append({"a": a, "b": b, "ratio": r})
+    return pairs
+
+
+def report_json(payload: dict) -> bytes:
+    """Indented JSON report (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def write_markdown(pairs: list[dict], threshold: float, out_path: Path, generated_at: str | None = None) -> None:
+    with out_path.open("w", encoding="utf-8") as fh:
+        w = fh.write
+        w("# Near-duplicate functions report\n\n")
+        w(f"> Generated at (UTC): `{generated_at or utc_now_iso()}`\n\n")
+        w(f"> Similarity threshold: **{threshold}**\n\n")
+        w(f"Pairs found: **{len(pairs)}**\n\n")
+
+        for p in pairs[:200]:
+            a = p["a"]; b = p["b"]; r = p["ratio"]
+            w(f"- {r:.2f}: `{a['path']}`:{a.get('lineno') or '-'} `{a['name']}`  <=>  `{b['path']}`:{b.get('lineno') or '-'} `{b['name']}`\n")
+
+        w("\n---\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Find near-duplicate Python functions (AST-normalized fuzzy matching)")
+    parser.add_argument("--root", required=True, help="Root directory to scan")
+    parser.add_argument("--out", required=True, help="Output directory")
+    parser.add_argument("--threshold", type=float, default=0.75, help="Similarity threshold")
+    parser.add_argument(
+        "--method",
+        choices=["difflib", "tokens", "minhash"],
+        default="difflib",
+        help=(
+            "difflib: exact ratio on length-bucketed pairs; tokens: same, over compact AST token streams; "
+            "minhash: LSH-indexed shingle Jaccard (fast, needs numpy)"
+        ),
+    )
+    parser.add_argument(
+        "--simhash-distance",
+        type=int,
+        default=None,
+        metavar="K",
+        help="difflib/tokens methods only: score just the pairs whose 64-bit SimHashes differ in <= K bits (fast prefilter, may miss pairs)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every file instead of reusing <out>/.cache.sqlite from earlier runs",
+    )
+
+    args = parser.parse_args()
+
+    root = Path(args.root).resolve()
+    out_dir = Path(args.out).resolve()
+
+    if not root.exists():
+        raise SystemExit(f"Root not found: {root}")
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    cache = None if args.no_cache else ExtractionCache(out_dir / ".cache.sqlite", "near_duplicate_functions_v2")
+    try:
+        funcs = collect_functions(root, cache=cache)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    if args.method == "minhash":
+        pairs = find_pairs_minhash(funcs, args.threshold)
+    elif args.method == "tokens":
+        pairs = find_pairs_tokens(funcs, args.threshold, simhash_distance=args.simhash_distance)
+    else:
+        pairs = find_pairs_difflib(funcs, args.threshold, simhash_distance=args.simhash_distance)
 
     pairs.sort(key=lambda x: x["ratio"], reverse=True)
 
+    generated_at = utc_now_iso()  # shared by the JSON and markdown reports
     payload = {
-        "generated_at_utc": utc_now_iso(),
+        "generated_at_utc": generated_at,
         "root": str(root),
         "threshold": args.threshold,
+        "method": args.method,
+        "simhash_distance": args.simhash_distance,
         "pairs_found": len(pairs),
         "pairs": pairs[:500],
     }
@@ -223,8 +629,8 @@ def main() -> int:
     json_out = out_dir / "near_duplicate_functions_report.json"
     md_out = out_dir / "near_duplicate_functions_report.md"
 
-    json_out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    write_markdown(pairs, args.threshold, md_out)
+    json_out.write_bytes(report_json(payload))
+    write_markdown(pairs, args.threshold, md_out, generated_at)
 
     print(f"Wrote: {json_out}")
     print(f"Wrote: {md_out}")
@@ -9,9 +9,14 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+def _utc_now(now: Optional[datetime] = None) -> str:
+    return (now or datetime.now(timezone.utc)).isoformat().replace("+00:00", "Z")
 
 
 def _run(cmd: Sequence[str], cwd: Path) -> Tuple[int, str, str]:
@@ -38,6 +43,40 @@ def _git_check_ignore(repo_root: Path, rel_path: str) -> Optional[bool]:
     return None
 
 
+def _git_check_ignore_many(repo_root: Path, rel_paths: List[str]) -> List[Optional[bool]]:
+    """Batch form of `_git_check_ignore`: one `git check-ignore --stdin` for all paths.
+
+    Falls back to per-path calls if the batch run fails (e.g. a path outside
+    the repo makes git abort the whole batch).
+    """
+    if not rel_paths:
+        return []
+    try:
+        p = subprocess.run(
+            ["git", "check-ignore", "--stdin", "-z", "-n", "-v"],
+            cwd=str(repo_root),
+            input="\0".join(rel_paths).encode("utf-8") + b"\0",
+            capture_output=True,
+            check=False,
+        )
+        rc, out = int(p.returncode), p.stdout
+    except Exception:
+        rc, out = 999, b""
+
+    # -z -v records: <source> NUL <linenum> NUL <pattern> NUL <pathname> NUL
+    fields = out.split(b"\0")[:-1] if rc in (0, 1) else []
+    if len(fields) != 4 * len(rel_paths):
+        return [_git_check_ignore(repo_root, rel) for rel in rel_paths]
+    # -n reports unmatched paths with an empty source; a "!" pattern re-includes the path.
+    return [bool(fields[i]) and not fields[i + 2].startswith(b"!") for i in range(0, len(fields), 4)]
+
+
+def _report_json(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+
+
 def _render_md(payload: Dict[str, Any]) -> str:
     c = payload.get("checks", {})
     lines = [
@@ -84,8 +123,7 @@ def audit_repo_health(
             flagged.append(p)
 
     ignore_viol = []
-    for rel in expect_ignored:
-        ok = _git_check_ignore(repo_root, rel)
+    for rel, ok in zip(expect_ignored, _git_check_ignore_many(repo_root, expect_ignored)):
         if ok is False:
             ignore_viol.append(rel)
 
@@ -114,8 +152,9 @@ def main(argv: Optional[List[str]] = None) -> int:
         expect_ignored=list(args.expect_ignored or []),
     )
 
+    now = datetime.now(timezone.utc)  # one instant for the payload and the file stem
     payload = {
-        "created_at_utc": _utc_now(),
+        "created_at_utc": _utc_now(now),
         "repo_root": str(repo_root),
         "checks": checks,
     }
@@ -126,10 +165,10 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     out_dir = args.out_dir.resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
-    stem = datetime.now(timezone.utc).strftime("repo_health_snapshot_%Y%m%dT%H%M%SZ")
+    stem = now.strftime("repo_health_snapshot_%Y%m%dT%H%M%SZ")
     json_path = out_dir / f"{stem}.json"
     md_path = out_dir / f"{stem}.md"
-    json_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    json_path.write_bytes(_report_json(payload))
     md_path.write_text(_render_md(payload), encoding="utf-8")
     print(f"Wrote: {json_path}")
     print(f"Wrote: {md_path}")
@@ -3,16 +3,27 @@
 from __future__ import annotations
 
 import argparse
+import fnmatch
 import hashlib
 import json
+import mmap
+import os
+import re
+import stat
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+def _utc_now(now: Optional[datetime] = None) -> str:
+    return (now or datetime.now(timezone.utc)).isoformat().replace("+00:00", "Z")
 
 
 def _safe_stat(path: Path) -> Tuple[bool, int, float]:
@@ -23,6 +34,16 @@ def _safe_stat(path: Path) -> Tuple[bool, int, float]:
         return False, 0, 0.0
 
 
+def _stat_file(path: Path) -> Optional[os.stat_result]:
+    # One stat serves is_file(), the size/mtime row, and dedupe: (st_dev, st_ino)
+    # identifies the file behind symlinked aliases without a per-component resolve().
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
 def _age_s(mtime: float) -> Optional[float]:
     if not mtime:
         return None
@@ -30,16 +51,119 @@ def _age_s(mtime: float) -> Optional[float]:
 
 
 def _sha256_tail(path: Path, max_bytes: int) -> str:
+    """Hash the last ``max_bytes`` of a file through a read-only mmap (no tail copy)."""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except Exception:
+        return ""
     try:
-        size = int(path.stat().st_size)
+        size = os.fstat(fd).st_size
         read_len = min(max_bytes, size)
-        with path.open("rb") as f:
-            if size > read_len:
-                f.seek(size - read_len)
-            data = f.read(read_len)
-        return hashlib.sha256(data).hexdigest()
+        if read_len <= 0:
+            return hashlib.sha256(b"").hexdigest()
+        start = size - read_len
+        offset = start - start % mmap.ALLOCATIONGRANULARITY
+        with mmap.mmap(fd, size - offset, access=mmap.ACCESS_READ, offset=offset) as mm:
+            with memoryview(mm) as mv:
+                return hashlib.sha256(mv[start - offset :]).hexdigest()
     except Exception:
         return ""
+    finally:
+        os.close(fd)
+
+
+def _sha256_tails(rows: List[Dict[str, Any]], max_bytes: int, *, workers: int = 8) -> None:
+    """Fill ``sha256_tail`` for each row; hashlib releases the GIL, so hash in threads."""
+    if not rows:
+        return
+    paths = sorted({r["path"] for r in rows})  # a file matched by both categories is hashed once
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(paths)))) as pool:
+        digests = dict(zip(paths, pool.map(lambda p: _sha256_tail(Path(p), max_bytes), paths)))
+    for row in rows:
+        row["sha256_tail"] = digests[row["path"]]
+
+
+_GLOB_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+
+def _compile_glob(pattern: str) -> Optional[List[Optional[re.Pattern[str]]]]:
+    """Per-component regexes for a root-relative glob; None stands for `**`.
+
+    Returns None for patterns the single-walk matcher does not model (absolute,
+    `..`, trailing `**`); those still go through Path.glob.
+    """
+    if os.path.isabs(pattern) or os.path.splitdrive(pattern)[0]:
+        return None
+    parts = [x for x in pattern.replace(os.sep, "/").split("/") if x not in ("", ".")]
+    if not parts or ".." in parts or parts[-1] == "**":
+        return None
+    segs: List[Optional[re.Pattern[str]]] = []
+    for part in parts:
+        if part == "**":
+            if not segs or segs[-1] is not None:
+                segs.append(None)
+        elif "**" in part:
+            return None
+        else:
+            segs.append(re.compile(fnmatch.translate(part), _GLOB_FLAGS))
+    return segs
+
+
+def _glob_many(root: Path, patterns: List[str]) -> List[List[Path]]:
+    """Sorted non-directory matches for each glob, from one walk of ``root``.
+
+    Every directory is read once and carries the set of (pattern, component)
+    positions still alive there, so subtrees no pattern can reach are never
+    opened. As with Path.glob, `**` spans any number of directories but does
+    not descend through symlinked ones; explicit components may.
+    """
+    compiled = [_compile_glob(g) for g in patterns]
+    results: List[List[Path]] = [[] for _ in patterns]
+    for i, (g, c) in enumerate(zip(patterns, compiled)):
+        if c is None:
+            results[i] = [p for p in sorted(root.glob(g)) if not p.is_dir()]
+
+    def closure(states: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        # `**` may match zero directories: also try the component after it.
+        out = []
+        for i, k in states:
+            out.append((i, k))
+            if compiled[i][k] is None:
+                out.append((i, k + 1))
+        return list(dict.fromkeys(out))
+
+    stack = [(str(root), closure([(i, 0) for i, c in enumerate(compiled) if c is not None]))]
+    while stack:
+        dirpath, states = stack.pop()
+        try:
+            it = os.scandir(dirpath)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                    is_link = is_dir and entry.is_symlink()
+                except OSError:
+                    continue
+                nxt: List[Tuple[int, int]] = []
+                for i, k in states:
+                    seg = compiled[i][k]
+                    if seg is None:
+                        if is_dir and not is_link:
+                            nxt.append((i, k))
+                    elif seg.match(entry.name):
+                        if k + 1 < len(compiled[i]):
+                            if is_dir:
+                                nxt.append((i, k + 1))
+                        elif not is_dir:
+                            results[i].append(Path(entry.path))
+                if nxt:
+                    stack.append((entry.path, closure(nxt)))
+    for i, c in enumerate(compiled):
+        if c is not None:
+            results[i].sort()
+    return results
 
 
 def _hb_status(exists: bool, age: Optional[float], warn_s: float, err_s: float) -> str:
@@ -67,6 +191,12 @@ def _parse_kv_arg(items: List[str], *, sep: str = "=") -> Dict[str, str]:
     return out
 
 
+def _report_json(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+
+
 def _render_md(payload: Dict[str, Any]) -> str:
     lines = [
         "# Runtime Artifacts Snapshot",
@@ -124,17 +254,22 @@ def main(argv: Optional[List[str]] = None) -> int:
             }
         )
 
+    telemetry_globs = list(args.telemetry_glob or [])
+    log_globs = list(args.service_log_glob or [])
+    matches = _glob_many(root, telemetry_globs + log_globs)
+
     telemetry: List[Dict[str, Any]] = []
-    seen_telemetry: set[str] = set()
-    for g in list(args.telemetry_glob or []):
-        for p in sorted(root.glob(g)):
-            if not p.is_file():
+    seen_telemetry: set[Tuple[int, int]] = set()
+    for found in matches[: len(telemetry_globs)]:
+        for p in found:
+            st = _stat_file(p)
+            if st is None:
                 continue
-            key = str(p.resolve())
+            key = (st.st_dev, st.st_ino)
             if key in seen_telemetry:
                 continue
             seen_telemetry.add(key)
-            exists, size, mtime = _safe_stat(p)
+            exists, size, mtime = True, int(st.st_size), float(st.st_mtime)
             age = _age_s(mtime)
             telemetry.append(
                 {
@@ -142,21 +277,22 @@ def main(argv: Optional[List[str]] = None) -> int:
                     "exists": exists,
                     "size_bytes": size,
                     "age_seconds": None if age is None else round(age, 3),
-                    "sha256_tail": _sha256_tail(p, int(args.max_tail_bytes)),
+                    "sha256_tail": "",
                 }
             )
 
     service_logs: List[Dict[str, Any]] = []
-    seen_logs: set[str] = set()
-    for g in list(args.service_log_glob or []):
-        for p in sorted(root.glob(g)):
-            if not p.is_file():
+    seen_logs: set[Tuple[int, int]] = set()
+    for found in matches[len(telemetry_globs) :]:
+        for p in found:
+            st = _stat_file(p)
+            if st is None:
                 continue
-            key = str(p.resolve())
+            key = (st.st_dev, st.st_ino)
             if key in seen_logs:
                 continue
             seen_logs.add(key)
-            exists, size, mtime = _safe_stat(p)
+            exists, size, mtime = True, int(st.st_size), float(st.st_mtime)
             age = _age_s(mtime)
             service_logs.append(
                 {
@@ -164,12 +300,15 @@ def main(argv: Optional[List[str]] = None) -> int:
                     "exists": exists,
                     "size_bytes": size,
                     "age_seconds": None if age is None else round(age, 3),
-                    "sha256_tail": _sha256_tail(p, int(args.max_tail_bytes)),
+                    "sha256_tail": "",
                 }
             )
 
+    _sha256_tails(telemetry + service_logs, int(args.max_tail_bytes))
+
+    now = datetime.now(timezone.utc)  # one instant for the payload and the file stem
     payload = {
-        "created_at_utc": _utc_now(),
+        "created_at_utc": _utc_now(now),
         "runtime_root": str(root),
         "checks": {
             "heartbeats": heartbeats,
@@ -184,10 +323,10 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     out_dir = args.out_dir.resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
-    stem = datetime.now(timezone.utc).strftime("runtime_artifacts_snapshot_%Y%m%dT%H%M%SZ")
+    stem = now.strftime("runtime_artifacts_snapshot_%Y%m%dT%H%M%SZ")
     json_path = out_dir / f"{stem}.json"
     md_path = out_dir / f"{stem}.md"
-    json_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    json_path.write_bytes(_report_json(payload))
     md_path.write_text(_render_md(payload), encoding="utf-8")
     print(f"Wrote: {json_path}")
     print(f"Wrote: {md_path}")
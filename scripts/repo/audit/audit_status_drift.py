@@ -5,21 +5,43 @@ from __future__ import annotations
 import argparse
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+_RE_NON_STATUS_CHARS = re.compile(r"[^a-z0-9\-\s]")
+_RE_WS = re.compile(r"\s+")
+_RE_DASHES = re.compile(r"-+")
+
+# One pass over the document for all status forms, in priority order:
+#   a: **Status**: value   b: - Status: `value`   c: - Status: value
+# The list-item forms sit in a lookahead so they consume nothing and cannot
+# hide a bold status later on the same line.
+_RE_STATUS = re.compile(
+    r"\*\*Status\*\*\s*:\s*(?P<a>[^\n\r]+)"
+    r"|^(?=\-\s*Status\s*:\s*(?:`(?P<b>[^`]+)`|(?P<c>[^\n\r]+)))",
+    flags=re.IGNORECASE | re.MULTILINE,
+)
+
+
+def _utc_now(now: Optional[datetime] = None) -> str:
+    return (now or datetime.now(timezone.utc)).isoformat().replace("+00:00", "Z")
 
 
 def _norm_status(raw: str) -> str:
     v = (raw or "").strip().lower()
     v = v.replace("`", "").replace("*", "")
-    v = re.sub(r"[^a-z0-9\-\s]", " ", v)
-    v = re.sub(r"\s+", " ", v).strip().replace(" ", "-")
-    v = re.sub(r"-+", "-", v)
+    v = _RE_NON_STATUS_CHARS.sub(" ", v)
+    v = _RE_WS.sub(" ", v).strip().replace(" ", "-")
+    v = _RE_DASHES.sub("-", v)
     if v in {"", "unknown", "na", "n-a"}:
         return ""
     if v in {"active", "in-progress", "inprogress", "doing", "running"}:
@@ -34,15 +56,16 @@ def _norm_status(raw: str) -> str:
 
 
 def _extract_status_from_md(text: str) -> str:
-    pats = [
-        r"\*\*Status\*\*\s*:\s*([^\n\r]+)",
-        r"^\-\s*Status\s*:\s*`([^`]+)`",
-        r"^\-\s*Status\s*:\s*([^\n\r]+)",
-    ]
-    for pat in pats:
-        m = re.search(pat, text, flags=re.IGNORECASE | re.MULTILINE)
-        if m:
-            return _norm_status((m.group(1) or "").strip().rstrip(" ."))
+    found: Dict[str, str] = {}
+    for m in _RE_STATUS.finditer(text):
+        group = m.lastgroup or ""
+        if group == "a":
+            found = {"a": m.group("a")}
+            break
+        found.setdefault(group, m.group(group))
+    for group in ("a", "b", "c"):
+        if group in found:
+            return _norm_status((found[group] or "").strip().rstrip(" ."))
     return ""
 
 
@@ -71,6 +94,12 @@ def _load_dashboard_status(path: Path) -> Dict[str, str]:
     return out
 
 
+def _report_json(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+
+
 def _render_md(payload: Dict[str, Any]) -> str:
     viol = payload.get("violations", [])
     lines = [
@@ -94,12 +123,71 @@ def _render_md(payload: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _check_task(t: Dict[str, Any], repo_root: Path, dash: Dict[str, str]) -> Optional[List[Dict[str, str]]]:
+    task_id = str(t.get("id") or "").strip()
+    t_path = str(t.get("path") or "").replace("\\", "/")
+    expected = _norm_status(str(t.get("status") or ""))
+    if not task_id or not t_path or not expected:
+        return None
+
+    violations: List[Dict[str, str]] = []
+
+    dash_found = dash.get(task_id)
+    if dash_found and dash_found != expected:
+        violations.append(
+            {
+                "task_id": task_id,
+                "expected": expected,
+                "found": dash_found,
+                "source": "dashboard",
+                "reason": "dashboard status mismatch",
+            }
+        )
+
+    task_doc = (repo_root / t_path).resolve()
+    if not task_doc.exists() or not task_doc.is_file():
+        violations.append(
+            {
+                "task_id": task_id,
+                "expected": expected,
+                "found": "(missing)",
+                "source": t_path,
+                "reason": "task document missing",
+            }
+        )
+        return violations
+
+    found = _extract_status_from_md(task_doc.read_text(encoding="utf-8", errors="ignore"))
+    if not found:
+        violations.append(
+            {
+                "task_id": task_id,
+                "expected": expected,
+                "found": "(missing)",
+                "source": t_path,
+                "reason": "status field missing",
+            }
+        )
+    elif found != expected:
+        violations.append(
+            {
+                "task_id": task_id,
+                "expected": expected,
+                "found": found,
+                "source": t_path,
+                "reason": "task document status mismatch",
+            }
+        )
+    return violations
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Audit status drift between tasks, dashboard, and task docs.")
     ap.add_argument("--tasks-json", required=True, type=Path)
     ap.add_argument("--dashboard-md", type=Path, default=None)
     ap.add_argument("--repo-root", type=Path, default=Path.cwd())
     ap.add_argument("--out-dir", type=Path, default=Path("report_tmp/audits/status_drift"))
+    ap.add_argument("--jobs", type=int, default=32, help="Threads for reading task documents")
     ap.add_argument("--dry-run", action="store_true")
     args = ap.parse_args(argv)
 
@@ -109,63 +197,17 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     violations: List[Dict[str, str]] = []
     checked = 0
-    for t in tasks:
-        task_id = str(t.get("id") or "").strip()
-        t_path = str(t.get("path") or "").replace("\\", "/")
-        expected = _norm_status(str(t.get("status") or ""))
-        if not task_id or not t_path or not expected:
-            continue
-        checked += 1
-
-        dash_found = dash.get(task_id)
-        if dash_found and dash_found != expected:
-            violations.append(
-                {
-                    "task_id": task_id,
-                    "expected": expected,
-                    "found": dash_found,
-                    "source": "dashboard",
-                    "reason": "dashboard status mismatch",
-                }
-            )
-
-        task_doc = (repo_root / t_path).resolve()
-        if not task_doc.exists() or not task_doc.is_file():
-            violations.append(
-                {
-                    "task_id": task_id,
-                    "expected": expected,
-                    "found": "(missing)",
-                    "source": t_path,
-                    "reason": "task document missing",
-                }
-            )
-            continue
-
-        found = _extract_status_from_md(task_doc.read_text(encoding="utf-8", errors="ignore"))
-        if not found:
-            violations.append(
-                {
-                    "task_id": task_id,
-                    "expected": expected,
-                    "found": "(missing)",
-                    "source": t_path,
-                    "reason": "status field missing",
-                }
-            )
-        elif found != expected:
-            violations.append(
-                {
-                    "task_id": task_id,
-                    "expected": expected,
-                    "found": found,
-                    "source": t_path,
-                    "reason": "task document status mismatch",
-                }
-            )
-
+    # Task docs are read independently, so overlap their I/O; map keeps task order.
+    with ThreadPoolExecutor(max_workers=max(1, int(args.jobs))) as pool:
+        for found in pool.map(partial(_check_task, repo_root=repo_root, dash=dash), tasks):
+            if found is None:
+                continue
+            checked += 1
+            violations.extend(found)
+
+    now = datetime.now(timezone.utc)  # one instant for the payload and the file stem
     payload = {
-        "created_at_utc": _utc_now(),
+        "created_at_utc": _utc_now(now),
         "repo_root": str(repo_root),
         "checked_task_count": checked,
         "violations": violations,
@@ -177,10 +219,10 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     out_dir = args.out_dir.resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
-    stem = datetime.now(timezone.utc).strftime("status_drift_audit_%Y%m%dT%H%M%SZ")
+    stem = now.strftime("status_drift_audit_%Y%m%dT%H%M%SZ")
     json_path = out_dir / f"{stem}.json"
     md_path = out_dir / f"{stem}.md"
-    json_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    json_path.write_bytes(_report_json(payload))
     md_path.write_text(_render_md(payload), encoding="utf-8")
     print(f"Wrote: {json_path}")
     print(f"Wrote: {md_path}")
@@ -13,20 +13,48 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
 import os
 import re
+import stat
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+# Bearer credentials are redacted in their own pass first, keeping the
+# "Authorization: Bearer" prefix: in a fused alternation a long token ending in
+# "...authorization" would match earlier and leave the bearer value behind. A
+# value stops where another "authorization: bearer" prefix starts, so a header
+# glued onto it is redacted too. A GitHub token after "Bearer" is left to
+# REDACT_RE. Whitespace excludes "\n" so a match never spans the line joins in
+# `_read_tail`.
+REDACT_BEARER_RE: re.Pattern[str] = re.compile(
+    r"(authorization[^\S\n]*[:=][^\S\n]*bearer[^\S\n]+)(?!(?-i:gh[pousr]_[A-Za-z0-9_]{20,}\b))"
+    r"(?:(?!authorization[^\S\n]*[:=][^\S\n]*bearer[^\S\n])[A-Za-z0-9\-\._~\+/])+=*",
+    re.IGNORECASE,
+)
 
-REDACT_PATTERNS: Tuple[Tuple[re.Pattern[str], str], ...] = (
-    (re.compile(r"\bgh[pousr]_[A-Za-z0-9_]{20,}\b"), "<REDACTED_GITHUB_TOKEN>"),
-    (re.compile(r"(?i)(authorization\s*[:=]\s*bearer\s+)[A-Za-z0-9\-\._~\+/]+=*"), r"\1<REDACTED_BEARER>"),
-    (re.compile(r"\b[A-Za-z0-9\-_]{48,}\b"), "<REDACTED_LONG_TOKEN>"),
+# The remaining token shapes, fused into one alternation so each tail is
+# scanned once more (alternatives are tried in this order at each position).
+REDACT_RE: re.Pattern[str] = re.compile(
+    r"(?P<github_token>\bgh[pousr]_[A-Za-z0-9_]{20,}\b)"
+    r"|(?P<long_token>\b[A-Za-z0-9\-_]{48,}\b)"
 )
 
+REDACT_REPLACEMENTS: Dict[str, str] = {
+    "github_token": "<REDACTED_GITHUB_TOKEN>",
+    "bearer": "<REDACTED_BEARER>",
+    "long_token": "<REDACTED_LONG_TOKEN>",
+}
+
 SIGNAL_PATTERNS: Dict[str, re.Pattern[str]] = {
     "listener_leak": re.compile(r"listener\s+LEAK", re.IGNORECASE),
     "extension_unresponsive": re.compile(r"extension host.*unresponsive", re.IGNORECASE),
@@ -37,6 +65,25 @@ SIGNAL_PATTERNS: Dict[str, re.Pattern[str]] = {
     "crash_or_fatal": re.compile(r"crash|fatal|out of memory|oom", re.IGNORECASE),
 }
 
+# (name, bound search) pairs so the scan loop skips the dict view and the
+# method lookup on every line.
+_SIGNAL_SEARCHES = tuple((name, pattern.search) for name, pattern in SIGNAL_PATTERNS.items())
+
+# Lowercase literals, one of which every signal match must contain; ASCII lines
+# with none of them skip the regex scan entirely.
+SIGNAL_KEYWORDS: Tuple[str, ...] = (
+    "listener",
+    "extension host",
+    "urierror",
+    "polling failed",
+    "channel has been closed",
+    "dispos",
+    "crash",
+    "fatal",
+    "out of memory",
+    "oom",
+)
+
 
 @dataclass
 class AuditPaths:
@@ -54,52 +101,117 @@ def _stamp(dt: datetime) -> str:
     return dt.strftime("%Y%m%dT%H%M%SZ")
 
 
+def _iso_mtime(ts: float) -> str:
+    # Matches datetime.fromtimestamp(ts, timezone.utc).isoformat() with a "Z"
+    # suffix (microsecond rounding included) without a datetime per entry.
+    frac, whole = math.modf(ts)
+    us = round(frac * 1e6)
+    if us >= 1_000_000:
+        whole += 1
+        us -= 1_000_000
+    elif us < 0:
+        whole -= 1
+        us += 1_000_000
+    base = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(whole))
+    return f"{base}.{us:06d}Z" if us else f"{base}Z"
+
+
+def _redact_bearer(m: re.Match[str]) -> str:
+    return m.group(1) + REDACT_REPLACEMENTS["bearer"]
+
+
+def _redact_match(m: re.Match[str]) -> str:
+    return REDACT_REPLACEMENTS[m.lastgroup or ""]
+
+
 def _redact(text: str) -> str:
-    out = text
-    for pattern, repl in REDACT_PATTERNS:
-        out = pattern.sub(repl, out)
-    return out
+    text = REDACT_BEARER_RE.sub(_redact_bearer, text)
+    return REDACT_RE.sub(_redact_match, text)
+
+
+# Initial bytes read per wanted tail line before widening the window.
+_TAIL_READ_BYTES_PER_LINE = 512
 
 
-def _read_tail(path: Path, max_lines: int) -> List[str]:
-    if not path.exists() or not path.is_file():
+def _read_tail(path: Union[str, Path], max_lines: int) -> List[str]:
+    if max_lines <= 0:
         return []
     try:
-        text = path.read_text(encoding="utf-8", errors="replace")
+        with open(path, "rb") as f:
+            # One open + fstat stands in for separate exists()/is_file() stats.
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode):
+                return []
+            size = st.st_size
+            # Read backwards in growing windows until the window holds one more
+            # line than we keep; that first (possibly partial) line is dropped.
+            window = max(_TAIL_READ_BYTES_PER_LINE * max_lines, 1 << 16)
+            while True:
+                start = max(0, size - window)
+                f.seek(start)
+                text = f.read(size - start).decode("utf-8", errors="replace")
+                lines = text.splitlines()
+                if start == 0:
+                    break
+                if len(lines) > max_lines:
+                    lines = lines[1:]
+                    break
+                window *= 4
     except OSError:
         return []
-    lines = text.splitlines()
-    return [_redact(line) for line in lines[-max_lines:]]
+    tail = lines[-max_lines:]
+    if not tail:
+        return []
+    # Redact the whole tail in one scan; splitlines() left no "\n" inside lines.
+    return _redact("\n".join(tail)).split("\n")
 
 
-def _score_signals(lines: Iterable[str]) -> Dict[str, int]:
-    counts: Dict[str, int] = {name: 0 for name in SIGNAL_PATTERNS}
-    for line in lines:
-        for name, pattern in SIGNAL_PATTERNS.items():
-            if pattern.search(line):
-                counts[name] += 1
-    return counts
+def _may_signal(line: str) -> bool:
+    # Every signal pattern contains one of SIGNAL_KEYWORDS; case-folding is
+    # only exact for ASCII, so other lines always go on to the regexes.
+    if not line.isascii():
+        return True
+    low = line.lower()
+    return any(k in low for k in SIGNAL_KEYWORDS)
 
 
-def _extract_signal_lines(lines: List[str], max_hits: int = 60) -> List[Dict[str, object]]:
+def _scan_signals(lines: List[str], max_hits: int = 60) -> Tuple[Dict[str, int], List[Dict[str, object]]]:
+    """Per-signal line counts plus up to ``max_hits`` sample lines."""
+    counts: Dict[str, int] = dict.fromkeys(SIGNAL_PATTERNS, 0)
     hits: List[Dict[str, object]] = []
+    rest = len(lines)
     for idx, line in enumerate(lines, start=1):
-        matched = [name for name, pattern in SIGNAL_PATTERNS.items() if pattern.search(line)]
-        if matched:
-            hits.append({"line_number": idx, "signal_types": matched, "line": line})
         if len(hits) >= max_hits:
+            rest = idx - 1
             break
-    return hits
+        if not _may_signal(line):
+            continue
+        matched = [name for name, search in _SIGNAL_SEARCHES if search(line)]
+        if not matched:
+            continue
+        for name in matched:
+            counts[name] += 1
+        hits.append({"line_number": idx, "signal_types": matched, "line": line})
+    # Samples are full: the remaining lines only feed the counts, so count
+    # each pattern over the prefiltered lines without building per-line rows.
+    candidates = [line for line in lines[rest:] if _may_signal(line)]
+    if candidates:
+        for name, search in _SIGNAL_SEARCHES:
+            counts[name] += sum(1 for m in map(search, candidates) if m)
+    return counts, hits
 
 
 def _find_latest_session(logs_root: Path) -> Optional[Path]:
     if not logs_root.exists():
         return None
-    sessions = [p for p in logs_root.iterdir() if p.is_dir()]
+    # scandir entries carry the type (and, on Windows, the stat) from the
+    # directory listing, so filtering and sorting need no per-entry stat calls.
+    with os.scandir(logs_root) as it:
+        sessions = [e for e in it if e.is_dir()]
     if not sessions:
         return None
-    sessions.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return sessions[0]
+    latest = max(sessions, key=lambda e: e.stat().st_mtime)
+    return logs_root / latest.name
 
 
 def _find_named_session(logs_root: Path, session_id: str) -> Optional[Path]:
@@ -114,9 +226,11 @@ def _collect_extension_inventory() -> List[Dict[str, Any]]:
     if not ext_root.exists():
         return []
     items: List[Dict[str, Any]] = []
-    for d in sorted([p for p in ext_root.iterdir() if p.is_dir()], key=lambda p: p.name.lower()):
+    with os.scandir(ext_root) as it:
+        dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name.lower())
+    for d in dirs:
         try:
-            mtime = datetime.fromtimestamp(d.stat().st_mtime, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+            mtime = _iso_mtime(d.stat().st_mtime)
         except OSError:
             mtime = "unknown"
         items.append({"name": d.name, "last_write_utc": mtime})
@@ -129,10 +243,15 @@ def _collect_crashpad(code_root: Path) -> Dict[str, Any]:
     if not crashpad.exists():
         return result
     reports: List[Dict[str, Any]] = []
-    for file in sorted([p for p in crashpad.iterdir() if p.is_file()], key=lambda p: p.stat().st_mtime, reverse=True)[:20]:
+    with os.scandir(crashpad) as it:
+        files = [e for e in it if e.is_file()]
+    # DirEntry.stat() is cached, so the sort key and the row share one stat.
+    files.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    for file in files[:20]:
         try:
-            mtime = datetime.fromtimestamp(file.stat().st_mtime, tz=timezone.utc).isoformat().replace("+00:00", "Z")
-            size = file.stat().st_size
+            st = file.stat()
+            mtime = _iso_mtime(st.st_mtime)
+            size = st.st_size
         except OSError:
             mtime = "unknown"
             size = 0
@@ -141,25 +260,27 @@ def _collect_crashpad(code_root: Path) -> Dict[str, Any]:
     return result
 
 
-def _resolve_paths(out_dir_arg: Optional[str]) -> AuditPaths:
+def _resolve_paths(out_dir_arg: Optional[str], now: Optional[datetime] = None) -> AuditPaths:
+    now = now or _now_utc()
     repo_root = Path(__file__).resolve().parents[3]
-    day = _now_utc().strftime("%Y%m%d")
+    day = now.strftime("%Y%m%d")
     default_out = repo_root / "report_tmp" / "audits" / day / "evidence"
     out_dir = Path(out_dir_arg).resolve() if out_dir_arg else default_out
-    stamp = _stamp(_now_utc())
+    stamp = _stamp(now)
     json_path = out_dir / f"vscode_crash_audit_{stamp}.json"
     md_path = out_dir / f"vscode_crash_audit_{stamp}.md"
     return AuditPaths(repo_root=repo_root, out_dir=out_dir, json_path=json_path, md_path=md_path)
 
 
-def _build_payload(session_dir: Path, max_tail_lines: int) -> Dict[str, Any]:
-    window1 = session_dir / "window1"
+def _build_payload(session_dir: Path, max_tail_lines: int, now: Optional[datetime] = None) -> Dict[str, Any]:
+    # Plain string paths: they are only opened, never reported.
+    session = os.fspath(session_dir)
     paths = {
-        "main_log": session_dir / "main.log",
-        "sharedprocess_log": session_dir / "sharedprocess.log",
-        "ptyhost_log": session_dir / "ptyhost.log",
-        "renderer_log": window1 / "renderer.log",
-        "exthost_log": window1 / "exthost" / "exthost.log",
+        "main_log": os.path.join(session, "main.log"),
+        "sharedprocess_log": os.path.join(session, "sharedprocess.log"),
+        "ptyhost_log": os.path.join(session, "ptyhost.log"),
+        "renderer_log": os.path.join(session, "window1", "renderer.log"),
+        "exthost_log": os.path.join(session, "window1", "exthost", "exthost.log"),
     }
 
     tails: Dict[str, List[str]] = {key: _read_tail(path, max_tail_lines) for key, path in paths.items()}
@@ -168,15 +289,16 @@ def _build_payload(session_dir: Path, max_tail_lines: int) -> Dict[str, Any]:
         combined.extend(tails.get(key, []))
 
     code_root = Path(os.environ.get("APPDATA", "")) / "Code"
+    signals, signal_samples = _scan_signals(combined)
 
     payload: Dict[str, Any] = {
-        "generated_at": _now_utc().isoformat().replace("+00:00", "Z"),
+        "generated_at": (now or _now_utc()).isoformat().replace("+00:00", "Z"),
         "session": {
             "path": str(session_dir),
             "id": session_dir.name,
         },
-        "signals": _score_signals(combined),
-        "signal_samples": _extract_signal_lines(combined),
+        "signals": signals,
+        "signal_samples": signal_samples,
         "tails": tails,
         "extensions": _collect_extension_inventory(),
         "crashpad": _collect_crashpad(code_root),
@@ -190,68 +312,81 @@ def _build_payload(session_dir: Path, max_tail_lines: int) -> Dict[str, Any]:
 
 
 def _render_markdown(payload: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append(f"# VS Code Crash Audit — {payload.get('generated_at', 'unknown')}")
-    lines.append("")
     session = payload.get("session", {})
     signals = payload.get("signals", {})
-    lines.append("## Session")
-    lines.append("")
-    lines.append(f"- Session ID: `{session.get('id', 'unknown')}`")
-    lines.append(f"- Session Path: `{session.get('path', 'unknown')}`")
-    lines.append("")
-    lines.append("## Signal counts")
-    lines.append("")
-    for key, value in signals.items():
-        lines.append(f"- `{key}`: `{value}`")
+    lines: List[str] = [
+        f"# VS Code Crash Audit — {payload.get('generated_at', 'unknown')}",
+        "",
+        "## Session",
+        "",
+        f"- Session ID: `{session.get('id', 'unknown')}`",
+        f"- Session Path: `{session.get('path', 'unknown')}`",
+        "",
+        "## Signal counts",
+        "",
+    ]
+    lines.extend(f"- `{key}`: `{value}`" for key, value in signals.items())
+    lines.extend(["", "## Signal samples", ""])
 
-    lines.append("")
-    lines.append("## Signal samples")
-    lines.append("")
     samples = payload.get("signal_samples", [])
     if not samples:
         lines.append("- No matching signal lines found in sampled tails.")
     else:
         lines.append("```text")
-        for sample in samples[:40]:
-            line_no = sample.get("line_number", "?")
-            sigs = ",".join(sample.get("signal_types", []))
-            line = sample.get("line", "")
-            lines.append(f"[{line_no}] [{sigs}] {line}")
+        lines.extend(
+            f"[{sample.get('line_number', '?')}] [{','.join(sample.get('signal_types', []))}] {sample.get('line', '')}"
+            for sample in samples[:40]
+        )
         lines.append("```")
 
-    lines.append("")
-    lines.append("## Extensions (inventory snapshot)")
-    lines.append("")
+    lines.extend(["", "## Extensions (inventory snapshot)", ""])
     exts = payload.get("extensions", [])
     if not exts:
         lines.append("- No extension directories found.")
     else:
-        for ext in exts[:120]:
-            lines.append(f"- `{ext.get('name')}` (last_write_utc={ext.get('last_write_utc')})")
+        lines.extend(f"- `{ext.get('name')}` (last_write_utc={ext.get('last_write_utc')})" for ext in exts[:120])
 
     crashpad = payload.get("crashpad", {})
-    lines.append("")
-    lines.append("## Crashpad reports")
-    lines.append("")
-    lines.append(f"- Path: `{crashpad.get('path', 'unknown')}`")
-    lines.append(f"- Exists: `{crashpad.get('exists', False)}`")
+    lines.extend(
+        [
+            "",
+            "## Crashpad reports",
+            "",
+            f"- Path: `{crashpad.get('path', 'unknown')}`",
+            f"- Exists: `{crashpad.get('exists', False)}`",
+        ]
+    )
     reports = crashpad.get("reports", []) if isinstance(crashpad, dict) else []
     if reports:
-        for report in reports:
-            lines.append(f"- `{report.get('name')}` bytes={report.get('bytes')} last_write_utc={report.get('last_write_utc')}")
+        lines.extend(
+            f"- `{report.get('name')}` bytes={report.get('bytes')} last_write_utc={report.get('last_write_utc')}"
+            for report in reports
+        )
     else:
         lines.append("- No crash reports discovered in sampled directory.")
 
-    lines.append("")
-    lines.append("## Notes")
-    lines.append("")
-    lines.append("- Names-only evidence output; token redaction applied.")
-    lines.append("- Use this output as crash-audit evidence before remediation actions.")
-    lines.append("")
+    lines.extend(
+        [
+            "",
+            "## Notes",
+            "",
+            "- Names-only evidence output; token redaction applied.",
+            "- Use this output as crash-audit evidence before remediation actions.",
+            "",
+        ]
+    )
     return "\n".join(lines).rstrip() + "\n"
 
 
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
+    # Stream to the file rather than building the whole document as one str.
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Collect VS Code crash-audit evidence.")
     parser.add_argument("--session-id", default=None, help="Optional VS Code log session ID (e.g., 20260219T104841).")
@@ -278,7 +413,9 @@ def main() -> int:
         print("[FAIL] No VS Code log session found.")
         return 4
 
-    payload = _build_payload(session_dir=session_dir, max_tail_lines=max(50, args.max_tail_lines))
+    # One timestamp per run for the payload, the dated output dir and file stems.
+    now = _now_utc()
+    payload = _build_payload(session_dir=session_dir, max_tail_lines=max(50, args.max_tail_lines), now=now)
 
     signals = payload.get("signals", {})
     print(f"[OK] Session: {payload['session']['id']}")
@@ -290,10 +427,10 @@ def main() -> int:
         print("[OK] Dry-run complete. No files written.")
         return 0
 
-    paths = _resolve_paths(args.out_dir)
+    paths = _resolve_paths(args.out_dir, now)
     paths.out_dir.mkdir(parents=True, exist_ok=True)
 
-    paths.json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_json(paths.json_path, payload)
     paths.md_path.write_text(_render_markdown(payload), encoding="utf-8")
 
     print(f"[OK] Wrote {paths.json_path}")
@@ -6,36 +6,156 @@ import argparse
 import hashlib
 import json
 import socket
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from http.client import HTTPConnection, HTTPSConnection, RemoteDisconnected
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.parse import urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+def _utc_now(now: Optional[datetime] = None) -> str:
+    return (now or datetime.now(timezone.utc)).isoformat().replace("+00:00", "Z")
+
+
+_READ_CHUNK = 1 << 16
+_USER_AGENT = "dsl-web-audit/1.0"
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+
+
+def _read_digest(resp: Any) -> Tuple[int, str]:
+    # Hash the body as it arrives through one reused buffer instead of
+    # holding the whole response in memory.
+    digest = hashlib.sha256()
+    buf = bytearray(_READ_CHUNK)
+    view = memoryview(buf)
+    body_len = 0
+    while True:
+        n = resp.readinto(buf)
+        if not n:
+            break
+        digest.update(view[:n])
+        body_len += n
+    return body_len, digest.hexdigest()
+
+
+def _failed(status: int, error: str) -> Dict[str, Any]:
+    return {"ok": False, "status": status, "content_type": "", "body_len": 0, "body_sha256": "", "error": error}
 
 
 def _http_get(url: str, timeout: float = 3.5) -> Dict[str, Any]:
-    req = Request(url, headers={"User-Agent": "dsl-web-audit/1.0"})
+    req = Request(url, headers={"User-Agent": _USER_AGENT})
     try:
         with urlopen(req, timeout=timeout) as resp:
-            body = resp.read() or b""
+            body_len, body_sha256 = _read_digest(resp)
             return {
                 "ok": 200 <= int(getattr(resp, "status", 200)) < 300,
                 "status": int(getattr(resp, "status", 200)),
                 "content_type": str(resp.headers.get("Content-Type") or ""),
-                "body_len": len(body),
-                "body_sha256": hashlib.sha256(body).hexdigest(),
+                "body_len": body_len,
+                "body_sha256": body_sha256,
                 "error": "",
             }
     except HTTPError as e:
-        return {"ok": False, "status": int(getattr(e, "code", 0) or 0), "content_type": "", "body_len": 0, "body_sha256": "", "error": repr(e)}
+        return _failed(int(getattr(e, "code", 0) or 0), repr(e))
     except URLError as e:
-        return {"ok": False, "status": 0, "content_type": "", "body_len": 0, "body_sha256": "", "error": repr(e)}
+        return _failed(0, repr(e))
     except Exception as e:
-        return {"ok": False, "status": 0, "content_type": "", "body_len": 0, "body_sha256": "", "error": repr(e)}
+        return _failed(0, repr(e))
+
+
+class _KeepAliveProber:
+    """GET endpoints under one base URL over per-thread keep-alive connections.
+
+    Requests urlopen would treat specially (proxies, redirects, odd URLs) go
+    through `_http_get` instead, so results match a plain urlopen probe.
+    """
+
+    def __init__(self, base: str, timeout: float = 3.5) -> None:
+        parts = urlsplit(base)
+        self._base = base
+        self._timeout = timeout
+        self._https = parts.scheme.lower() == "https"
+        self._host = parts.hostname or ""
+        self._prefix = parts.path
+        self._local = threading.local()
+        self._conns: List[HTTPConnection] = []
+        self._lock = threading.Lock()
+        try:
+            self._port = parts.port
+            self.enabled = (
+                parts.scheme.lower() in ("http", "https")
+                and bool(self._host)
+                and not (parts.username or parts.password or parts.query or parts.fragment)
+                and not (parts.scheme.lower() in getproxies() and not proxy_bypass(self._host))
+            )
+        except ValueError:  # malformed port
+            self._port = None
+            self.enabled = False
+
+    def _conn(self) -> HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            cls = HTTPSConnection if self._https else HTTPConnection
+            conn = cls(self._host, self._port, timeout=self._timeout)
+            with self._lock:
+                self._conns.append(conn)
+            self._local.conn = conn
+        return conn
+
+    def get(self, rel: str) -> Dict[str, Any]:
+        url = f"{self._base}{rel}"
+        if not self.enabled:
+            return _http_get(url, self._timeout)
+        conn = self._conn()
+        try:
+            for attempt in (0, 1):
+                try:
+                    conn.request("GET", f"{self._prefix}{rel}", headers={"User-Agent": _USER_AGENT})
+                    resp = conn.getresponse()
+                    break
+                except (RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                    # The server dropped an idle keep-alive connection; reconnect once.
+                    conn.close()
+                    if attempt:
+                        raise
+                except OSError as e:
+                    conn.close()
+                    return _failed(0, repr(URLError(e)))
+            status = int(resp.status)
+            if status in _REDIRECT_CODES:
+                resp.read()
+                return _http_get(url, self._timeout)
+            if not 200 <= status < 300:
+                # urlopen raises HTTPError here; drain the body to keep the connection.
+                _read_digest(resp)
+                return _failed(status, repr(HTTPError(url, status, resp.reason, resp.headers, None)))
+            body_len, body_sha256 = _read_digest(resp)
+            return {
+                "ok": True,
+                "status": status,
+                "content_type": str(resp.headers.get("Content-Type") or ""),
+                "body_len": body_len,
+                "body_sha256": body_sha256,
+                "error": "",
+            }
+        except Exception as e:
+            conn.close()
+            return _failed(0, repr(e))
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._conns:
+                conn.close()
 
 
 def _tcp_probe(host: str, port: int, timeout: float = 1.5) -> Dict[str, Any]:
@@ -57,12 +177,34 @@ def _render_md(payload: Dict[str, Any]) -> str:
         "## Endpoint checks",
         "",
     ]
-    for ep, row in sorted((payload.get("endpoints", {}) or {}).items()):
-        lines.append(f"- `{ep}` status={row.get('status')} ok={row.get('ok')} body_len={row.get('body_len')} sha256={row.get('body_sha256')}")
+    lines.extend(
+        f"- `{ep}` status={row.get('status')} ok={row.get('ok')} body_len={row.get('body_len')} sha256={row.get('body_sha256')}"
+        for ep, row in sorted((payload.get("endpoints", {}) or {}).items())
+    )
     lines.append("")
     return "\n".join(lines)
 
 
+def _print_json(payload: Dict[str, Any]) -> None:
+    out = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and out is not None:
+        sys.stdout.flush()
+        out.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE))
+        return
+    # Stream to stdout rather than building the whole document as one str.
+    json.dump(payload, sys.stdout, indent=2, sort_keys=True)
+    sys.stdout.write("\n")
+
+
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        return
+    # Stream to the file rather than building the whole document as one str.
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Audit web dashboard endpoints.")
     ap.add_argument("--base-url", required=True)
@@ -74,28 +216,36 @@ def main(argv: Optional[List[str]] = None) -> int:
     args = ap.parse_args(argv)
 
     base = str(args.base_url).rstrip("/")
-    endpoints: Dict[str, Dict[str, Any]] = {}
-    for ep in list(args.endpoint or []):
-        rel = ep if ep.startswith("/") else f"/{ep}"
-        endpoints[rel] = _http_get(f"{base}{rel}")
+    # Normalized and de-duplicated in first-seen order; each probe is one
+    # blocking urlopen, so they run side by side (plus the TCP probe).
+    rels = list(dict.fromkeys(ep if ep.startswith("/") else f"/{ep}" for ep in list(args.endpoint or [])))
+    prober = _KeepAliveProber(base)
+    try:
+        with ThreadPoolExecutor(max_workers=min(16, len(rels) + 1)) as ex:
+            tcp_future = ex.submit(_tcp_probe, str(args.host), int(args.port))
+            endpoints: Dict[str, Dict[str, Any]] = dict(zip(rels, ex.map(prober.get, rels)))
+            tcp_probe = tcp_future.result()
+    finally:
+        prober.close()
 
+    now = datetime.now(timezone.utc)
     payload = {
-        "created_at_utc": _utc_now(),
+        "created_at_utc": _utc_now(now),
         "base_url": base,
-        "tcp_probe": _tcp_probe(str(args.host), int(args.port)),
+        "tcp_probe": tcp_probe,
         "endpoints": endpoints,
     }
 
     if args.dry_run:
-        print(json.dumps(payload, indent=2, sort_keys=True))
+        _print_json(payload)
         return 0
 
     out_dir = args.out_dir.resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
-    stem = datetime.now(timezone.utc).strftime("web_dashboard_audit_%Y%m%dT%H%M%SZ")
+    stem = now.strftime("web_dashboard_audit_%Y%m%dT%H%M%SZ")
     json_path = out_dir / f"{stem}.json"
     md_path = out_dir / f"{stem}.md"
-    json_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    _write_json(json_path, payload)
     md_path.write_text(_render_md(payload), encoding="utf-8")
     print(f"Wrote: {json_path}")
     print(f"Wrote: {md_path}")
@@ -27,6 +27,35 @@ def _read_pid(path: Path) -> Optional[int]:
     return None
 
 
+# Above this many pids one process_iter() pass is cheaper than opening each
+# process separately; below it the full scan costs more than it saves.
+_SNAPSHOT_MIN_PIDS = 20
+
+
+def _process_snapshot() -> Dict[int, Dict[str, Any]]:
+    snap: Dict[int, Dict[str, Any]] = {}
+    try:
+        for proc in psutil.process_iter(attrs=["pid", "name", "status", "memory_info"]):
+            snap[proc.info["pid"]] = proc.info
+    except Exception:
+        return {}
+    return snap
+
+
+def _set_details(out: Dict[str, Any], name: Any, status: Any, memory_info: Any) -> None:
+    # process_iter() reports attributes it could not read as None; treat that
+    # like the per-process lookup raising part way through.
+    if name is None:
+        out["status"] = "running_details_unavailable"
+        return
+    out["process_name"] = name
+    if status is None or memory_info is None:
+        out["status"] = "running_details_unavailable"
+        return
+    out["status"] = status
+    out["rss_bytes"] = int(memory_info.rss)
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Check status of processes referenced by pidfiles.")
     ap.add_argument("--pidfile", action="append", required=True, help="PID file mapping name=path")
@@ -38,6 +67,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 2
 
     rows: List[Dict[str, Any]] = []
+    pending: List[Dict[str, Any]] = []
     for item in list(args.pidfile or []):
         if "=" not in item:
             continue
@@ -54,20 +84,31 @@ def main(argv: Optional[List[str]] = None) -> int:
             rows.append({"name": name, "pidfile": str(path), "status": "pidfile_unreadable"})
             continue
 
+        out: Dict[str, Any] = {"name": name, "pidfile": str(path), "pid": pid}
+        rows.append(out)
+        pending.append(out)
+
+    snapshot = _process_snapshot() if len({r["pid"] for r in pending}) >= _SNAPSHOT_MIN_PIDS else {}
+    for out in pending:
+        pid = out["pid"]
+        info = snapshot.get(pid)
+        if info is not None:
+            out["running"] = True
+            _set_details(out, info.get("name"), info.get("status"), info.get("memory_info"))
+            continue
+        # Not in the snapshot (or no snapshot taken): pid_exists also covers
+        # pid 0 and processes started after the scan.
         running = bool(psutil.pid_exists(pid))
-        out: Dict[str, Any] = {"name": name, "pidfile": str(path), "pid": pid, "running": running}
+        out["running"] = running
         if running:
             try:
                 p_obj = psutil.Process(pid)
                 with p_obj.oneshot():
-                    out["process_name"] = p_obj.name()
-                    out["status"] = p_obj.status()
-                    out["rss_bytes"] = int(p_obj.memory_info().rss)
+                    _set_details(out, p_obj.name(), p_obj.status(), p_obj.memory_info())
             except Exception:
                 out["status"] = "running_details_unavailable"
         else:
             out["status"] = "pid_not_running"
-        rows.append(out)
 
     if args.json:
         print(json.dumps({"results": rows}, indent=2, sort_keys=True))
@@ -5,14 +5,20 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+def _utc_now(now: Optional[datetime] = None) -> str:
+    return (now or datetime.now(timezone.utc)).isoformat().replace("+00:00", "Z")
 
 
 def _safe_stat(path: Path) -> Dict[str, Any]:
@@ -33,10 +39,12 @@ def _safe_stat(path: Path) -> Dict[str, Any]:
 
 
 def _is_within(path: Path, parent: Path) -> bool:
+    # Both paths are already resolved by the caller, so this is a pure path
+    # comparison (case-insensitive on Windows) with no filesystem calls.
     try:
-        path.resolve().relative_to(parent.resolve())
+        path.relative_to(parent)
         return True
-    except Exception:
+    except ValueError:
         return False
 
 
@@ -50,22 +58,41 @@ def _render_md(payload: Dict[str, Any]) -> str:
         "## Environment (names-only)",
         "",
     ]
-    for k, v in sorted((payload.get("env", {}) or {}).items()):
-        lines.append(f"- {k}: {'set' if v else 'not set'}")
+    lines.extend(f"- {k}: {'set' if v else 'not set'}" for k, v in sorted((payload.get("env", {}) or {}).items()))
 
     lines.extend(["", "## Path safety", ""])
     ps = payload.get("path_safety", {}) or {}
-    for k, v in sorted(ps.items()):
-        if isinstance(v, bool):
-            lines.append(f"- {k}: {v}")
+    lines.extend(f"- {k}: {v}" for k, v in sorted(ps.items()) if isinstance(v, bool))
 
     lines.extend(["", "## Filesystem checks", ""])
-    for row in payload.get("files", []):
-        lines.append(f"- {row.get('path')}: exists={row.get('exists')} size_bytes={row.get('size_bytes')} age_s={row.get('age_seconds')}")
+    lines.extend(
+        f"- {row.get('path')}: exists={row.get('exists')} size_bytes={row.get('size_bytes')} age_s={row.get('age_seconds')}"
+        for row in payload.get("files", [])
+    )
     lines.append("")
     return "\n".join(lines)
 
 
+def _print_json(payload: Dict[str, Any]) -> None:
+    out = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and out is not None:
+        sys.stdout.flush()
+        out.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE))
+        return
+    # Stream to stdout rather than building the whole document as one str.
+    json.dump(payload, sys.stdout, indent=2, sort_keys=True)
+    sys.stdout.write("\n")
+
+
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        return
+    # Stream to the file rather than building the whole document as one str.
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Generate runtime parameter report with names-only output.")
     ap.add_argument("--runtime-root", type=Path, default=Path.cwd())
@@ -79,31 +106,34 @@ def main(argv: Optional[List[str]] = None) -> int:
     env = {name: bool(os.getenv(name)) for name in list(args.env_name or [])}
 
     rows: List[Dict[str, Any]] = []
+    all_within = True
     for rel in list(args.check_path or []):
         p = (root / rel).resolve()
         st = _safe_stat(p)
         rows.append({"path": str(p), **st})
+        all_within = all_within and _is_within(p, root)
 
+    now = datetime.now(timezone.utc)
     payload = {
-        "created_at_utc": _utc_now(),
+        "created_at_utc": _utc_now(now),
         "runtime_root": str(root),
         "env": env,
         "files": rows,
         "path_safety": {
-            "all_checks_within_runtime_root": all(_is_within(Path(r["path"]), root) for r in rows),
+            "all_checks_within_runtime_root": all_within,
         },
     }
 
     if args.dry_run:
-        print(json.dumps(payload, indent=2, sort_keys=True))
+        _print_json(payload)
         return 0
 
     out_dir = args.out_dir.resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
-    stem = datetime.now(timezone.utc).strftime("runtime_parameters_report_%Y%m%dT%H%M%SZ")
+    stem = now.strftime("runtime_parameters_report_%Y%m%dT%H%M%SZ")
     json_path = out_dir / f"{stem}.json"
     md_path = out_dir / f"{stem}.md"
-    json_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    _write_json(json_path, payload)
     md_path.write_text(_render_md(payload), encoding="utf-8")
     print(f"Wrote: {json_path}")
     print(f"Wrote: {md_path}")
@@ -13,6 +13,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 
 def _now() -> datetime:
     return datetime.now(timezone.utc)
@@ -32,6 +37,11 @@ def _latest_file(glob_pattern: str, base: Path) -> Optional[Path]:
 
 
 def _load_json(path: Path) -> Dict[str, Any]:
+    if orjson is not None:
+        try:
+            return orjson.loads(path.read_bytes())
+        except orjson.JSONDecodeError:
+            pass  # BOM or invalid UTF-8: the lenient text path below handles both
     text = path.read_text(encoding="utf-8", errors="replace")
     try:
         return json.loads(text)
@@ -40,6 +50,14 @@ def _load_json(path: Path) -> Dict[str, Any]:
         return json.loads(text_sig)
 
 
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+
+
 def _coerce_bool(value: Any) -> bool:
     return bool(value)
 
@@ -197,7 +215,7 @@ def main() -> int:
         summary["workspace_tuning_applied"] = True
         summary["workspace_settings_path"] = str(settings_path)
 
-    out_json.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    _write_json(out_json, summary)
 
     md_lines: List[str] = []
     md_lines.append(f"# VS Code Crash Remediation Triage — {summary['generated_at']}")
@@ -22,7 +22,53 @@ from __future__ import annotations
 
 import csv
 import json
+import os
 from pathlib import Path
+from typing import Iterable, Iterator
+
+try:
+    import ijson
+except ImportError:  # optional speedup
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def _starts_with_object(in_path: Path) -> bool:
+    with in_path.open("rb") as fh:
+        head = fh.read(4096).lstrip()
+    return head[:1] == b"{"
+
+
+def _load_entries(in_path: Path) -> Iterable[dict]:
+    if ijson is not None and _starts_with_object(in_path):
+        # Stream entries one at a time (ijson picks its fastest backend, the
+        # yajl2 C one when built) so large inventories never sit in memory.
+        # Opened here, not in the generator, so a missing input still fails
+        # before the CSV is created. use_float=True keeps non-integer numbers
+        # as float (not Decimal) so they format exactly as json.loads would.
+        fh = in_path.open("rb")
+
+        def stream() -> Iterator[dict]:
+            with fh:
+                yield from ijson.items(fh, "entries.item", use_float=True)
+
+        return stream()
+
+    # Anything that is not a JSON object (including a BOM-prefixed file) takes
+    # the full-load path, so it raises exactly as before.
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.loads(in_path.read_bytes())
+        except orjson.JSONDecodeError:
+            pass  # let the stdlib parser raise (or accept) exactly as before
+    if data is None:
+        data = json.loads(in_path.read_text(encoding="utf-8"))
+    return data.get("entries", [])
 
 
 def main() -> int:
@@ -36,20 +82,30 @@ def main() -> int:
     in_path = Path(args.in_json)
     out_path = Path(args.out_csv)
 
-    data = json.loads(in_path.read_text(encoding="utf-8"))
-    entries = data.get("entries", [])
+    entries = _load_entries(in_path)
 
     # stable fields
     fields = ["path", "size_bytes", "last_modified_utc", "last_commit_iso", "description"]
 
+    # Rows are written to a ``.tmp`` sibling and moved into place with
+    # `os.replace`: a streamed input that turns out to be malformed part way
+    # through leaves no partial CSV behind.
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", newline="", encoding="utf-8") as fh:
-        w = csv.DictWriter(fh, fieldnames=fields)
-        w.writeheader()
-        for e in entries:
-            w.writerow({k: e.get(k, "") for k in fields})
-
-    print(f"Wrote {len(entries)} rows to {out_path}")
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    try:
+        with tmp_path.open("w", newline="", encoding="utf-8") as fh:
+            w = csv.DictWriter(fh, fieldnames=fields)
+            w.writeheader()
+            n = 0
+            for e in entries:
+                w.writerow({k: e.get(k, "") for k in fields})
+                n += 1
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    print(f"Wrote {n} rows to {out_path}")
     return 0
 
 
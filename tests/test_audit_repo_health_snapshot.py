@@ -5,7 +5,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from conftest import scripts_root
+from conftest import import_module_from_path, scripts_root
 
 
 def test_audit_repo_health_snapshot_dry_run_flags_tracked_logs(tmp_path: Path) -> None:
@@ -28,3 +28,18 @@ def test_audit_repo_health_snapshot_dry_run_flags_tracked_logs(tmp_path: Path) -
     payload = json.loads(res.stdout)
     flagged = payload["checks"]["tracked_should_not_be_tracked"]
     assert any("logs/app.log" in p.replace("\\", "/") for p in flagged)
+
+
+def test_git_check_ignore_many_matches_per_path(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "audit" / "audit_repo_health_snapshot.py"
+    mod = import_module_from_path("audit_repo_health_snapshot", script)
+
+    subprocess.run(["git", "init"], cwd=str(tmp_path), check=True, capture_output=True, text=True)
+    (tmp_path / ".gitignore").write_text("logs/\n*.tmp\n!keep.tmp\n", encoding="utf-8")
+
+    paths = ["logs/app.log", "scratch.tmp", "keep.tmp", "src/main.py"]
+    assert mod._git_check_ignore_many(tmp_path, paths) == [True, True, False, False]
+    assert mod._git_check_ignore_many(tmp_path, paths) == [mod._git_check_ignore(tmp_path, p) for p in paths]
+
+    # a path git rejects makes the batch fail; results fall back to per-path calls
+    assert mod._git_check_ignore_many(tmp_path, paths + ["../outside"])[-1] is None
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import subprocess
 import sys
 from pathlib import Path
 
-from conftest import scripts_root
+from conftest import import_module_from_path, scripts_root
 
 
 def test_audit_runtime_artifacts_snapshot_dry_run(tmp_path: Path) -> None:
@@ -47,3 +48,53 @@ def test_audit_runtime_artifacts_snapshot_dry_run(tmp_path: Path) -> None:
     assert payload["checks"]["heartbeats"][0]["name"] == "watchdog"
     assert len(payload["checks"]["telemetry"]) == 1
     assert len(payload["checks"]["service_logs"]) == 1
+
+
+def test_sha256_tail_matches_plain_read(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "audit" / "audit_runtime_artifacts_snapshot.py"
+    mod = import_module_from_path("audit_runtime_artifacts_snapshot", script)
+
+    for size in (0, 10, 16384, 70001):
+        data = bytes(i % 251 for i in range(size))
+        p = tmp_path / f"blob_{size}.bin"
+        p.write_bytes(data)
+        assert mod._sha256_tail(p, 16384) == hashlib.sha256(data[-16384:] if size else b"").hexdigest()
+
+    assert mod._sha256_tail(tmp_path / "missing.bin", 16384) == ""
+
+
+def test_runtime_snapshot_dedupes_symlinked_logs(tmp_path: Path, capsys) -> None:
+    script = scripts_root() / "repo" / "audit" / "audit_runtime_artifacts_snapshot.py"
+    mod = import_module_from_path("audit_runtime_artifacts_snapshot_dedupe", script)
+
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    (logs / "app.log").write_text("ok\n", encoding="utf-8")
+    (logs / "other.log").write_text("ok\n", encoding="utf-8")
+    try:
+        (logs / "current.log").symlink_to(logs / "app.log")
+    except OSError:
+        pass  # symlinks unavailable (e.g. unprivileged Windows)
+    (logs / "dir.log").mkdir()
+
+    rc = mod.main(["--runtime-root", str(tmp_path), "--telemetry-glob", "none/*", "--service-log-glob", "logs/*.log", "--dry-run"])
+
+    assert rc == 0
+    rows = json.loads(capsys.readouterr().out)["checks"]["service_logs"]
+    assert sorted(Path(r["path"]).name for r in rows) in (["app.log", "other.log"], ["current.log", "other.log"])
+    assert all(r["exists"] and r["size_bytes"] == 3 for r in rows)
+
+
+def test_glob_many_matches_path_glob(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "audit" / "audit_runtime_artifacts_snapshot.py"
+    mod = import_module_from_path("audit_runtime_artifacts_snapshot_glob", script)
+
+    for rel in ("a.log", "data/e.jsonl", "data/deep/f.jsonl", "logs/s.log", "logs/old/t.log", ".hidden/u.log", "x.txt"):
+        p = tmp_path / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("x\n", encoding="utf-8")
+
+    patterns = ["**/*.jsonl", "**/*.log", "data/*.jsonl", "logs/**/*.log", "?.log", "../*.log"]
+    expected = [[p for p in sorted(tmp_path.glob(g)) if not p.is_dir()] for g in patterns]
+    assert mod._glob_many(tmp_path, patterns) == expected
+    assert [len(x) for x in expected[:5]] == [2, 4, 1, 2, 1]
@@ -5,7 +5,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from conftest import scripts_root
+from conftest import import_module_from_path, scripts_root
 
 
 def test_audit_status_drift_detects_mismatch(tmp_path: Path) -> None:
@@ -52,3 +52,39 @@ def test_audit_status_drift_detects_mismatch(tmp_path: Path) -> None:
     payload = json.loads(res.stdout)
     assert payload["checked_task_count"] == 1
     assert len(payload["violations"]) >= 1
+
+
+def test_extract_status_from_md_keeps_pattern_priority() -> None:
+    script = scripts_root() / "repo" / "audit" / "audit_status_drift.py"
+    mod = import_module_from_path("audit_status_drift", script)
+
+    # bold status wins even when a list-item status comes first
+    assert mod._extract_status_from_md("- Status: done\n\n**Status**: Blocked.\n") == "blocked"
+    # backticked list item beats an earlier plain one
+    assert mod._extract_status_from_md("- Status: queued\n- Status: `in progress`\n") == "in-progress"
+    assert mod._extract_status_from_md("- status : done\n") == "completed"
+    # a bold status later on the same line as a list item is still found
+    assert mod._extract_status_from_md("- Status: `x` **Status**: open\n") == "open"
+    assert mod._extract_status_from_md("no status here\n") == ""
+
+
+def test_audit_status_drift_threaded_checks_keep_task_order(tmp_path: Path, capsys) -> None:
+    script = scripts_root() / "repo" / "audit" / "audit_status_drift.py"
+    mod = import_module_from_path("audit_status_drift_threads", script)
+
+    tasks = []
+    for i in range(20):
+        doc = tmp_path / "jobs" / f"JOB_{i}.md"
+        doc.parent.mkdir(parents=True, exist_ok=True)
+        doc.write_text(f"**Status**: {'open' if i % 2 else 'done'}\n", encoding="utf-8")
+        tasks.append({"id": f"T{i}", "path": f"jobs/JOB_{i}.md", "status": "open"})
+    tasks.append({"id": "T-skip", "path": "", "status": "open"})
+    tasks_json = tmp_path / "tasks.json"
+    tasks_json.write_text(json.dumps(tasks), encoding="utf-8")
+
+    rc = mod.main(["--tasks-json", str(tasks_json), "--repo-root", str(tmp_path), "--jobs", "4", "--dry-run"])
+
+    assert rc == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["checked_task_count"] == 20
+    assert [v["task_id"] for v in payload["violations"]] == [f"T{i}" for i in range(0, 20, 2)]
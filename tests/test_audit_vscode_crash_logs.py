@@ -5,7 +5,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from conftest import scripts_root
+from conftest import import_module_from_path, scripts_root
 
 
 def test_dry_run_parses_synthetic_vscode_logs(tmp_path: Path) -> None:
@@ -41,3 +41,92 @@ def test_dry_run_parses_synthetic_vscode_logs(tmp_path: Path) -> None:
     assert res.returncode == 0, res.stderr
     assert "listener_leak" in res.stdout
     assert "extension_unresponsive" in res.stdout
+
+
+def test_scan_signals_counts_all_lines_and_caps_samples() -> None:
+    script = scripts_root() / "repo" / "audit" / "audit_vscode_crash_logs.py"
+    mod = import_module_from_path("audit_vscode_crash_logs", script)
+
+    lines = [
+        "[info] ordinary line",
+        "Extension host (pid 1) crashed and is unresponsive",
+        "Listener  LEAK detected while disposing",
+        "UriError: bad uri",
+    ] * 3
+
+    counts, samples = mod._scan_signals(lines, max_hits=2)
+
+    assert counts["extension_unresponsive"] == 3
+    assert counts["crash_or_fatal"] == 3  # overlaps the extension-host match
+    assert counts["listener_leak"] == 3 and counts["dispose_error"] == 3
+    assert counts["uri_error"] == 3 and counts["polling_failed"] == 0
+    assert [s["line_number"] for s in samples] == [2, 3]
+    assert samples[0]["signal_types"] == ["extension_unresponsive", "crash_or_fatal"]
+
+
+def test_read_tail_redacts_tokens_in_last_lines(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "audit" / "audit_vscode_crash_logs.py"
+    mod = import_module_from_path("audit_vscode_crash_logs", script)
+
+    log = tmp_path / "renderer.log"
+    log.write_text(
+        "dropped ghp_" + "a" * 30 + "\n"
+        "token ghp_" + "b" * 30 + " seen\n"
+        "Authorization: Bearer abc.def~==\n"
+        "authorization: bearer ghp_" + "c" * 24 + "\n"
+        "blob " + "x" * 48 + "\n"
+        "request_context_identifier_for_upstream_proxy_authorization: Bearer s3cretTOKENvalue\n",
+        encoding="utf-8",
+    )
+
+    assert mod._read_tail(log, 5) == [
+        "token <REDACTED_GITHUB_TOKEN> seen",
+        "Authorization: Bearer <REDACTED_BEARER>",
+        "authorization: bearer <REDACTED_GITHUB_TOKEN>",
+        "blob <REDACTED_LONG_TOKEN>",
+        "<REDACTED_LONG_TOKEN>: Bearer <REDACTED_BEARER>",
+    ]
+
+    empty = tmp_path / "empty.log"
+    empty.write_text("", encoding="utf-8")
+    assert mod._read_tail(empty, 4) == []
+
+
+def test_read_tail_widens_window_for_long_lines(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "audit" / "audit_vscode_crash_logs.py"
+    mod = import_module_from_path("audit_vscode_crash_logs", script)
+
+    lines = [f"{i} " + "é " * 40_000 for i in range(4)]
+    log = tmp_path / "main.log"
+    log.write_text("\r\n".join(lines) + "\r\n", encoding="utf-8")
+
+    assert mod._read_tail(log, 2) == lines[2:]
+    assert mod._read_tail(log, 10) == lines
+    assert mod._read_tail(tmp_path / "missing.log", 2) == []
+    assert mod._read_tail(tmp_path, 2) == []
+
+
+def test_latest_session_and_crashpad_order_by_mtime(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "audit" / "audit_vscode_crash_logs.py"
+    mod = import_module_from_path("audit_vscode_crash_logs", script)
+
+    logs = tmp_path / "Code" / "logs"
+    reports = tmp_path / "Code" / "Crashpad" / "reports"
+    reports.mkdir(parents=True)
+    for i, name in enumerate(["20260101T000000", "20260301T000000", "20260201T000000"]):
+        (logs / name).mkdir(parents=True)
+        os.utime(logs / name, (1_000 + i, 1_000 + i))
+        (reports / f"{name}.dmp").write_bytes(b"x" * (i + 1))
+        os.utime(reports / f"{name}.dmp", (1_000 + i, 1_000 + i))
+    (logs / "stray.txt").write_text("not a session", encoding="utf-8")
+    os.utime(logs / "stray.txt", (9_999, 9_999))
+    (reports / "subdir").mkdir()
+
+    assert mod._find_latest_session(logs) == logs / "20260201T000000"
+
+    crashpad = mod._collect_crashpad(tmp_path / "Code")
+    assert [(r["name"], r["bytes"]) for r in crashpad["reports"]] == [
+        ("20260201T000000.dmp", 3),
+        ("20260301T000000.dmp", 2),
+        ("20260101T000000.dmp", 1),
+    ]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import subprocess
 import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
-from conftest import scripts_root
+from conftest import import_module_from_path, scripts_root
 
 
 def test_audit_web_dashboard_endpoints_dry_run(tmp_path: Path) -> None:
@@ -28,3 +31,101 @@ def test_audit_web_dashboard_endpoints_dry_run(tmp_path: Path) -> None:
     payload = json.loads(res.stdout)
     assert "endpoints" in payload
     assert "/" in payload["endpoints"]
+
+
+def test_endpoint_probes_normalize_and_dedupe(tmp_path: Path, capsys) -> None:
+    script = scripts_root() / "repo" / "audit" / "audit_web_dashboard_endpoints.py"
+    mod = import_module_from_path("audit_web_dashboard_endpoints", script)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path == "/missing":
+                self.send_error(404)
+                return
+            body = self.path.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        port = server.server_address[1]
+        rc = mod.main(
+            [
+                "--base-url", f"http://127.0.0.1:{port}/",
+                "--endpoint", "api/a",
+                "--endpoint", "/missing",
+                "--endpoint", "/api/a",
+                "--port", str(port),
+                "--dry-run",
+            ]
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert rc == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["tcp_probe"]["ok"] is True
+    endpoints = payload["endpoints"]
+    assert sorted(endpoints) == ["/", "/api/a", "/missing"]
+    assert endpoints["/api/a"]["ok"] is True and endpoints["/api/a"]["body_len"] == len("/api/a")
+    assert endpoints["/api/a"]["body_sha256"] == hashlib.sha256(b"/api/a").hexdigest()
+    assert endpoints["/missing"]["status"] == 404 and endpoints["/missing"]["ok"] is False
+
+
+def test_keep_alive_prober_reuses_connection_and_matches_urlopen() -> None:
+    script = scripts_root() / "repo" / "audit" / "audit_web_dashboard_endpoints.py"
+    mod = import_module_from_path("audit_web_dashboard_endpoints", script)
+    connections: list = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            connections.append(self.client_address)
+            super().setup()
+
+        def do_GET(self) -> None:
+            if self.path == "/app/old":
+                self.send_response(302)
+                self.send_header("Location", "/app/new")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = self.path.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}/app"
+        prober = mod._KeepAliveProber(base)
+        assert prober.enabled
+        rows = [prober.get(rel) for rel in ("/a", "/b", "/c")]
+        prober.close()
+        assert len(connections) == 1
+        assert rows == [mod._http_get(f"{base}{rel}") for rel in ("/a", "/b", "/c")]
+
+        prober = mod._KeepAliveProber(base)
+        redirected = prober.get("/old")
+        prober.close()
+        assert redirected["ok"] is True
+        assert redirected["body_sha256"] == hashlib.sha256(b"/app/new").hexdigest()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -6,7 +6,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from conftest import scripts_root
+from conftest import import_module_from_path, scripts_root
 
 
 def test_check_pidfiles_status_reports_running_process(tmp_path: Path) -> None:
@@ -32,3 +32,28 @@ def test_check_pidfiles_status_reports_running_process(tmp_path: Path) -> None:
     rows = payload["results"]
     assert len(rows) == 1
     assert rows[0]["running"] is True
+
+
+def test_snapshot_and_per_pid_lookups_agree(tmp_path: Path, capsys, monkeypatch) -> None:
+    script = scripts_root() / "repo" / "audit" / "check_pidfiles_status.py"
+    mod = import_module_from_path("check_pidfiles_status", script)
+
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    args = ["--json"]
+    for i in range(mod._SNAPSHOT_MIN_PIDS):
+        pidfile = tmp_path / f"p{i}.pid"
+        pidfile.write_text(f"{dead.pid if i % 2 else os.getpid()}\n", encoding="utf-8")
+        args += ["--pidfile", f"p{i}={pidfile}"]
+
+    def run(min_pids: int) -> list:
+        monkeypatch.setattr(mod, "_SNAPSHOT_MIN_PIDS", min_pids)
+        assert mod.main(args) == 0
+        return json.loads(capsys.readouterr().out)["results"]
+
+    per_pid, snapshot = run(10_000), run(1)
+    for row in per_pid + snapshot:
+        row.pop("rss_bytes", None)
+    assert snapshot == per_pid
+    assert per_pid[0]["running"] is True and per_pid[0]["status"] != "running_details_unavailable"
+    assert per_pid[1]["status"] == "pid_not_running"
@@ -36,3 +36,63 @@ def test_export_notebook_handles_optional_dependency_or_success(tmp_path: Path)
     assert rc in (0, 2)
     if rc == 0:
         assert output_path.exists()
+
+
+def test_export_notebook_fast_html_honours_remove_tags(tmp_path: Path) -> None:
+    script = scripts_root() / "notebooks" / "export_notebook.py"
+    mod = import_module_from_path("export_notebook_mod_fast", script)
+
+    notebook_path = tmp_path / "demo.ipynb"
+    output_path = tmp_path / "demo.html"
+    notebook_path.write_text(
+        json.dumps(
+            {
+                "cells": [
+                    {"cell_type": "markdown", "metadata": {}, "source": ["# Title\n", "Some *text*"]},
+                    {
+                        "cell_type": "code",
+                        "metadata": {"tags": ["remove_input"]},
+                        "execution_count": 1,
+                        "source": "hidden_input = 1",
+                        "outputs": [{"output_type": "stream", "name": "stdout", "text": "a < b\n"}],
+                    },
+                    {
+                        "cell_type": "code",
+                        "metadata": {"tags": ["remove_cell"]},
+                        "execution_count": 2,
+                        "source": "secret_cell = 2",
+                        "outputs": [],
+                    },
+                ],
+                "metadata": {},
+                "nbformat": 4,
+                "nbformat_minor": 4,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    rc = mod.export_notebook(str(notebook_path), "html", str(output_path), fast_html=True)
+    assert rc == 0
+    text = output_path.read_text(encoding="utf-8")
+    assert "<h1" in text and "<em>text</em>" in text
+    assert "a &lt; b" in text
+    assert "hidden_input" not in text
+    assert "secret_cell" not in text
+
+
+def test_export_notebook_reuses_cached_html_exporter(tmp_path: Path) -> None:
+    script = scripts_root() / "notebooks" / "export_notebook.py"
+    mod = import_module_from_path("export_notebook_mod_cached", script)
+
+    notebook_path = tmp_path / "demo.ipynb"
+    notebook_path.write_text(
+        json.dumps({"cells": [], "metadata": {}, "nbformat": 4, "nbformat_minor": 5}),
+        encoding="utf-8",
+    )
+
+    assert mod.export_notebook(str(notebook_path), "html", str(tmp_path / "a.html")) == 0
+    assert mod.export_notebook(str(notebook_path), "html", str(tmp_path / "b.html")) == 0
+    info = mod._get_exporter.cache_info()
+    assert info.misses == 1 and info.hits == 1
+    assert (tmp_path / "a.html").read_text(encoding="utf-8") == (tmp_path / "b.html").read_text(encoding="utf-8")
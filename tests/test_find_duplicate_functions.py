@@ -5,7 +5,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from conftest import scripts_root
+from conftest import import_module_from_path, scripts_root
 
 
 def test_find_duplicate_functions_reports_duplicate_group(tmp_path: Path) -> None:
@@ -31,3 +31,91 @@ def test_find_duplicate_functions_reports_duplicate_group(tmp_path: Path) -> Non
 
     payload = json.loads(report.read_text(encoding="utf-8"))
     assert payload["duplicate_groups"] >= 1
+
+
+def test_extract_all_parallel_matches_serial(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "analysis" / "find_duplicate_functions.py"
+    mod = import_module_from_path("find_duplicate_functions_parallel", script)
+
+    items = []
+    for i in range(12):
+        p = tmp_path / f"m{i}.py"
+        p.write_text(f"def f{i}(x):\n    return x + {i % 3}\n\nasync def g():\n    pass\n", encoding="utf-8")
+        items.append((p, p.name))
+
+    assert mod.extract_all(items, jobs=3) == mod.extract_all(items, jobs=1)
+
+
+def test_extract_all_reuses_cache_for_unchanged_files(tmp_path: Path, monkeypatch) -> None:
+    script = scripts_root() / "repo" / "analysis" / "find_duplicate_functions.py"
+    mod = import_module_from_path("find_duplicate_functions_cache", script)
+
+    a = tmp_path / "a.py"
+    b = tmp_path / "b.py"
+    a.write_text("def f():\n    return 1\n", encoding="utf-8")
+    b.write_text("def g():\n    return 2\n", encoding="utf-8")
+    items = [(a, "a.py"), (b, "b.py")]
+
+    cache = mod.ExtractionCache(tmp_path / ".cache.sqlite", "t")
+    first = mod.extract_all(items, jobs=1, cache=cache)
+    cache.close()
+
+    b.write_text("def g():\n    return 3\n\ndef h():\n    pass\n", encoding="utf-8")
+    parsed = []
+    real = mod.extract_functions
+    monkeypatch.setattr(mod, "extract_functions", lambda p: parsed.append(p.name) or real(p))
+
+    cache = mod.ExtractionCache(tmp_path / ".cache.sqlite", "t")
+    second = mod.extract_all(items, jobs=1, cache=cache)
+    cache.close()
+
+    assert parsed == ["b.py"]
+    assert second[0] == first[0]
+    assert second == mod.extract_all(items, jobs=1)
+
+
+def test_iter_py_files_prunes_bulky_dirs(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "analysis" / "find_duplicate_functions.py"
+    mod = import_module_from_path("find_duplicate_functions_walk", script)
+
+    for rel in ("a.py", "pkg/b.py", "pkg/notes.txt", ".venv/lib/c.py", "pkg/__pycache__/d.py", "Site-Packages/e.py"):
+        p = tmp_path / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("x = 1\n", encoding="utf-8")
+
+    found = sorted(p.relative_to(tmp_path).as_posix() for p in mod.iter_py_files(tmp_path))
+    assert found == ["a.py", "pkg/b.py"]
+
+
+def test_extract_functions_honours_coding_cookie(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "analysis" / "find_duplicate_functions.py"
+    mod = import_module_from_path("find_duplicate_functions_bytes", script)
+
+    latin = tmp_path / "latin.py"
+    latin.write_bytes("# -*- coding: latin-1 -*-\ndef f():\n    return 'caf\xe9'\n".encode("latin-1"))
+    bom = tmp_path / "bom.py"
+    bom.write_bytes(b"\xef\xbb\xbfdef f():\n    return 'caf\xc3\xa9'\n")
+    broken = tmp_path / "broken.py"
+    broken.write_bytes(b"def f(:\n")
+
+    assert [f["name"] for f in mod.extract_functions(latin)] == ["f"]
+    assert mod.extract_functions(latin)[0]["hash"] == mod.extract_functions(bom)[0]["hash"]
+    assert mod.extract_functions(broken) == []
+
+
+def test_reports_share_one_timestamp(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "analysis" / "find_duplicate_functions.py"
+    src = tmp_path / "src"
+    out = tmp_path / "out"
+    src.mkdir()
+    (src / "a.py").write_text("def f():\n    return 1\n", encoding="utf-8")
+
+    res = subprocess.run(
+        [sys.executable, str(script), "--root", str(src), "--out", str(out), "--jobs", "1"],
+        capture_output=True,
+        text=True,
+    )
+
+    assert res.returncode == 0, res.stderr
+    stamp = json.loads((out / "duplicate_functions_report.json").read_text(encoding="utf-8"))["generated_at_utc"]
+    assert f"> Generated at (UTC): `{stamp}`" in (out / "duplicate_functions_report.md").read_text(encoding="utf-8")
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import ast
 import json
 import subprocess
 import sys
 from pathlib import Path
 
-from conftest import scripts_root
+import pytest
+
+from conftest import import_module_from_path, scripts_root
 
 
 def test_find_near_duplicate_functions_reports_pairs(tmp_path: Path) -> None:
@@ -31,3 +34,131 @@ def test_find_near_duplicate_functions_reports_pairs(tmp_path: Path) -> None:
 
     payload = json.loads(report.read_text(encoding="utf-8"))
     assert payload["pairs_found"] >= 1
+
+
+def test_normalized_dump_inplace_matches_copy_and_ignores_names() -> None:
+    script = scripts_root() / "repo" / "analysis" / "find_near_duplicate_functions.py"
+    mod = import_module_from_path("find_near_duplicate_functions_norm", script)
+
+    src_a = "def f(x, *a, **k):\n    y = x + len(a)\n    return [y for _ in k]\n"
+    src_b = "def g(p, *q, **r):\n    z = p + len(q)\n    return [z for _ in r]\n"
+    node = ast.parse(src_a).body[0]
+
+    copied = mod.normalized_function_body_dump(node)
+    assert node.name == "f"  # default mode leaves the caller's tree alone
+    inplace = mod.normalized_function_body_dump(node, inplace=True)
+
+    assert copied == inplace
+    assert inplace == mod.normalized_function_body_dump(ast.parse(src_b).body[0], inplace=True)
+
+
+def test_minhash_method_finds_near_duplicates_only(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "analysis" / "find_near_duplicate_functions.py"
+    mod = import_module_from_path("find_near_duplicate_functions_minhash", script)
+
+    body = "".join(f"    v{i} = x * {i} + len(str(x))\n" for i in range(12))
+    (tmp_path / "a.py").write_text(f"def f(x):\n{body}    return v1\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text(f"def g(y):\n{body.replace('x', 'y')}    return v2\n", encoding="utf-8")
+    (tmp_path / "c.py").write_text("def h(items):\n    return {k: sorted(v) for k, v in items}\n", encoding="utf-8")
+
+    funcs = mod.collect_functions(tmp_path)
+    pairs = mod.find_pairs_minhash(funcs, 0.8)
+
+    assert [(p["a"]["name"], p["b"]["name"]) for p in pairs] == [("f", "g")]
+    assert 0.8 <= pairs[0]["ratio"] <= 1.0
+
+
+def test_similarity_falls_back_to_difflib(monkeypatch) -> None:
+    script = scripts_root() / "repo" / "analysis" / "find_near_duplicate_functions.py"
+    mod = import_module_from_path("find_near_duplicate_functions_similarity", script)
+
+    monkeypatch.setattr(mod, "Indel", None)
+    assert mod.similarity("abcd", "abcd", 0.9) == 1.0
+    assert mod.similarity("abcd", "abxy", 0.9) == 0.5
+
+
+def test_simhash_prefilter_keeps_close_pairs(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "analysis" / "find_near_duplicate_functions.py"
+    mod = import_module_from_path("find_near_duplicate_functions_simhash", script)
+
+    assert mod._simhash_candidates([0b0, 0b111, (1 << 64) - 1], 3) == {(0, 1)}
+
+    body = "".join(f"    v{i} = x * {i} + len(str(x))\n" for i in range(12))
+    (tmp_path / "a.py").write_text(f"def f(x):\n{body}    return v1\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text(f"def g(y):\n{body.replace('x', 'y')}    return v1\n", encoding="utf-8")
+    (tmp_path / "c.py").write_text("def h(items):\n    return {k: sorted(v) for k, v in items}\n", encoding="utf-8")
+
+    funcs = mod.collect_functions(tmp_path)
+    pairs = mod.find_pairs_difflib(funcs, 0.8, simhash_distance=3)
+    assert [(p["a"]["name"], p["b"]["name"]) for p in pairs] == [("f", "g")]
+
+
+def test_collect_functions_cache_round_trip(tmp_path: Path, monkeypatch) -> None:
+    script = scripts_root() / "repo" / "analysis" / "find_near_duplicate_functions.py"
+    mod = import_module_from_path("find_near_duplicate_functions_cache", script)
+
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.py").write_text("def f(x):\n    return x + 1\n", encoding="utf-8")
+    (src / "b.py").write_text("async def g(y):\n    return y * 2\n", encoding="utf-8")
+
+    cache = mod.ExtractionCache(tmp_path / ".cache.sqlite", "t")
+    first = mod.collect_functions(src, cache=cache)
+    cache.close()
+
+    monkeypatch.setattr(mod, "_extract_file", lambda fp: pytest.fail(f"re-parsed {fp}"))
+    cache = mod.ExtractionCache(tmp_path / ".cache.sqlite", "t")
+    second = mod.collect_functions(src, cache=cache)
+    cache.close()
+
+    assert second == first
+
+
+def test_tokens_method_matches_renamed_copies(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "analysis" / "find_near_duplicate_functions.py"
+    mod = import_module_from_path("find_near_duplicate_functions_tokens", script)
+
+    vocab: dict[str, int] = {}
+    dump = "Name(id='VAR0', ctx=Load())"
+    assert mod.token_stream(dump, vocab) == "\x00\x01\x02"
+    assert list(vocab) == ["Name", "'VAR0'", "Load"]
+
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.py").write_text("def f(x):\n    total = x + 1\n    return total * 2\n", encoding="utf-8")
+    (src / "b.py").write_text("def g(y):\n    acc = y + 1\n    return acc * 2\n", encoding="utf-8")
+    (src / "c.py").write_text("def h(items):\n    return {k: sorted(v) for k, v in items}\n", encoding="utf-8")
+
+    pairs = mod.find_pairs_tokens(mod.collect_functions(src), 0.9)
+    assert {(p["a"]["name"], p["b"]["name"]) for p in pairs} == {("f", "g")}
+    assert "tokens" not in pairs[0]["a"]
+
+
+def test_length_window_rejects_pairs_that_cannot_reach_threshold() -> None:
+    script = scripts_root() / "repo" / "analysis" / "find_near_duplicate_functions.py"
+    mod = import_module_from_path("find_near_duplicate_functions_bound", script)
+
+    a = {"normalized_dump": "x" * 1000}
+    b = {"normalized_dump": "x" * 800}
+    # inside the length heuristic, but 2*800/1800 < 0.9 bounds any ratio
+    assert mod._within_length_window(a, b, threshold=0.8)
+    assert not mod._within_length_window(a, b, threshold=0.9)
+
+
+def test_simhash_numpy_paths_match_pure_python(monkeypatch) -> None:
+    script = scripts_root() / "repo" / "analysis" / "find_near_duplicate_functions.py"
+    mod = import_module_from_path("find_near_duplicate_functions_simhash_np", script)
+    if mod.np is None:
+        pytest.skip("numpy not installed")
+
+    dumps = [f"Assign(targets=[Name(id='VAR{i % 7}')], value=Constant(value={i // 3}))" * (1 + i % 4) for i in range(60)]
+    hashes = mod.simhash_signatures(dumps)
+    assert hashes == [mod.simhash64(d) for d in dumps]
+
+    expected = {}
+    for k in (0, 3, 12):
+        expected[k] = mod._simhash_candidates(hashes, k)
+    monkeypatch.setattr(mod, "np", None)
+    for k, pairs in expected.items():
+        assert pairs == mod._simhash_candidates(hashes, k)
+    assert expected[12]
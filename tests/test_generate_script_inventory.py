@@ -35,3 +35,28 @@ def test_generate_script_inventory_outputs_json_and_markdown(tmp_path: Path) ->
 
     payload = json.loads(json_path.read_text(encoding="utf-8"))
     assert payload["total"] == 2
+
+
+def test_generate_script_inventory_threaded_matches_serial(tmp_path: Path) -> None:
+    script = scripts_root() / "repo" / "inventory" / "generate_script_inventory.py"
+
+    src = tmp_path / "src"
+    for i in range(12):
+        sub = src / f"pkg{i % 3}"
+        sub.mkdir(parents=True, exist_ok=True)
+        (sub / f"tool_{i}.py").write_text(f'"""Tool number {i}."""\n', encoding="utf-8")
+
+    def run(jobs: str) -> list:
+        out = tmp_path / f"out_{jobs}"
+        res = subprocess.run(
+            [sys.executable, str(script), "--root", str(src), "--out", str(out), "--jobs", jobs],
+            cwd=str(script.parent),
+            capture_output=True,
+            text=True,
+        )
+        assert res.returncode == 0, res.stderr
+        return json.loads((out / "script_inventory.json").read_text(encoding="utf-8"))["entries"]
+
+    serial, threaded = run("1"), run("8")
+    assert threaded == serial
+    assert [e["path"] for e in threaded] == sorted(e["path"] for e in serial)
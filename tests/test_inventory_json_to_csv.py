@@ -4,9 +4,13 @@ import csv
 import json
 import subprocess
 import sys
+from decimal import Decimal
 from pathlib import Path
+from types import SimpleNamespace
 
-from conftest import scripts_root
+import pytest
+
+from conftest import import_module_from_path, scripts_root
 
 
 def test_inventory_json_to_csv_converts_records(tmp_path: Path) -> None:
@@ -59,3 +63,76 @@ def test_inventory_json_to_csv_returns_nonzero_when_input_missing(tmp_path: Path
     )
 
     assert res.returncode != 0
+
+
+def _streaming_shim(fail_after: int | None = None) -> SimpleNamespace:
+    """Minimal stand-in for ijson: yields ``entries`` items one at a time.
+
+    Like real ijson, non-integer numbers come back as ``Decimal`` unless
+    ``use_float=True`` is passed.
+    """
+
+    def items(fh, prefix, use_float=False):
+        assert prefix == "entries.item"
+        parse_float = float if use_float else Decimal
+        for i, entry in enumerate(json.loads(fh.read(), parse_float=parse_float)["entries"]):
+            if fail_after is not None and i == fail_after:
+                raise ValueError("parse error: premature EOF")
+            yield entry
+
+    return SimpleNamespace(items=items)
+
+
+def _run_main(mod, monkeypatch: pytest.MonkeyPatch, *argv: str) -> int:
+    monkeypatch.setattr(sys, "argv", ["inventory_json_to_csv.py", *argv])
+    return mod.main()
+
+
+def test_streaming_branch_writes_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    mod = import_module_from_path("inventory_json_to_csv", scripts_root() / "repo" / "inventory" / "inventory_json_to_csv.py")
+    monkeypatch.setattr(mod, "ijson", _streaming_shim())
+
+    input_json = tmp_path / "inventory.json"
+    input_json.write_text(
+        '{"entries": [{"path": "a.py"}, {"path": "b.py", "size_bytes": 3}, {"path": "c.py", "size_bytes": 1e20}]}',
+        encoding="utf-8",
+    )
+    output_csv = tmp_path / "out.csv"
+
+    assert _run_main(mod, monkeypatch, str(input_json), str(output_csv)) == 0
+    with output_csv.open("r", encoding="utf-8", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [(r["path"], r["size_bytes"]) for r in rows] == [("a.py", ""), ("b.py", "3"), ("c.py", "1e+20")]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["inventory.json", "out.csv"]
+
+    # The full-load path must produce byte-identical output.
+    monkeypatch.setattr(mod, "ijson", None)
+    full_csv = tmp_path / "full.csv"
+    assert _run_main(mod, monkeypatch, str(input_json), str(full_csv)) == 0
+    assert full_csv.read_bytes() == output_csv.read_bytes()
+
+
+def test_streaming_failure_leaves_no_partial_csv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    mod = import_module_from_path("inventory_json_to_csv", scripts_root() / "repo" / "inventory" / "inventory_json_to_csv.py")
+    monkeypatch.setattr(mod, "ijson", _streaming_shim(fail_after=1))
+
+    input_json = tmp_path / "inventory.json"
+    input_json.write_text(json.dumps({"entries": [{"path": "a.py"}, {"path": "b.py"}]}), encoding="utf-8")
+    output_csv = tmp_path / "out.csv"
+
+    with pytest.raises(ValueError, match="premature EOF"):
+        _run_main(mod, monkeypatch, str(input_json), str(output_csv))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["inventory.json"]
+
+
+def test_streaming_branch_still_rejects_non_object_top_level(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    mod = import_module_from_path("inventory_json_to_csv", scripts_root() / "repo" / "inventory" / "inventory_json_to_csv.py")
+    monkeypatch.setattr(mod, "ijson", _streaming_shim())
+
+    input_json = tmp_path / "inventory.json"
+    input_json.write_text(json.dumps([{"path": "a.py"}]), encoding="utf-8")
+    output_csv = tmp_path / "out.csv"
+
+    with pytest.raises(AttributeError):
+        _run_main(mod, monkeypatch, str(input_json), str(output_csv))
+    assert not output_csv.exists()
@@ -74,3 +74,96 @@ def test_cli_writes_reports(tmp_path: Path) -> None:
     payload = json.loads((out_dir / "model_eval.json").read_text(encoding="utf-8"))
     assert payload["task"] == "classification"
     assert "accuracy" in payload["metrics"]
+
+
+def test_read_single_column_csv_numeric_dtype(tmp_path: Path) -> None:
+    mod = import_module_from_path(
+        "model_eval_report_numeric",
+        scripts_root() / "ml" / "model_eval_report.py",
+    )
+
+    path = tmp_path / "y.csv"
+    path.write_text("y\n1.5\n2.0\n\n3.25\n", encoding="utf-8")
+
+    as_str = mod.read_single_column_csv(path)
+    as_arr = mod.read_single_column_csv(path, dtype=float)
+
+    assert as_str == ["1.5", "2.0", "3.25"]
+    assert as_arr.tolist() == [1.5, 2.0, 3.25]
+    assert mod.evaluate_regression(as_arr, as_arr)["mae"] == 0.0
+
+
+def test_classification_report_matches_sklearn() -> None:
+    pytest.importorskip("sklearn")
+    from sklearn.metrics import classification_report
+
+    mod = import_module_from_path(
+        "model_eval_report_cr",
+        scripts_root() / "ml" / "model_eval_report.py",
+    )
+
+    y_true = ["a", "a", "b", "b", "c", "c", "c", "d"]
+    y_pred = ["a", "b", "b", "b", "c", "a", "e", "d"]
+
+    metrics = mod.evaluate_classification(y_true, y_pred)
+    expected = classification_report(y_true, y_pred, output_dict=True, zero_division=0)
+
+    got = metrics["classification_report"]
+    assert set(got) == set(expected)
+    assert got["accuracy"] == pytest.approx(expected["accuracy"])
+    for key, row in expected.items():
+        if isinstance(row, dict):
+            for stat, value in row.items():
+                assert got[key][stat] == pytest.approx(value), (key, stat)
+
+
+def test_read_single_column_csv_header_sniffing_and_max_rows(tmp_path: Path) -> None:
+    mod = import_module_from_path(
+        "model_eval_report_stream",
+        scripts_root() / "ml" / "model_eval_report.py",
+    )
+
+    headerless = tmp_path / "headerless.csv"
+    headerless.write_text("0\n1\n1\n0\n", encoding="utf-8")
+    with_header = tmp_path / "with_header.csv"
+    with_header.write_text("label\n0\n1\n1\n0\n", encoding="utf-8")
+
+    assert mod.read_single_column_csv(headerless) == ["0", "1", "1", "0"]
+    assert mod.read_single_column_csv(with_header) == ["0", "1", "1", "0"]
+    assert mod.read_single_column_csv(with_header, max_rows=2) == ["0", "1"]
+    assert mod.read_single_column_csv(headerless, dtype=float, max_rows=3).tolist() == [0.0, 1.0, 1.0]
+
+
+def test_regression_metrics_match_sklearn() -> None:
+    pytest.importorskip("sklearn")
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+    mod = import_module_from_path(
+        "model_eval_report_reg",
+        scripts_root() / "ml" / "model_eval_report.py",
+    )
+
+    y_true = [3.0, -0.5, 2.0, 7.0]
+    y_pred = [2.5, 0.0, 2.0, 8.0]
+    metrics = mod.evaluate_regression(y_true, y_pred)
+
+    assert metrics["mae"] == pytest.approx(mean_absolute_error(y_true, y_pred))
+    assert metrics["mse"] == pytest.approx(mean_squared_error(y_true, y_pred))
+    assert metrics["r2"] == pytest.approx(r2_score(y_true, y_pred))
+    assert mod.evaluate_regression([1.0, 1.0], [1.0, 1.0])["r2"] == 1.0
+
+
+def test_read_single_column_csv_numeric_dtype_quotes_and_bad_rows(tmp_path: Path) -> None:
+    mod = import_module_from_path(
+        "model_eval_report_quoted",
+        scripts_root() / "ml" / "model_eval_report.py",
+    )
+
+    quoted = tmp_path / "quoted.csv"
+    quoted.write_text('"y"\n"1.5"\n2.0\n"3.25"\n', encoding="utf-8")
+    assert mod.read_single_column_csv(quoted, dtype=float).tolist() == [1.5, 2.0, 3.25]
+
+    bad = tmp_path / "bad.csv"
+    bad.write_text("y\n1.0\nabc\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=r"Could not parse float on row 2: 'abc'"):
+        mod.read_single_column_csv(bad, dtype=float)
@@ -6,6 +6,7 @@ import sys
 from pathlib import Path
 
 import nbformat
+import pytest
 
 from conftest import import_module_from_path, scripts_root
 
@@ -71,3 +72,137 @@ def test_cli_no_execute_writes_outputs_and_report(tmp_path: Path) -> None:
     data = json.loads(report.read_text(encoding="utf-8"))
     assert len(data) == 2
     assert data[0]["parameters"]["x"] == 1
+
+
+def test_sweep_notebook_parallel_execution_preserves_run_order(tmp_path: Path) -> None:
+    pytest.importorskip("ipykernel")
+    script_path = scripts_root() / "notebooks" / "notebook_parameter_sweep.py"
+    mod = import_module_from_path("notebook_parameter_sweep_jobs", script_path)
+
+    in_nb = tmp_path / "in.ipynb"
+    nbformat.write(_make_simple_notebook(), str(in_nb))
+
+    results = mod.sweep_notebook(
+        in_nb,
+        tmp_path / "out",
+        [{"x": 1}, {"x": 2}, {"x": 3}],
+        execute=True,
+        kernel_name="python3",
+        timeout_sec=60,
+        cwd=tmp_path,
+        allow_errors=False,
+        jobs=2,
+    )
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert all(r.ok for r in results)
+    out = nbformat.read(results[2].output_notebook, as_version=4)
+    assert out.cells[1].outputs[0]["text"] == "6\n"
+
+
+def test_no_execute_sweep_leaves_base_notebook_untouched(tmp_path: Path) -> None:
+    script_path = scripts_root() / "notebooks" / "notebook_parameter_sweep.py"
+    mod = import_module_from_path("notebook_parameter_sweep_clone", script_path)
+
+    nb = _make_simple_notebook()
+    params_cell = nbformat.v4.new_code_cell("x = 0\n")
+    params_cell.metadata["tags"] = ["parameters"]
+    nb.cells.insert(0, params_cell)
+    in_nb = tmp_path / "in.ipynb"
+    nbformat.write(nb, str(in_nb))
+
+    base = nbformat.read(str(in_nb), as_version=4)
+    clone = mod._clone_for_run(base, deep=False)
+    mod.apply_parameters_to_notebook(clone, {"x": 5})
+
+    assert "x = 5" in clone.cells[0].source
+    assert base.cells[0].source == "x = 0\n"
+    assert len(base.cells) == 2
+
+
+def test_sweep_validates_parameter_names_before_writing(tmp_path: Path) -> None:
+    script_path = scripts_root() / "notebooks" / "notebook_parameter_sweep.py"
+    mod = import_module_from_path("notebook_parameter_sweep_names", script_path)
+
+    in_nb = tmp_path / "in.ipynb"
+    nbformat.write(_make_simple_notebook(), str(in_nb))
+    outdir = tmp_path / "out"
+
+    with pytest.raises(ValueError, match="valid Python identifier"):
+        mod.sweep_notebook(
+            in_nb,
+            outdir,
+            [{"x": 1}, {"bad-name": 2}],
+            execute=False,
+            kernel_name="python3",
+            timeout_sec=60,
+            cwd=tmp_path,
+            allow_errors=False,
+        )
+    assert not list(outdir.glob("*.ipynb"))
+
+
+def test_sweep_reuse_kernel_resets_namespace_between_runs(tmp_path: Path) -> None:
+    pytest.importorskip("ipykernel")
+    script_path = scripts_root() / "notebooks" / "notebook_parameter_sweep.py"
+    mod = import_module_from_path("notebook_parameter_sweep_reuse", script_path)
+
+    nb = nbformat.v4.new_notebook()
+    nb.cells = [nbformat.v4.new_code_cell("print('leftover' in globals())\nleftover = x\n")]
+    in_nb = tmp_path / "in.ipynb"
+    nbformat.write(nb, str(in_nb))
+
+    results = mod.sweep_notebook(
+        in_nb,
+        tmp_path / "out",
+        [{"x": 1}, {"x": 2}],
+        execute=True,
+        kernel_name="python3",
+        timeout_sec=60,
+        cwd=tmp_path,
+        allow_errors=False,
+        reuse_kernel=True,
+    )
+
+    assert all(r.ok for r in results)
+    for r in results:
+        out = nbformat.read(r.output_notebook, as_version=4)
+        assert out.cells[1].outputs[0]["text"] == "False\n"
+
+
+def test_write_report_is_valid_json_and_leaves_no_temp_file(tmp_path: Path) -> None:
+    script_path = scripts_root() / "notebooks" / "notebook_parameter_sweep.py"
+    mod = import_module_from_path("notebook_parameter_sweep_report", script_path)
+
+    report = tmp_path / "sweep_report.json"
+    mod.write_report([], report)
+    assert json.loads(report.read_text(encoding="utf-8")) == []
+
+    results = [
+        mod.SweepRunResult(i, {"x": i, "big": 2**70}, f"run{i}.ipynb", True, None, 0.5)
+        for i in range(3)
+    ]
+    mod.write_report(results, report)
+    data = json.loads(report.read_text(encoding="utf-8"))
+    assert [d["index"] for d in data] == [0, 1, 2]
+    assert data[2]["parameters"] == {"x": 2, "big": 2**70}
+    assert list(tmp_path.iterdir()) == [report]
+
+
+def test_parse_kv_params_only_parses_json_looking_values() -> None:
+    script_path = scripts_root() / "notebooks" / "notebook_parameter_sweep.py"
+    mod = import_module_from_path("notebook_parameter_sweep_kv", script_path)
+
+    params = mod._parse_kv_params(
+        ["a=1", "b=hello", "c=[1, 2]", "d=true", "e=", "f=-x", "g=12345678901234567890123", "h={bad"]
+    )
+    assert params == {
+        "a": 1,
+        "b": "hello",
+        "c": [1, 2],
+        "d": True,
+        "e": "",
+        "f": "-x",
+        "g": 12345678901234567890123,
+        "h": "{bad",
+    }
@@ -6,6 +6,7 @@ import sys
 from pathlib import Path
 
 import nbformat
+import pytest
 
 from conftest import import_module_from_path, scripts_root
 
@@ -94,3 +95,191 @@ def test_cli_writes_scrubbed_notebook_and_report(tmp_path: Path) -> None:
     assert report_path.exists()
     data = json.loads(report_path.read_text(encoding="utf-8"))
     assert data["cells_total"] == 2
+
+
+def test_default_redaction_patterns_are_compiled_once() -> None:
+    script_path = scripts_root() / "notebooks" / "notebook_scrub_secrets.py"
+    mod = import_module_from_path("notebook_scrub_secrets_cached", script_path)
+
+    assert mod._default_redaction_patterns() is mod._default_redaction_patterns()
+
+
+def test_fused_patterns_match_sequential_redaction() -> None:
+    script_path = scripts_root() / "notebooks" / "notebook_scrub_secrets.py"
+    mod = import_module_from_path("notebook_scrub_secrets_fused", script_path)
+
+    patterns = mod._default_redaction_patterns()
+    fused = mod._fuse_patterns(patterns)
+    assert len(fused) == 1
+
+    aws_like = "A" + "K" + "I" + "A" + "ABCDEFGHIJKLMNOP"
+    slack_like = "x" + "o" + "x" + "b-1234567890-abcdef"
+    text = f"key={aws_like}\nslack: {slack_like}\nnothing here\n"
+    assert mod._redact_string(text, fused) == mod._redact_string(text, patterns)
+    assert mod._redact_string(text, fused)[1] == 2
+
+
+def test_prefilter_skips_text_without_secret_prefixes() -> None:
+    script_path = scripts_root() / "notebooks" / "notebook_scrub_secrets.py"
+    mod = import_module_from_path("notebook_scrub_secrets_prefilter", script_path)
+
+    patterns = mod._default_redaction_patterns()
+    prefixes = mod._default_redaction_prefixes()
+    clean = "import numpy as np\nprint(np.arange(3))\n"
+    assert mod._redact_string(clean, patterns, prefixes) == (clean, 0)
+
+    github_like = "g" + "h" + "p" + "_" + "THISISNOTAREALGITHUBTOKEN0000"
+    assert mod._redact_string(f"t = '{github_like}'", patterns, prefixes) == ("t = '[REDACTED]'", 1)
+
+
+def test_keep_outputs_redacts_nested_output_payloads_in_place() -> None:
+    script_path = scripts_root() / "notebooks" / "notebook_scrub_secrets.py"
+    mod = import_module_from_path("notebook_scrub_secrets_outputs", script_path)
+
+    nb = _make_notebook_with_secrets()
+    output = nb.cells[1].outputs[0]
+    github_like = "g" + "h" + "p" + "_" + "THISISNOTAREALGITHUBTOKEN0000"
+    nb.cells[1].outputs.append(
+        nbformat.v4.new_output(
+            "display_data",
+            data={"text/plain": ["line 1\n", github_like], "text/html": "<b>ok</b>"},
+        )
+    )
+
+    nb2, report = mod.scrub_notebook_node(nb, clear_outputs=False)
+    assert nb2.cells[1].outputs[0] is output
+    assert output["text"] == "[REDACTED]\n"
+    assert nb2.cells[1].outputs[1]["data"]["text/plain"] == ["line 1\n", "[REDACTED]"]
+    assert nb2.cells[1].outputs[1]["data"]["text/html"] == "<b>ok</b>"
+    # markdown (2) + code source, stream output and display_data (1 each)
+    assert report.replacements_total == 5
+
+
+def test_scrub_file_output_matches_nbformat_writer(tmp_path: Path) -> None:
+    script_path = scripts_root() / "notebooks" / "notebook_scrub_secrets.py"
+    mod = import_module_from_path("notebook_scrub_secrets_io", script_path)
+
+    in_path = tmp_path / "in.ipynb"
+    out_path = tmp_path / "out.ipynb"
+    nbformat.write(_make_notebook_with_secrets(), str(in_path))
+
+    report = mod.scrub_notebook_file(
+        in_path,
+        out_path,
+        inplace=False,
+        backup=False,
+        clear_outputs=True,
+        strip_execution_counts=True,
+        remove_attachments=True,
+        redact=True,
+        strip_all_metadata=False,
+    )
+
+    # Multi-line sources are stored as line lists on disk; the PEM block spans
+    # several of them and must still be redacted as a whole.
+    assert report.replacements_total == 3
+    expected = nbformat.read(str(out_path), as_version=4)
+    assert out_path.read_text(encoding="utf-8") == nbformat.writes(expected) + "\n"
+    assert "PRIVATE KEY" not in out_path.read_text(encoding="utf-8")
+
+
+def test_cli_scrubs_directory_of_notebooks_in_parallel(tmp_path: Path) -> None:
+    script = scripts_root() / "notebooks" / "notebook_scrub_secrets.py"
+
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    for rel in ("a.ipynb", "sub/b.ipynb", "sub/c.ipynb"):
+        nbformat.write(_make_notebook_with_secrets(), str(src / rel))
+    outdir = tmp_path / "out"
+    combined = tmp_path / "all_reports.json"
+
+    res = subprocess.run(
+        [sys.executable, str(script), str(src), "--out", str(outdir), "--report", str(combined), "--jobs", "2"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+
+    assert res.returncode == 0, res.stderr
+    assert sorted(p.relative_to(outdir).as_posix() for p in outdir.rglob("*.ipynb")) == [
+        "a.ipynb",
+        "sub/b.ipynb",
+        "sub/c.ipynb",
+    ]
+    assert (outdir / "sub" / "b.scrub_report.json").exists()
+    data = json.loads(combined.read_text(encoding="utf-8"))
+    assert [Path(d["input_path"]).name for d in data] == ["a.ipynb", "b.ipynb", "c.ipynb"]
+    assert all(d["replacements_total"] == 3 for d in data)
+
+
+def test_fused_patterns_use_re2_when_available() -> None:
+    pytest.importorskip("re2")
+    script_path = scripts_root() / "notebooks" / "notebook_scrub_secrets.py"
+    mod = import_module_from_path("notebook_scrub_secrets_re2", script_path)
+
+    ((_name, rx),) = mod._fuse_patterns(mod._default_redaction_patterns())
+    assert type(rx).__module__.startswith("re2")
+
+    pem = "-----BEGIN " + "PRIVATE KEY-----\nabc\n" + "-----END " + "PRIVATE KEY-----"
+    assert mod._redact_string("x " + pem + " y", ((_name, rx),)) == ("x [REDACTED] y", 1)
+
+
+def test_fused_patterns_stay_ascii_and_keep_unicode_custom_patterns(monkeypatch: pytest.MonkeyPatch) -> None:
+    import re
+
+    script_path = scripts_root() / "notebooks" / "notebook_scrub_secrets.py"
+    mod = import_module_from_path("notebook_scrub_secrets_ascii", script_path)
+    monkeypatch.setattr(mod, "re2", None)
+
+    ((_name, rx),) = mod._fuse_patterns(mod._default_redaction_patterns())
+    assert rx.flags & re.ASCII
+
+    custom = (("word", re.compile(r"\bsecret\w+")), ("num", re.compile(r"\d{6}")))
+    ((_name, rx_custom),) = mod._fuse_patterns(custom)
+    assert not rx_custom.flags & re.ASCII
+    assert mod._redact_string("secretÄÖ 123456", ((_name, rx_custom),)) == ("[REDACTED] [REDACTED]", 2)
+
+
+def test_cli_rejects_malformed_cell_metadata_cleanly(tmp_path: Path) -> None:
+    script = scripts_root() / "notebooks" / "notebook_scrub_secrets.py"
+
+    in_nb = tmp_path / "bad.ipynb"
+    in_nb.write_text(
+        json.dumps(
+            {
+                "nbformat": 4,
+                "nbformat_minor": 5,
+                "metadata": {},
+                "cells": [{"cell_type": "markdown", "id": "a", "metadata": "oops", "source": "x"}],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    res = subprocess.run(
+        [sys.executable, str(script), str(in_nb), "--out", str(tmp_path / "out.ipynb")],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+
+    assert res.returncode == 2
+    assert "cell 0 'metadata' must be an object" in res.stderr
+    assert "Traceback" not in res.stderr
+    assert not (tmp_path / "out.ipynb").exists()
+
+
+def test_attachments_are_removed_from_any_cell_type() -> None:
+    mod = import_module_from_path(
+        "notebook_scrub_secrets", scripts_root() / "notebooks" / "notebook_scrub_secrets.py"
+    )
+
+    nb = nbformat.v4.new_notebook()
+    code = nbformat.v4.new_code_cell("x = 1")
+    code["attachments"] = {"a.png": {"image/png": "AAAA"}}
+    nb.cells = [code]
+
+    scrubbed, report = mod.scrub_notebook_node(nb)
+
+    assert scrubbed.cells[0]["attachments"] == {}
+    assert report.attachments_removed_cells == 1
@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from conftest import scripts_root
+from conftest import import_module_from_path, scripts_root
 
 
 def _ensure_plot_deps() -> None:
@@ -47,3 +47,36 @@ def test_cli_writes_score_distribution_png(tmp_path: Path) -> None:
     assert res.returncode == 0, res.stderr
     assert out_png.exists()
     assert out_png.stat().st_size > 0
+
+
+def test_read_scores_loads_only_score_column(tmp_path: Path) -> None:
+    _ensure_plot_deps()
+
+    mod = import_module_from_path(
+        "plot_score_distribution_read", scripts_root() / "plots" / "plot_score_distribution.py"
+    )
+    in_csv = tmp_path / "scores.csv"
+    in_csv.write_text("id,score_raw,label\na,0.5,x\nb,-1.25,y\n", encoding="utf-8")
+
+    df = mod.read_scores(in_csv)
+    assert list(df.columns) == ["score_raw"]
+    assert df["score_raw"].tolist() == [0.5, -1.25]
+
+    (tmp_path / "other.csv").write_text("id,value\na,1\n", encoding="utf-8")
+    assert mod.read_scores(tmp_path / "other.csv") is None
+
+
+def test_histogram_with_smooth_caps_bins_and_preserves_counts() -> None:
+    _ensure_plot_deps()
+    import numpy as np
+
+    mod = import_module_from_path(
+        "plot_score_distribution_hist", scripts_root() / "plots" / "plot_score_distribution.py"
+    )
+    scores = np.random.default_rng(0).normal(size=100_000)
+    scores[:3] = np.nan
+
+    counts, edges, smoothed = mod.histogram_with_smooth(scores)
+    assert len(counts) == len(edges) - 1 <= mod.MAX_BINS
+    assert counts.sum() == 100_000 - 3
+    assert smoothed.shape == counts.shape
@@ -47,3 +47,22 @@ def test_cli_writes_threshold_impact_png(tmp_path: Path) -> None:
     assert res.returncode == 0, res.stderr
     assert out_png.exists()
     assert out_png.stat().st_size > 0
+
+
+def test_missing_column_is_reported_without_importing_plot_stack(tmp_path: Path) -> None:
+    script = scripts_root() / "plots" / "plot_threshold_impact.py"
+    in_csv = tmp_path / "scores.csv"
+    in_csv.write_text("other\n1\n", encoding="utf-8")
+
+    code = (
+        "import importlib.util, sys\n"
+        f"spec = importlib.util.spec_from_file_location('m', {str(script)!r})\n"
+        "mod = importlib.util.module_from_spec(spec); spec.loader.exec_module(mod)\n"
+        f"rc = mod.visualize_threshold(__import__('pathlib').Path({str(in_csv)!r}), 0.1, "
+        f"__import__('pathlib').Path({str(tmp_path / 'o.png')!r}))\n"
+        "print(rc, sorted(m for m in ('pandas', 'seaborn', 'matplotlib') if m in sys.modules))\n"
+    )
+    res = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert res.returncode == 0, res.stderr
+    assert res.stdout.strip().splitlines()[-1] == "2 []"
@@ -4,7 +4,9 @@ import subprocess
 import sys
 from pathlib import Path
 
-from conftest import scripts_root
+import pytest
+
+from conftest import import_module_from_path, scripts_root
 
 
 def test_cli_writes_png(tmp_path: Path) -> None:
@@ -43,3 +45,69 @@ def test_cli_writes_png(tmp_path: Path) -> None:
     assert res.returncode == 0, res.stderr
     assert out_png.exists()
     assert out_png.stat().st_size > 0
+
+
+@pytest.mark.parametrize(
+    "body, kind",
+    [
+        ("2025-01-01,1\n2025-01-02,\n2025-01-03,3\n", "datetime"),
+        ("2025-01-01,1\n01/02/2025,2\n", "datetime"),
+        ("1.5,1\n,2\nabc,3\n", "number"),
+        ("2025-01-01,1\n,2\n", "index"),
+        ("2019,1\n2020,2\n", "number"),
+        ("2019-03,1\n2019-04,2\n", "index"),
+        ("2025-01-01T05:06:07Z,1\n2025-01-02T05:06:07Z,2\n", "datetime"),
+    ],
+)
+def test_pandas_parsing_matches_per_value_parsing(tmp_path: Path, body: str, kind: str) -> None:
+    pytest.importorskip("pandas")
+    mod = import_module_from_path(
+        "plot_timeseries_from_csv_parse", scripts_root() / "plots" / "plot_timeseries_from_csv.py"
+    )
+    in_csv = tmp_path / "in.csv"
+    in_csv.write_text("x,y\n" + body, encoding="utf-8")
+    opts = dict(x_col="x", y_cols=["y"], encoding="utf-8", delimiter=",")
+
+    x_pd, kind_pd, series_pd = mod._read_series_pandas(in_csv, **opts)
+    x_csv, kind_csv, series_csv = mod._read_series_csv(in_csv, **opts)
+
+    assert kind_pd == kind_csv == kind
+    assert [None if v != v else v for v in series_pd["y"].tolist()] == series_csv["y"]
+    assert [None if v != v else v for v in x_pd.tolist()] == x_csv
+
+
+def test_try_datetime_remembers_last_matching_format() -> None:
+    mod = import_module_from_path(
+        "plot_timeseries_from_csv_dt", scripts_root() / "plots" / "plot_timeseries_from_csv.py"
+    )
+
+    assert mod._try_datetime("01/02/2025").month == 1
+    assert mod._last_dt_format == "%m/%d/%Y"
+    assert mod._try_datetime("2025-03-04T05:06:07Z").hour == 5
+    assert mod._try_datetime("2025/12/31").day == 31
+    assert mod._last_dt_format == "%Y/%m/%d"
+    assert mod._try_datetime("not a date") is None
+
+
+def test_main_infers_y_columns_and_parses_csv_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("matplotlib")
+    mod = import_module_from_path(
+        "plot_timeseries_from_csv_main", scripts_root() / "plots" / "plot_timeseries_from_csv.py"
+    )
+    in_csv = tmp_path / "in.csv"
+    in_csv.write_text("t,a,label,b\n1,2,x,3\n2,3,y,4\n", encoding="utf-8")
+
+    calls = []
+    real_read_csv = pd.read_csv
+    monkeypatch.setattr(pd, "read_csv", lambda *a, **k: calls.append(a) or real_read_csv(*a, **k))
+    seen = {}
+    real_plot = mod.plot_timeseries_from_csv
+    monkeypatch.setattr(
+        mod, "plot_timeseries_from_csv", lambda *a, **k: seen.update(k) or real_plot(*a, **k)
+    )
+
+    assert mod.main([str(in_csv), "--out", str(tmp_path / "out.png")]) == 0
+    assert seen["y_cols"] == ["a", "b"]
+    assert len(calls) == 1
+    assert (tmp_path / "out.png").exists()
@@ -6,7 +6,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from conftest import scripts_root
+from conftest import import_module_from_path, scripts_root
 
 
 def test_report_runtime_parameters_dry_run(tmp_path: Path) -> None:
@@ -41,3 +41,24 @@ def test_report_runtime_parameters_dry_run(tmp_path: Path) -> None:
     payload = json.loads(res.stdout)
     assert payload["env"]["BATCH_B_SAMPLE_ENV"] is True
     assert payload["files"][0]["exists"] is True
+
+
+def test_path_safety_flags_paths_resolving_outside_root(tmp_path: Path, capsys) -> None:
+    script = scripts_root() / "repo" / "audit" / "report_runtime_parameters.py"
+    mod = import_module_from_path("report_runtime_parameters", script)
+
+    root = tmp_path / "runtime"
+    (root / "health").mkdir(parents=True)
+    (tmp_path / "outside.txt").write_text("x", encoding="utf-8")
+    (root / "link.txt").symlink_to(tmp_path / "outside.txt")
+
+    def within(*rels: str) -> bool:
+        argv = ["--runtime-root", str(root), "--dry-run"]
+        for rel in rels:
+            argv += ["--check-path", rel]
+        assert mod.main(argv) == 0
+        return json.loads(capsys.readouterr().out)["path_safety"]["all_checks_within_runtime_root"]
+
+    assert within("health", "health/../health/missing.txt", ".") is True
+    assert within("health", "../outside.txt") is False
+    assert within("link.txt") is False
@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from conftest import scripts_root
+from conftest import import_module_from_path, scripts_root
 
 
 pytestmark = pytest.mark.skipif(importlib.util.find_spec("sklearn") is None, reason="scikit-learn not installed")
@@ -24,3 +24,26 @@ def test_run_ml_pipeline_demo_creates_scores(tmp_path: Path) -> None:
     )
     assert res.returncode == 0, res.stderr
     assert (out / "scores" / "scores.csv").exists()
+
+
+def test_run_ml_pipeline_demo_isolated_mode(tmp_path: Path) -> None:
+    script = scripts_root() / "ml" / "run_ml_pipeline_demo.py"
+    out = tmp_path / "demo"
+    res = subprocess.run(
+        [sys.executable, str(script), "--out-dir", str(out), "--normal", "8", "--anomaly", "3", "--isolated"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+    assert res.returncode == 0, res.stderr
+    assert (out / "scores" / "scores.csv").exists()
+
+
+@pytest.mark.parametrize("code, expected", [("None", 0), ("3", 3), ("'missing dependency'", 1)])
+def test_run_stage_maps_system_exit_like_isolated_run(tmp_path: Path, code: str, expected: int) -> None:
+    mod = import_module_from_path("run_ml_pipeline_demo_stage", scripts_root() / "ml" / "run_ml_pipeline_demo.py")
+    stage = tmp_path / f"stage_exit_{expected}.py"
+    stage.write_text(f"raise SystemExit({code})\n", encoding="utf-8")
+
+    assert mod._run_stage(stage, [], cwd=tmp_path, isolated=False) == expected
+    assert mod._run_stage(stage, [], cwd=tmp_path, isolated=True) == expected
@@ -38,3 +38,34 @@ def test_score_unsupervised_model_outputs_csv(tmp_path: Path) -> None:
     r3 = subprocess.run([sys.executable, str(score), "--dataset", str(ds_dir / "dataset_manifest.json"), "--model", str(model_dir / "train_manifest.json"), "--out-file", str(out_csv)], cwd=str(tmp_path), capture_output=True, text=True)
     assert r3.returncode == 0, r3.stderr
     assert out_csv.exists()
+
+
+def test_score_in_chunks_matches_single_call() -> None:
+    import numpy as np
+    from sklearn.ensemble import IsolationForest
+
+    from conftest import import_module_from_path
+
+    mod = import_module_from_path("score_unsupervised_model", scripts_root() / "ml" / "score_unsupervised_model.py")
+
+    x = np.random.default_rng(0).random((50, 3)).astype(np.float32)
+    model = IsolationForest(n_estimators=10, random_state=0).fit(x)
+
+    chunked = mod.score_in_chunks(model, x, chunk_size=7)
+    assert np.allclose(chunked, model.decision_function(x))
+
+
+def test_score_in_chunks_parallel_matches_sequential() -> None:
+    import numpy as np
+    from sklearn.ensemble import IsolationForest
+
+    from conftest import import_module_from_path
+
+    mod = import_module_from_path("score_unsupervised_model", scripts_root() / "ml" / "score_unsupervised_model.py")
+
+    x = np.random.default_rng(1).random((64, 4)).astype(np.float32)
+    model = IsolationForest(n_estimators=10, random_state=0).fit(x)
+
+    sequential = mod.score_in_chunks(model, x, chunk_size=10, n_jobs=1)
+    parallel = mod.score_in_chunks(model, x, chunk_size=10, n_jobs=2)
+    assert np.array_equal(sequential, parallel)
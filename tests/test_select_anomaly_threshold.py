@@ -48,3 +48,25 @@ def test_cli_writes_threshold_report_and_json(tmp_path: Path) -> None:
     payload = json.loads(json_path.read_text(encoding="utf-8"))
     assert payload["n_samples"] == 4
     assert 0.0 <= payload["actual_fpr"] <= 1.0
+
+
+def test_threshold_is_nearest_rank_order_statistic(tmp_path: Path) -> None:
+    script = scripts_root() / "ml" / "select_anomaly_threshold.py"
+
+    scores_csv = tmp_path / "scores.csv"
+    out_report = tmp_path / "threshold_report.md"
+    rows = "".join(f"r{i},{v}\n" for i, v in enumerate([0.9, 0.3, 0.7, 0.1, 0.5]))
+    scores_csv.write_text("record_id,score_raw\n" + rows, encoding="utf-8")
+
+    res = subprocess.run(
+        [sys.executable, str(script), "--scores", str(scores_csv), "--target-fpr", "0.25", "--out-report", str(out_report)],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+
+    assert res.returncode == 0, res.stderr
+    payload = json.loads(out_report.with_suffix(".json").read_text(encoding="utf-8"))
+    # k = round(0.25 * (5 - 1)) = 1 -> second-smallest score.
+    assert payload["threshold"] == 0.3
+    assert payload["actual_fpr"] == 0.2
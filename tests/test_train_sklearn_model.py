@@ -42,3 +42,43 @@ def test_train_sklearn_model_unsupervised(tmp_path: Path) -> None:
     assert res.returncode == 0, res.stderr
     assert (out / "model.joblib").exists()
     assert (out / "train_manifest.json").exists()
+
+
+def test_train_sklearn_model_supervised(tmp_path: Path) -> None:
+    script = scripts_root() / "ml" / "train_sklearn_model.py"
+    dataset_manifest = _make_dataset(tmp_path)
+    out = tmp_path / "model"
+    res = subprocess.run(
+        [sys.executable, str(script), "--dataset", str(dataset_manifest), "--out-dir", str(out), "--model-type", "supervised"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+    assert res.returncode == 0, res.stdout + res.stderr
+    assert (out / "model.joblib").exists()
+    assert (out / "metrics.json").exists()
+
+
+def test_train_sklearn_model_supervised_hgb(tmp_path: Path) -> None:
+    script = scripts_root() / "ml" / "train_sklearn_model.py"
+    dataset_manifest = _make_dataset(tmp_path)
+    out = tmp_path / "model"
+    res = subprocess.run(
+        [
+            sys.executable,
+            str(script),
+            "--dataset",
+            str(dataset_manifest),
+            "--out-dir",
+            str(out),
+            "--model-type",
+            "supervised",
+            "--classifier",
+            "hgb",
+        ],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+    assert res.returncode == 0, res.stdout + res.stderr
+    assert (out / "model.joblib").exists()
@@ -6,6 +6,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 from conftest import import_module_from_path, scripts_root
 
 
@@ -87,3 +89,147 @@ def test_cli_writes_train_test_and_indices(tmp_path: Path) -> None:
 
     # Ensure indices are disjoint
     assert set(payload["train_indices"]).isdisjoint(set(payload["test_indices"]))
+
+
+def test_cli_arrow_engine_matches_csv_engine(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    script = scripts_root() / "ml" / "train_test_split_cli.py"
+
+    in_csv = tmp_path / "in.csv"
+    lines = ["id,label,note"]
+    for i in range(20):
+        lines.append(f"{i:03d},{'A' if i % 3 else 'B'},\"n, {i}\"")
+    in_csv.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    outputs = {}
+    for engine in ("csv", "arrow"):
+        out_dir = tmp_path / engine
+        res = subprocess.run(
+            [sys.executable, str(script), str(in_csv), "--out", str(out_dir), "--stratify-col", "label", "--engine", engine],
+            cwd=str(tmp_path),
+            capture_output=True,
+            text=True,
+        )
+        assert res.returncode == 0, res.stderr
+        outputs[engine] = (_read_csv_rows(out_dir / "train.csv"), _read_csv_rows(out_dir / "test.csv"))
+
+    assert outputs["csv"] == outputs["arrow"]
+    assert outputs["arrow"][0][0]["id"].startswith("0")
+
+
+def test_split_indices_unstratified_is_deterministic_partition() -> None:
+    mod = import_module_from_path(
+        "train_test_split_cli_unstratified",
+        scripts_root() / "ml" / "train_test_split_cli.py",
+    )
+
+    r1 = mod.split_indices(100, test_size=0.25, seed=7)
+    r2 = mod.split_indices(100, test_size=0.25, seed=7)
+
+    assert r1 == r2
+    assert len(r1.test_indices) == 25
+    assert sorted(r1.train_indices + r1.test_indices) == list(range(100))
+
+
+def test_cli_stream_mode_matches_in_memory_split(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    script = scripts_root() / "ml" / "train_test_split_cli.py"
+
+    in_csv = tmp_path / "in.csv"
+    lines = ["id,label"]
+    for i in range(50):
+        lines.append(f"{i},{'A' if i % 4 else 'B'}")
+    in_csv.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    payloads = {}
+    for mode in ("memory", "stream"):
+        out_dir = tmp_path / mode
+        cmd = [sys.executable, str(script), str(in_csv), "--out", str(out_dir), "--stratify-col", "label", "--write-indices"]
+        if mode == "stream":
+            cmd.append("--stream")
+        res = subprocess.run(cmd, cwd=str(tmp_path), capture_output=True, text=True)
+        assert res.returncode == 0, res.stderr
+        payloads[mode] = json.loads((out_dir / "split_indices.json").read_text(encoding="utf-8"))
+        test_rows = _read_csv_rows(out_dir / "test.csv")
+        assert [int(r["id"]) for r in test_rows] == payloads[mode]["test_indices"]
+
+    assert payloads["memory"]["test_indices"] == payloads["stream"]["test_indices"]
+
+
+def test_cli_csv_engine_pads_short_rows_and_skips_blank_lines(tmp_path: Path) -> None:
+    script = scripts_root() / "ml" / "train_test_split_cli.py"
+
+    in_csv = tmp_path / "in.csv"
+    in_csv.write_text("a,b,c\n1,2,3\n\n4,5\n6,7,8,9\n", encoding="utf-8")
+    out_dir = tmp_path / "out"
+
+    res = subprocess.run(
+        [sys.executable, str(script), str(in_csv), "--out", str(out_dir), "--test-size", "0", "--engine", "csv"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+    assert res.returncode == 0, res.stderr
+
+    rows = _read_csv_rows(out_dir / "train.csv")
+    assert rows == [
+        {"a": "1", "b": "2", "c": "3"},
+        {"a": "4", "b": "5", "c": ""},
+        {"a": "6", "b": "7", "c": "8"},
+    ]
+
+
+def test_cli_default_and_auto_engines_accept_ragged_rows(tmp_path: Path) -> None:
+    script = scripts_root() / "ml" / "train_test_split_cli.py"
+
+    in_csv = tmp_path / "in.csv"
+    in_csv.write_text("id,label,x\n1,a,p\n2,b\n3,a,q\n", encoding="utf-8")
+
+    outputs = {}
+    for engine in (None, "csv", "auto"):
+        out_dir = tmp_path / str(engine)
+        cmd = [sys.executable, str(script), str(in_csv), "--out", str(out_dir), "--test-size", "0"]
+        if engine:
+            cmd += ["--engine", engine]
+        res = subprocess.run(cmd, cwd=str(tmp_path), capture_output=True, text=True)
+        assert res.returncode == 0, res.stderr
+        outputs[engine] = (out_dir / "train.csv").read_bytes()
+
+    # The default output is the stdlib csv writer's, whatever is installed.
+    assert outputs[None] == outputs["csv"] == outputs["auto"]
+    assert outputs[None] == b"id,label,x\r\n1,a,p\r\n2,b,\r\n3,a,q\r\n"
+
+
+def test_split_indices_bernoulli_is_deterministic_and_approximate() -> None:
+    mod = import_module_from_path(
+        "train_test_split_cli_bernoulli",
+        scripts_root() / "ml" / "train_test_split_cli.py",
+    )
+
+    labels = ["A"] * 700 + ["B"] * 300
+    r1 = mod.split_indices(1000, test_size=0.2, seed=5, stratify=labels, sampling="bernoulli")
+    r2 = mod.split_indices(1000, test_size=0.2, seed=5, stratify=labels, sampling="bernoulli")
+
+    assert r1 == r2
+    assert sorted(r1.train_indices + r1.test_indices) == list(range(1000))
+    assert 150 <= len(r1.test_indices) <= 250
+
+
+def test_cli_stream_bernoulli_matches_in_memory(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    script = scripts_root() / "ml" / "train_test_split_cli.py"
+
+    in_csv = tmp_path / "in.csv"
+    in_csv.write_text("id\n" + "".join(f"{i}\n" for i in range(200)), encoding="utf-8")
+
+    payloads = {}
+    for mode in ("memory", "stream"):
+        out_dir = tmp_path / mode
+        cmd = [sys.executable, str(script), str(in_csv), "--out", str(out_dir), "--sampling", "bernoulli", "--write-indices"]
+        if mode == "stream":
+            cmd.append("--stream")
+        res = subprocess.run(cmd, cwd=str(tmp_path), capture_output=True, text=True)
+        assert res.returncode == 0, res.stderr
+        payloads[mode] = json.loads((out_dir / "split_indices.json").read_text(encoding="utf-8"))
+
+    assert payloads["memory"]["test_indices"] == payloads["stream"]["test_indices"]